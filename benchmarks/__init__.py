@@ -0,0 +1,6 @@
+"""Benchmarks de rendimiento de la agenda.
+
+Cada módulo se ejecuta desde la raíz del proyecto con `python -m benchmarks.<modulo>`
+y trabaja sobre bases de datos temporales, sin tocar 'agenda.db'.
+`python -m benchmarks` ejecuta la suite completa (`benchmarks.suite`).
+"""
@@ -0,0 +1,7 @@
+"""Punto de entrada de `python -m benchmarks`: ejecuta la suite completa (ver `benchmarks.suite`)."""
+import sys
+
+from benchmarks.suite import main
+
+
+sys.exit(main())
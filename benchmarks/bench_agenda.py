@@ -0,0 +1,69 @@
+"""Benchmark de la Agenda en memoria: índices frente al recorrido lineal anterior.
+
+Uso:
+    python -m benchmarks.bench_agenda [--tamanos 10000 100000 1000000]
+"""
+import argparse
+import time
+
+from models.agenda import Agenda
+from models.contacto import Contacto
+from benchmarks.datos import generar_contactos
+
+
+def buscar_exacta_lineal(contactos, nombre):
+    """Implementación anterior de `Agenda.buscar_exacta` (recorrido completo)."""
+    nombre = nombre.lower()
+    return [c for c in contactos
+            if hasattr(c, "nombre") and isinstance(c.nombre, str) and c.nombre.lower() == nombre]
+
+
+def buscar_parcial_lineal(contactos, texto):
+    """Implementación anterior de `Agenda.buscar_parcial` (recorrido completo)."""
+    texto = texto.lower()
+    return [c for c in contactos if texto in c.nombre.lower()]
+
+
+CONSULTAS_EXACTAS = ["Ana Peña", "sofía núñez", "Nadie Existe"]
+CONSULTAS_PARCIALES = ["tiago gut", "peña", "xyz", "an"]
+
+
+def _medir(funcion, repeticiones=3):
+    """Mediana en milisegundos de `repeticiones` llamadas."""
+    tiempos = []
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        funcion()
+        tiempos.append((time.perf_counter() - inicio) * 1000)
+    tiempos.sort()
+    return tiempos[len(tiempos) // 2]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tamanos", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    args = parser.parse_args()
+
+    for n in args.tamanos:
+        contactos = [Contacto(nombre, telefono, email, i)
+                     for i, (nombre, telefono, email) in enumerate(generar_contactos(n), start=1)]
+        agenda = Agenda()
+        inicio = time.perf_counter()
+        agenda.cargar_contactos(contactos)
+        carga = (time.perf_counter() - inicio) * 1000
+        print(f"\n{n} contactos (construcción de índices: {carga:.0f} ms)")
+        print(f"{'búsqueda':>22} | {'resultados':>10} | {'lineal (ms)':>11} | {'índice (ms)':>11}")
+        for consulta in CONSULTAS_EXACTAS:
+            lineal = _medir(lambda: buscar_exacta_lineal(contactos, consulta))
+            indice = _medir(lambda: agenda.buscar_exacta(consulta))
+            total = len(agenda.buscar_exacta(consulta))
+            print(f"{'exacta ' + consulta:>22} | {total:>10} | {lineal:>11.3f} | {indice:>11.3f}")
+        for consulta in CONSULTAS_PARCIALES:
+            lineal = _medir(lambda: buscar_parcial_lineal(contactos, consulta))
+            indice = _medir(lambda: agenda.buscar_parcial(consulta))
+            total = len(agenda.buscar_parcial(consulta))
+            print(f"{'parcial ' + consulta:>22} | {total:>10} | {lineal:>11.3f} | {indice:>11.3f}")
+
+
+if __name__ == "__main__":
+    main()
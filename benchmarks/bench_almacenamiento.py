@@ -0,0 +1,73 @@
+"""Benchmark de escritura según la configuración de almacenamiento de SQLite.
+
+Mide, para varias combinaciones de journal_mode y synchronous:
+- commits/s con `insertar_contacto` (una transacción por contacto, el caso del GUI),
+- filas/s con inserciones por lotes en una sola transacción (el caso de importación).
+
+Uso:
+    python -m benchmarks.bench_almacenamiento [--commits 2000] [--lote 100000] [--carpeta DIR]
+
+Conviene indicar con `--carpeta` un directorio en el disco real: en un sistema de
+archivos en memoria (tmpfs) el coste de fsync desaparece y las diferencias se diluyen.
+"""
+import argparse
+import os
+import tempfile
+import time
+
+from database import agenda_database as db
+from database.conexion import cerrar_conexiones
+from database.configuracion import ConfiguracionAlmacenamiento, establecer_configuracion
+from benchmarks.datos import generar_contactos
+
+
+ESCENARIOS = [
+    ("DELETE / FULL (por defecto de SQLite)", dict(journal_mode="DELETE", synchronous="FULL")),
+    ("WAL / FULL", dict(journal_mode="WAL", synchronous="FULL")),
+    ("WAL / NORMAL (por defecto de la agenda)", dict(journal_mode="WAL", synchronous="NORMAL")),
+    ("WAL / OFF (sin garantías ante cortes)", dict(journal_mode="WAL", synchronous="OFF")),
+]
+
+
+def _medir_escenario(carpeta, opciones, commits, lote):
+    """Devuelve (commits/s, filas/s) para una configuración sobre una base nueva."""
+    ruta = os.path.join(carpeta, f"bench_{time.monotonic_ns()}.db")
+    ruta_original = db.DB_PATH
+    db.DB_PATH = ruta
+    establecer_configuracion(ruta, ConfiguracionAlmacenamiento(**opciones))
+    try:
+        db.crear_tabla()
+        filas = list(generar_contactos(max(commits, lote)))
+
+        inicio = time.perf_counter()
+        for nombre, telefono, email in filas[:commits]:
+            db.insertar_contacto(nombre, telefono, email)
+        por_commit = commits / (time.perf_counter() - inicio)
+
+        inicio = time.perf_counter()
+        with db._conexion().transaccion() as conn:
+            conn.executemany(db.SQL_INSERTAR, [db._valores_contacto(*fila) for fila in filas[:lote]])
+        por_lote = lote / (time.perf_counter() - inicio)
+        return por_commit, por_lote
+    finally:
+        cerrar_conexiones()
+        establecer_configuracion(ruta, None)
+        db.DB_PATH = ruta_original
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--commits", type=int, default=2000)
+    parser.add_argument("--lote", type=int, default=100_000)
+    parser.add_argument("--carpeta", default=None)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(dir=args.carpeta) as carpeta:
+        print(f"{'configuración':>40} | {'commits/s':>10} | {'filas/s (lote)':>14}")
+        for nombre, opciones in ESCENARIOS:
+            por_commit, por_lote = _medir_escenario(carpeta, opciones, args.commits, args.lote)
+            print(f"{nombre:>40} | {por_commit:>10,.0f} | {por_lote:>14,.0f}")
+
+
+if __name__ == "__main__":
+    main()
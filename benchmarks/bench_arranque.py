@@ -0,0 +1,65 @@
+"""Benchmark del coste de arranque de `crear_tabla()` según el número de contactos.
+
+Compara la migración antigua (copia completa de la tabla en cada arranque) con el
+motor de migraciones versionadas. Con el esquema al día, el arranque en caliente
+debe mantenerse plano entre 1k y 1M de filas.
+
+Uso:
+    python -m benchmarks.bench_arranque [--tamanos 1000 10000 100000 1000000]
+"""
+import argparse
+import sqlite3
+import time
+
+from database import agenda_database as db
+from benchmarks.datos import base_temporal
+
+
+def _crear_tabla_copia_completa(ruta):
+    """Reproduce la migración original: copia toda la tabla en cada arranque."""
+    conn = sqlite3.connect(ruta)
+    cursor = conn.cursor()
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS contactos_new (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            nombre TEXT NOT NULL,
+            telefono TEXT NOT NULL,
+            email TEXT
+        )
+    """)
+    cursor.execute("INSERT INTO contactos_new (id, nombre, telefono, email) "
+                   "SELECT id, nombre, telefono, email FROM contactos")
+    cursor.execute("DROP TABLE contactos")
+    cursor.execute("ALTER TABLE contactos_new RENAME TO contactos")
+    conn.commit()
+    conn.close()
+
+
+def _medir(funcion, repeticiones):
+    """Devuelve la mediana en milisegundos de `repeticiones` llamadas a `funcion`."""
+    tiempos = []
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        funcion()
+        tiempos.append((time.perf_counter() - inicio) * 1000)
+    tiempos.sort()
+    return tiempos[len(tiempos) // 2]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tamanos", type=int, nargs="+",
+                        default=[1_000, 10_000, 100_000, 1_000_000])
+    parser.add_argument("--repeticiones", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'contactos':>10} | {'copia completa (ms)':>20} | {'migraciones (ms)':>17}")
+    for n in args.tamanos:
+        with base_temporal(n) as ruta:
+            copia = _medir(lambda: _crear_tabla_copia_completa(ruta), args.repeticiones)
+            versionado = _medir(db.crear_tabla, args.repeticiones)
+        print(f"{n:>10} | {copia:>20.2f} | {versionado:>17.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""Prueba de carga de la fachada asíncrona (`database.asincrono`).
+
+Lanza miles de corrutinas concurrentes contra una base temporal: una mezcla de
+búsquedas, lecturas por ID, inserciones y actualizaciones, y una fracción de
+tareas que se cancelan antes de terminar. Informa del rendimiento, la latencia
+por tipo de operación y cuántas transacciones usaron las escrituras agrupadas.
+Al final comprueba que el número de filas coincide con las inserciones confirmadas.
+
+Uso:
+    python -m benchmarks.bench_asincrono [--n 20000] [--corrutinas 5000] [--lectores 4]
+"""
+import argparse
+import asyncio
+import random
+import statistics
+import time
+
+from database import agenda_database as db
+from database.asincrono import AgendaAsincrona
+from database.conexion import cerrar_conexiones
+from benchmarks.datos import base_temporal, generar_contactos, APELLIDOS
+
+
+async def _operacion(agenda, tipo, rnd, ids, latencias):
+    """Ejecuta una operación de `tipo` y anota su latencia."""
+    inicio = time.perf_counter()
+    if tipo == "buscar":
+        await agenda.obtener_contactos(rnd.choice(APELLIDOS))
+    elif tipo == "por_id":
+        await agenda.obtener_contacto_por_id(rnd.choice(ids))
+    elif tipo == "insertar":
+        nombre, telefono, email = next(generar_contactos(1, rnd.randrange(10**6)))
+        await agenda.insertar_contacto(nombre, telefono, email)
+    else:
+        id_contacto = rnd.choice(ids)
+        await agenda.actualizar_contacto(id_contacto, f"Editado {id_contacto}", "3000000000", "")
+    latencias.setdefault(tipo, []).append(time.perf_counter() - inicio)
+    return tipo
+
+
+async def _carga(n, corrutinas, lectores, cancelar, semilla):
+    """Ejecuta la carga y devuelve (segundos, latencias, estadísticas, insertados, cancelados)."""
+    rnd = random.Random(semilla)
+    ids = list(range(1, n + 1))
+    tipos = rnd.choices(["buscar", "por_id", "insertar", "actualizar"],
+                        weights=[40, 40, 10, 10], k=corrutinas)
+    latencias = {}
+
+    async with AgendaAsincrona(lectores=lectores) as agenda:
+        await agenda.crear_tabla()
+        inicio = time.perf_counter()
+        tareas = [asyncio.create_task(_operacion(agenda, tipo, rnd, ids, latencias))
+                  for tipo in tipos]
+        # Se cancela una fracción de las tareas mientras están en vuelo.
+        await asyncio.sleep(0)
+        for tarea in rnd.sample(tareas, int(corrutinas * cancelar)):
+            tarea.cancel()
+        resultados = await asyncio.gather(*tareas, return_exceptions=True)
+        segundos = time.perf_counter() - inicio
+        estadisticas = agenda.estadisticas()
+
+    cancelados = sum(isinstance(r, asyncio.CancelledError) for r in resultados)
+    errores = [r for r in resultados if isinstance(r, Exception)
+               and not isinstance(r, asyncio.CancelledError)]
+    if errores:
+        raise errores[0]
+    insertados = sum(r == "insertar" for r in resultados)
+    return segundos, latencias, estadisticas, insertados, cancelados
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--n", type=int, default=20_000, help="contactos iniciales")
+    parser.add_argument("--corrutinas", type=int, default=5000)
+    parser.add_argument("--lectores", type=int, default=4)
+    parser.add_argument("--cancelar", type=float, default=0.05,
+                        help="fracción de tareas que se cancelan")
+    parser.add_argument("--semilla", type=int, default=0)
+    args = parser.parse_args()
+
+    with base_temporal(args.n):
+        cerrar_conexiones()
+        segundos, latencias, estadisticas, insertados, cancelados = asyncio.run(
+            _carga(args.n, args.corrutinas, args.lectores, args.cancelar, args.semilla))
+        total = db.contar_contactos()
+        cerrar_conexiones()
+
+    completadas = args.corrutinas - cancelados
+    print(f"{args.corrutinas} corrutinas ({cancelados} canceladas) en {segundos:.2f} s "
+          f"-> {completadas / segundos:,.0f} op/s")
+    print(f"{'operación':>12} | {'n':>6} | {'p50 ms':>8} | {'p95 ms':>8} | {'máx ms':>8}")
+    for tipo, valores in sorted(latencias.items()):
+        valores.sort()
+        p95 = valores[int(len(valores) * 0.95) - 1] if len(valores) > 1 else valores[0]
+        print(f"{tipo:>12} | {len(valores):>6} | {statistics.median(valores) * 1000:>8.1f} | "
+              f"{p95 * 1000:>8.1f} | {valores[-1] * 1000:>8.1f}")
+    lotes = estadisticas["lotes"]
+    media = estadisticas["escrituras"] / lotes if lotes else 0
+    print(f"escrituras: {estadisticas['escrituras']} en {lotes} transacciones "
+          f"({media:.1f} por transacción)")
+    # Una tarea cancelada ya en curso pudo llegar a insertar; por eso solo se exige el mínimo.
+    esperado = args.n + insertados
+    estado = "OK" if total >= esperado else "ERROR"
+    print(f"filas finales: {total} (mínimo esperado {esperado}) {estado}")
+
+
+if __name__ == "__main__":
+    main()
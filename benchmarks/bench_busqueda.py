@@ -0,0 +1,43 @@
+"""Benchmark de latencia de búsqueda: LIKE con comodín inicial frente a FTS5 trigram.
+
+Uso:
+    python -m benchmarks.bench_busqueda [--tamano 500000] [--consultas ana 300 ejemplo]
+"""
+import argparse
+import time
+
+from database import agenda_database as db
+from benchmarks.datos import base_temporal
+
+
+def _medir(funcion, repeticiones=5):
+    """Devuelve la mediana en milisegundos y el número de filas devueltas."""
+    tiempos = []
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        filas = funcion()
+        tiempos.append((time.perf_counter() - inicio) * 1000)
+    tiempos.sort()
+    return tiempos[len(tiempos) // 2], len(filas)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tamano", type=int, default=500_000)
+    parser.add_argument("--consultas", nargs="+",
+                        default=["Núñez", "Camila Pe", "3004", "contacto4242@"])
+    args = parser.parse_args()
+
+    with base_temporal(args.tamano):
+        db.crear_tabla()
+        conn = db._conexion()
+        print(f"{args.tamano} contactos (FTS5 disponible: {db._usa_fts(conn)})")
+        print(f"{'consulta':>16} | {'filas':>7} | {'LIKE (ms)':>10} | {'FTS5 (ms)':>10}")
+        for consulta in args.consultas:
+            like, filas = _medir(lambda: db._buscar_like(conn, consulta))
+            fts, _ = _medir(lambda: db.obtener_contactos(consulta))
+            print(f"{consulta:>16} | {filas:>7} | {like:>10.2f} | {fts:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""Benchmark del detector de duplicados (`database.duplicados`).
+
+Genera una agenda sintética e inserta copias alteradas de una fracción de los
+contactos (nombre sin tildes, en mayúsculas o con una letra menos; teléfono con
+otro formato; email en mayúsculas o vacío). Mide el tiempo de
+`buscar_duplicados` y su precisión y exhaustividad frente a los duplicados
+conocidos.
+
+Uso:
+    python -m benchmarks.bench_duplicados [--n 1000000] [--fraccion 0.05] [--procesos N]
+"""
+import argparse
+import random
+import sqlite3
+import time
+import unicodedata
+
+from database import agenda_database as db
+from database.conexion import cerrar_conexiones
+from database.duplicados import buscar_duplicados
+from benchmarks.datos import base_temporal
+
+
+def _sin_tildes(texto):
+    return "".join(c for c in unicodedata.normalize("NFKD", texto) if not unicodedata.combining(c))
+
+
+def _variante(rnd, nombre, telefono, email):
+    """Copia alterada de un contacto que conserva el teléfono o el email."""
+    nombre = rnd.choice([
+        _sin_tildes(nombre), nombre.upper(), nombre,
+        (lambda i: nombre[:i] + nombre[i + 1:])(rnd.randrange(1, len(nombre))),
+    ])
+    if rnd.random() < 0.5 or not email:
+        telefono = rnd.choice([f"+57 {telefono[:3]} {telefono[3:]}", f"({telefono[:3]}) {telefono[3:]}"])
+        email = email.upper() if email and rnd.random() < 0.5 else ""
+    else:
+        telefono = f"3{rnd.randrange(10**9):09d}"
+        email = email.upper()
+    return nombre, telefono, email
+
+
+def _insertar_variantes(ruta, fraccion, semilla):
+    """Inserta las copias alteradas y devuelve los pares (id_original, id_copia)."""
+    rnd = random.Random(semilla)
+    conn = sqlite3.connect(ruta)
+    originales = conn.execute("SELECT id, nombre, telefono, email FROM contactos").fetchall()
+    elegidos = rnd.sample(originales, int(len(originales) * fraccion))
+    esperados = set()
+    with conn:
+        for id_original, nombre, telefono, email in elegidos:
+            cursor = conn.execute(db.SQL_INSERTAR, db._valores_contacto(*_variante(rnd, nombre, telefono, email)))
+            esperados.add((id_original, cursor.lastrowid))
+    conn.close()
+    return esperados
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--n", type=int, default=1_000_000)
+    parser.add_argument("--fraccion", type=float, default=0.05)
+    parser.add_argument("--procesos", type=int, default=None)
+    parser.add_argument("--semilla", type=int, default=0)
+    args = parser.parse_args()
+
+    with base_temporal(args.n, args.semilla) as ruta:
+        esperados = _insertar_variantes(ruta, args.fraccion, args.semilla)
+        cerrar_conexiones()
+        inicio = time.perf_counter()
+        sugerencias = buscar_duplicados(procesos=args.procesos)
+        segundos = time.perf_counter() - inicio
+        cerrar_conexiones()
+
+    encontrados = set()
+    for sugerencia in sugerencias:
+        ids = sugerencia.ids
+        encontrados.update((a, b) for i, a in enumerate(ids) for b in ids[i + 1:])
+    aciertos = len(esperados & encontrados)
+    precision = aciertos / len(encontrados) if encontrados else 1.0
+    exhaustividad = aciertos / len(esperados) if esperados else 1.0
+
+    total = args.n + len(esperados)
+    print(f"{total:,} contactos ({len(esperados):,} duplicados insertados) en {segundos:.1f} s "
+          f"-> {total / segundos:,.0f} contactos/s")
+    print(f"{len(sugerencias):,} sugerencias | precisión {precision:.3f} | "
+          f"exhaustividad {exhaustividad:.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""Benchmark de exportación masiva: filas por segundo y memoria máxima por formato.
+
+Uso:
+    python -m benchmarks.bench_exportacion [--tamano 1000000] [--memoria]
+
+Con `--memoria` se mide además el pico de memoria de Python con `tracemalloc`
+(lo que ralentiza la exportación, por eso se informa por separado).
+"""
+import argparse
+import os
+import tempfile
+import time
+import tracemalloc
+
+from database.exportacion import exportar, FORMATOS
+from benchmarks.datos import base_temporal
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tamano", type=int, default=1_000_000)
+    parser.add_argument("--memoria", action="store_true")
+    args = parser.parse_args()
+
+    with base_temporal(args.tamano), tempfile.TemporaryDirectory() as carpeta:
+        print(f"{args.tamano} contactos")
+        print(f"{'formato':>8} | {'filas/s':>12} | {'segundos':>9} | {'MB salida':>9} | {'pico MB':>8}")
+        for formato in FORMATOS:
+            ruta = os.path.join(carpeta, f"salida.{formato}")
+            inicio = time.perf_counter()
+            filas = exportar(ruta, formato=formato)
+            segundos = time.perf_counter() - inicio
+
+            pico = "-"
+            if args.memoria:
+                tracemalloc.start()
+                exportar(ruta, formato=formato)
+                pico = f"{tracemalloc.get_traced_memory()[1] / 1e6:.2f}"
+                tracemalloc.stop()
+            tamano = os.path.getsize(ruta) / 1e6
+            print(f"{formato:>8} | {filas / segundos:>12,.0f} | {segundos:>9.2f} | "
+                  f"{tamano:>9.1f} | {pico:>8}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""Benchmark de memoria al cargar contactos: sqlite3.Row, Contacto con __dict__ y Contacto con __slots__.
+
+Uso:
+    python -m benchmarks.bench_memoria_contactos [--tamano 100000]
+"""
+import argparse
+import sqlite3
+import time
+import tracemalloc
+
+from database import agenda_database as db
+from models.contacto import Contacto
+from benchmarks.datos import base_temporal
+
+
+class ContactoConDict:
+    """Réplica del Contacto anterior (sin __slots__), como referencia."""
+    def __init__(self, nombre, telefono, email, id=None):
+        self.id = id
+        self.nombre = str(nombre)
+        self.telefono = telefono
+        self.email = email
+
+
+def _cargar(conn, row_factory):
+    """Carga todos los contactos con la row factory dada y devuelve (lista, MB, segundos)."""
+    cursor = conn.cursor()
+    cursor.row_factory = row_factory
+    tracemalloc.start()
+    inicio = time.perf_counter()
+    filas = cursor.execute("SELECT id, nombre, telefono, email FROM contactos").fetchall()
+    segundos = time.perf_counter() - inicio
+    memoria = tracemalloc.get_traced_memory()[0] / 1e6
+    tracemalloc.stop()
+    return filas, memoria, segundos
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tamano", type=int, default=100_000)
+    args = parser.parse_args()
+
+    variantes = [
+        ("sqlite3.Row", sqlite3.Row),
+        ("Contacto con __dict__", lambda c, f: ContactoConDict(f[1], f[2], f[3], f[0])),
+        ("Contacto con __slots__", db.fila_a_contacto),
+    ]
+    with base_temporal(args.tamano):
+        conn = db._conexion()
+        print(f"{args.tamano} contactos cargados")
+        print(f"{'representación':>24} | {'MB':>8} | {'bytes/contacto':>14} | {'ms':>8}")
+        for nombre, fabrica in variantes:
+            filas, memoria, segundos = _cargar(conn, fabrica)
+            print(f"{nombre:>24} | {memoria:>8.1f} | {memoria * 1e6 / len(filas):>14.0f} | "
+                  f"{segundos * 1000:>8.1f}")
+            del filas
+        assert isinstance(db.obtener_contactos()[0], Contacto)
+
+
+if __name__ == "__main__":
+    main()
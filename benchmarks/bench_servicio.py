@@ -0,0 +1,169 @@
+"""Prueba de carga del servicio HTTP (`servicio.servidor`).
+
+Arranca `python -m servicio` en otro proceso sobre una base temporal (o usa una
+instancia ya en marcha con `--url`) y lanza varios clientes concurrentes, cada
+uno con su conexión keep-alive, durante un tiempo fijo. La mezcla de peticiones
+incluye páginas de la lista (la mitad revalidadas con If-None-Match), búsquedas,
+lecturas por ID y una fracción de escrituras. Informa de las peticiones por
+segundo, la latencia por tipo de petición y cuántas respuestas fueron 304.
+
+Uso:
+    python -m benchmarks.bench_servicio [--n 20000] [--clientes 16] [--segundos 10]
+    python -m benchmarks.bench_servicio --url http://127.0.0.1:8765 --escrituras 0
+"""
+import argparse
+import http.client
+import json
+import random
+import statistics
+import subprocess
+import sys
+import threading
+import time
+from urllib.parse import quote, urlsplit
+
+from database.conexion import cerrar_conexiones
+from benchmarks.datos import base_temporal, generar_contactos, APELLIDOS
+
+
+TIPOS = ("lista", "revalidar", "buscar", "por_id", "crear", "modificar")
+
+
+class Cliente(threading.Thread):
+    """Hilo que envía peticiones por una conexión persistente hasta `fin`."""
+    def __init__(self, numero, host, puerto, fin, args):
+        super().__init__(name=f"cliente-{numero}", daemon=True)
+        self.rnd = random.Random(args.semilla + numero)
+        self.conexion = http.client.HTTPConnection(host, puerto, timeout=30)
+        self.fin = fin
+        self.args = args
+        self.latencias = {tipo: [] for tipo in TIPOS}
+        self.estados = {}
+        self.etags = {}
+
+    def _peticion(self, metodo, ruta, cuerpo=None, cabeceras=None):
+        cabeceras = dict(cabeceras or {})
+        if cuerpo is not None:
+            cuerpo = json.dumps(cuerpo).encode("utf-8")
+            cabeceras["Content-Type"] = "application/json"
+        self.conexion.request(metodo, ruta, body=cuerpo, headers=cabeceras)
+        respuesta = self.conexion.getresponse()
+        respuesta.read()
+        self.estados[respuesta.status] = self.estados.get(respuesta.status, 0) + 1
+        return respuesta
+
+    def _elegir(self):
+        escrituras = self.args.escrituras
+        lecturas = 1 - escrituras
+        pesos = [0.3 * lecturas, 0.3 * lecturas, 0.15 * lecturas, 0.25 * lecturas,
+                 0.7 * escrituras, 0.3 * escrituras]
+        return self.rnd.choices(TIPOS, weights=pesos)[0]
+
+    def run(self):
+        rnd = self.rnd
+        n = self.args.n
+        while not self.fin.is_set():
+            tipo = self._elegir()
+            inicio = time.perf_counter()
+            if tipo in ("lista", "revalidar"):
+                ruta = f"/contactos?limite={self.args.limite}"
+                etag = self.etags.get(ruta) if tipo == "revalidar" else None
+                respuesta = self._peticion("GET", ruta, cabeceras={"If-None-Match": etag} if etag else None)
+                if respuesta.getheader("ETag"):
+                    self.etags[ruta] = respuesta.getheader("ETag")
+            elif tipo == "buscar":
+                self._peticion("GET", f"/contactos?limite={self.args.limite}&q={quote(rnd.choice(APELLIDOS))}")
+            elif tipo == "por_id":
+                self._peticion("GET", f"/contactos/{rnd.randint(1, max(n, 1))}")
+            elif tipo == "crear":
+                nombre, telefono, email = next(generar_contactos(1, rnd.randrange(10**6)))
+                self._peticion("POST", "/contactos",
+                               {"nombre": nombre, "telefono": telefono, "email": email})
+            else:
+                id_contacto = rnd.randint(1, max(n, 1))
+                self._peticion("PATCH", f"/contactos/{id_contacto}", {"nombre": f"Editado {rnd.choice(APELLIDOS)}"})
+            self.latencias[tipo].append(time.perf_counter() - inicio)
+        self.conexion.close()
+
+
+def _arrancar_servicio(ruta, lectores):
+    """Lanza `python -m servicio` sobre `ruta` en un puerto libre y devuelve (proceso, url)."""
+    proceso = subprocess.Popen(
+        [sys.executable, "-m", "servicio", "--db", ruta, "--puerto", "0", "--lectores", str(lectores)],
+        stdout=subprocess.PIPE, text=True,
+    )
+    url = proceso.stdout.readline().strip()
+    if not url:
+        proceso.wait()
+        raise RuntimeError("El servicio no arrancó.")
+    return proceso, url
+
+
+def _carga(url, args):
+    """Ejecuta la carga contra `url` y devuelve (segundos, clientes)."""
+    partes = urlsplit(url)
+    fin = threading.Event()
+    clientes = [Cliente(i, partes.hostname, partes.port, fin, args) for i in range(args.clientes)]
+    inicio = time.perf_counter()
+    for cliente in clientes:
+        cliente.start()
+    time.sleep(args.segundos)
+    fin.set()
+    for cliente in clientes:
+        cliente.join()
+    return time.perf_counter() - inicio, clientes
+
+
+def _informe(segundos, clientes):
+    latencias = {tipo: [] for tipo in TIPOS}
+    estados = {}
+    for cliente in clientes:
+        for tipo, valores in cliente.latencias.items():
+            latencias[tipo].extend(valores)
+        for estado, total in cliente.estados.items():
+            estados[estado] = estados.get(estado, 0) + total
+    peticiones = sum(len(valores) for valores in latencias.values())
+    print(f"{peticiones} peticiones de {len(clientes)} clientes en {segundos:.2f} s "
+          f"-> {peticiones / segundos:,.0f} req/s")
+    print(f"{'petición':>10} | {'n':>7} | {'p50 ms':>8} | {'p95 ms':>8} | {'máx ms':>8}")
+    for tipo, valores in latencias.items():
+        if not valores:
+            continue
+        valores.sort()
+        p95 = valores[int(len(valores) * 0.95) - 1] if len(valores) > 1 else valores[0]
+        print(f"{tipo:>10} | {len(valores):>7} | {statistics.median(valores) * 1000:>8.2f} | "
+              f"{p95 * 1000:>8.2f} | {valores[-1] * 1000:>8.2f}")
+    print("respuestas: " + ", ".join(f"{estado}: {total}" for estado, total in sorted(estados.items())))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", help="instancia ya en marcha (por defecto se arranca una temporal)")
+    parser.add_argument("--n", type=int, default=20_000,
+                        help="contactos de la base temporal (con --url, rango de IDs a pedir)")
+    parser.add_argument("--clientes", type=int, default=16)
+    parser.add_argument("--segundos", type=float, default=10)
+    parser.add_argument("--lectores", type=int, default=4, help="hilos lectores del servicio temporal")
+    parser.add_argument("--limite", type=int, default=50, help="contactos por página")
+    parser.add_argument("--escrituras", type=float, default=0.1,
+                        help="fracción de peticiones que escriben")
+    parser.add_argument("--semilla", type=int, default=0)
+    args = parser.parse_args()
+
+    if args.url:
+        _informe(*_carga(args.url, args))
+        return
+
+    with base_temporal(args.n) as ruta:
+        cerrar_conexiones()
+        proceso, url = _arrancar_servicio(ruta, args.lectores)
+        try:
+            resultado = _carga(url, args)
+        finally:
+            proceso.terminate()
+            proceso.wait()
+    _informe(*resultado)
+
+
+if __name__ == "__main__":
+    main()
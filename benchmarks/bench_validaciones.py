@@ -0,0 +1,80 @@
+"""Microbenchmark de validación: validaciones/s fila a fila frente a `validar_lote`.
+
+Compara, sobre filas sintéticas con un 10 % de valores inválidos:
+- el estilo anterior (`re.match` con el patrón como cadena en cada llamada),
+- las funciones `validar_*` con patrones precompilados, fila a fila,
+- `validar_lote` por columnas en un proceso,
+- `validar_lote` repartido entre varios procesos.
+
+Uso:
+    python -m benchmarks.bench_validaciones [--filas 1000000] [--procesos 4]
+"""
+import argparse
+import random
+import re
+import time
+
+from utils.validaciones import validar_nombre, validar_telefono, validar_email, validar_lote
+from benchmarks.datos import generar_contactos
+
+
+def _filas(n, semilla=0):
+    """Filas sintéticas con aproximadamente un 10 % de campos inválidos."""
+    rnd = random.Random(semilla)
+    filas = []
+    for nombre, telefono, email in generar_contactos(n, semilla):
+        if rnd.random() < 0.1:
+            nombre, telefono, email = rnd.choice([
+                (nombre + "1", telefono, email), (nombre, telefono[:5], email),
+                (nombre, telefono, "sin-arroba"), ("", "", ""),
+            ])
+        filas.append((nombre, telefono, email))
+    return filas
+
+
+def _sin_compilar(filas):
+    """Validación como antes de precompilar: el patrón se resuelve en cada llamada."""
+    patron_nombre = r"^[A-Za-záéíóúÁÉÍÓÚñÑ\s]{2,}$"
+    patron_telefono = r"^\+?[0-9]{7,15}$"
+    patron_email = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
+    return [(bool(nombre and re.match(patron_nombre, nombre)),
+             bool(telefono and re.match(patron_telefono, telefono)),
+             not email or bool(re.match(patron_email, email)))
+            for nombre, telefono, email in filas]
+
+
+def _fila_a_fila(filas):
+    """Validación con las funciones individuales (patrones precompilados)."""
+    return [(validar_nombre(nombre), validar_telefono(telefono), not email or validar_email(email))
+            for nombre, telefono, email in filas]
+
+
+def _medir(funcion, filas):
+    """Devuelve las validaciones de campo por segundo de `funcion` sobre `filas`."""
+    inicio = time.perf_counter()
+    funcion(filas)
+    return 3 * len(filas) / (time.perf_counter() - inicio)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--filas", type=int, default=1_000_000)
+    parser.add_argument("--procesos", type=int, default=4)
+    args = parser.parse_args()
+
+    filas = _filas(args.filas)
+    escenarios = [
+        ("re.match sin compilar", _sin_compilar),
+        ("validar_* precompilado", _fila_a_fila),
+        ("validar_lote (1 proceso)", validar_lote),
+        (f"validar_lote ({args.procesos} procesos)",
+         lambda f: validar_lote(f, procesos=args.procesos)),
+    ]
+    print(f"{args.filas:,} filas")
+    print(f"{'método':>28} | {'validaciones/s':>15}")
+    for nombre, funcion in escenarios:
+        print(f"{nombre:>28} | {_medir(funcion, filas):>15,.0f}")
+
+
+if __name__ == "__main__":
+    main()
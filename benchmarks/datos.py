@@ -0,0 +1,113 @@
+"""Utilidades compartidas por los benchmarks: datos sintéticos y bases temporales."""
+import os
+import random
+import sqlite3
+import tempfile
+import unicodedata
+from contextlib import contextmanager
+
+from database import agenda_database as db
+
+
+NOMBRES = ["Ana", "Andrés", "Camila", "Carlos", "Sofía", "José", "María", "Juan",
+           "Valentina", "Santiago", "Lucía", "Mateo", "Paola", "Emmanuel", "Yuly"]
+APELLIDOS = ["García", "Rodríguez", "Martínez", "López", "Gómez", "Pérez", "Díaz",
+             "Núñez", "Camacho", "Flórez", "Gutiérrez", "Peña", "Luqueta", "Muñoz"]
+
+
+def generar_contactos(n, semilla=0):
+    """Genera de forma determinista `n` tuplas (nombre, telefono, email)."""
+    rnd = random.Random(semilla)
+    for i in range(n):
+        nombre = f"{rnd.choice(NOMBRES)} {rnd.choice(APELLIDOS)}"
+        telefono = f"3{rnd.randrange(10**9):09d}"
+        email = f"contacto{i}@ejemplo.com" if rnd.random() < 0.7 else ""
+        yield nombre, telefono, email
+
+
+# Datos más variados para `generar_contactos_realistas`.
+NOMBRES_REALISTAS = NOMBRES + [
+    "Ángela", "Begoña", "Inés", "Ramón", "Óscar", "Martín", "Jesús", "Rocío", "Nicolás",
+    "Sebastián", "Julián", "Iñaki", "Sofía Isabel", "Juan Pablo", "María José", "Luis Ángel",
+    "Daniela", "Alejandro", "Gabriela", "Ximena", "Tomás", "Joaquín", "Verónica", "Héctor",
+]
+APELLIDOS_REALISTAS = APELLIDOS + [
+    "Ibáñez", "Castañeda", "Ordóñez", "Hernández", "Fernández", "Sánchez", "Ramírez",
+    "Suárez", "Álvarez", "Jiménez", "Vásquez", "Cañas", "Zúñiga", "Montaño", "Londoño",
+    "Quiñones", "Acuña", "Ortiz", "Rojas", "Vargas", "Ríos", "Mejía", "Osorio", "de la Peña",
+]
+DOMINIOS = ["gmail.com", "hotmail.com", "outlook.com", "yahoo.es", "ejemplo.com.co", "empresa.co"]
+
+
+def _sin_tildes(texto):
+    return "".join(c for c in unicodedata.normalize("NFKD", texto) if not unicodedata.combining(c))
+
+
+def _telefono_realista(rnd):
+    """Teléfono colombiano escrito en uno de los formatos que usa la gente."""
+    if rnd.random() < 0.85:
+        numero = f"3{rnd.randrange(10**9):09d}"
+        grupos = (numero[:3], numero[3:6], numero[6:])
+    else:
+        numero = f"60{rnd.choice('124578')}{rnd.randrange(10**7):07d}"
+        grupos = (numero[:3], numero[3:6], numero[6:])
+    formato = rnd.random()
+    if formato < 0.45:
+        return numero
+    if formato < 0.6:
+        return "+57" + numero
+    if formato < 0.75:
+        return " ".join(grupos)
+    if formato < 0.85:
+        return "+57 " + " ".join(grupos)
+    if formato < 0.95:
+        return "-".join(grupos)
+    return f"({grupos[0]}) {grupos[1]} {grupos[2]}"
+
+
+def generar_contactos_realistas(n, semilla=0):
+    """Genera de forma determinista `n` tuplas (nombre, telefono, email) variadas.
+
+    Nombres simples y compuestos con uno o dos apellidos (tildes, ñ), teléfonos
+    móviles y fijos en formatos mixtos (con prefijo, espacios, guiones o
+    paréntesis) y emails derivados del nombre en un 65 % de los contactos.
+    """
+    rnd = random.Random(semilla)
+    for i in range(n):
+        nombre = rnd.choice(NOMBRES_REALISTAS)
+        apellido = rnd.choice(APELLIDOS_REALISTAS)
+        completo = f"{nombre} {apellido}"
+        if rnd.random() < 0.6:
+            completo += " " + rnd.choice(APELLIDOS_REALISTAS)
+        email = ""
+        if rnd.random() < 0.65:
+            usuario = _sin_tildes(f"{nombre.split()[0]}.{apellido.replace(' ', '')}").lower()
+            email = f"{usuario}{i}@{rnd.choice(DOMINIOS)}"
+        yield completo, _telefono_realista(rnd), email
+
+
+def poblar(ruta, n, semilla=0, generador=generar_contactos):
+    """Inserta `n` contactos sintéticos en la base de datos de `ruta`."""
+    conn = sqlite3.connect(ruta)
+    with conn:
+        conn.executemany(
+            db.SQL_INSERTAR,
+            (db._valores_contacto(*fila) for fila in generador(n, semilla)),
+        )
+    conn.close()
+
+
+@contextmanager
+def base_temporal(n=0, semilla=0, generador=generar_contactos):
+    """Crea una 'agenda.db' temporal con `n` contactos y apunta `db.DB_PATH` a ella."""
+    ruta_original = db.DB_PATH
+    with tempfile.TemporaryDirectory() as carpeta:
+        ruta = os.path.join(carpeta, "agenda.db")
+        db.DB_PATH = ruta
+        try:
+            db.crear_tabla()
+            if n:
+                poblar(ruta, n, semilla, generador)
+            yield ruta
+        finally:
+            db.DB_PATH = ruta_original
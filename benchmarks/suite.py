@@ -0,0 +1,488 @@
+"""Suite completa de benchmarks con resultados en JSON y comparación con una línea base.
+
+Para cada tamaño, crea una base temporal con contactos realistas
+(`datos.generar_contactos_realistas`) y mide:
+
+- todas las funciones públicas de `database.agenda_database` (lecturas,
+  búsquedas, paginación, conteos, búsquedas puntuales y escrituras individuales
+  y por lotes),
+- `Agenda.cargar_contactos`, `Agenda.buscar_exacta` y `Agenda.buscar_parcial`,
+- los validadores de `utils.validaciones`.
+
+Además captura las sentencias que ejecuta cada función que debe usar un índice
+y revisa su `EXPLAIN QUERY PLAN`: un recorrido completo de una tabla (`SCAN
+contactos` sin índice) se informa como fallo.
+
+Los resultados se pueden guardar en JSON (`--salida`) y comparar con los de una
+ejecución anterior (`--comparar`): un caso cuyo tiempo mínimo empeora más de la
+tolerancia, de `RUIDO_MS` y de su propia dispersión se informa como regresión.
+Antes de fallar, los tamaños con regresiones se vuelven a medir y se conserva el
+mejor mínimo de ambas ejecuciones, así que una regresión tiene que repetirse. El
+proceso termina con código 1 si hay regresiones o planes con recorridos
+completos.
+
+Uso:
+    python -m benchmarks [--tamanos 1000 10000 100000 1000000] [--repeticiones 5]
+                         [--salida resultados.json] [--comparar base.json] [--tolerancia 0.25]
+"""
+import argparse
+import json
+import platform
+import random
+import re
+import sqlite3
+import sys
+import time
+from collections import defaultdict
+from datetime import datetime, timezone
+
+from database import agenda_database as db
+from database.conexion import cerrar_conexiones
+from models.agenda import Agenda
+from utils.validaciones import validar_nombre, validar_telefono, validar_email, validar_lote
+from benchmarks.datos import base_temporal, generar_contactos_realistas
+
+
+TAMANOS = [1_000, 10_000, 100_000]
+REPETICIONES = 5
+# Empeoramiento relativo del tiempo mínimo a partir del cual se informa una regresión.
+# Se compara el mínimo de las repeticiones y no la mediana: es el valor menos
+# afectado por interrupciones del sistema, cachés frías o el recolector de basura.
+TOLERANCIA = 0.25
+# Diferencias menores que esta (en ms) se consideran ruido aunque superen la
+# tolerancia: en los casos de menos de un milisegundo la variación entre
+# ejecuciones del mismo código supera con facilidad el 25 %.
+RUIDO_MS = 1.0
+
+# Operaciones por repetición en los casos que repiten una llamada barata.
+BUSQUEDAS_PUNTUALES = 500
+ESCRITURAS_INDIVIDUALES = 100
+TAMANO_LOTE = 1_000
+# Filas sobre las que se miden los validadores.
+FILAS_VALIDACION = 100_000
+
+CONSULTA_NOMBRE = "Núñez"
+CONSULTA_TELEFONO = "3004"
+CONSULTA_CORTA = "an"
+
+
+# --- MEDICIÓN ---
+
+def _medir(funcion, repeticiones, preparar=None):
+    """Ejecuta `funcion` `repeticiones` veces y devuelve (tiempos en s, último resultado)."""
+    tiempos, resultado = [], None
+    for _ in range(repeticiones):
+        if preparar is not None:
+            preparar()
+        inicio = time.perf_counter()
+        resultado = funcion()
+        tiempos.append(time.perf_counter() - inicio)
+    return tiempos, resultado
+
+
+def _resultado(caso, tamano, tiempos, operaciones=1, filas=None):
+    """Resumen de un caso: mediana y mínimo por repetición y coste por operación."""
+    tiempos = sorted(tiempos)
+    mediana = tiempos[len(tiempos) // 2]
+    resultado = {
+        "caso": caso,
+        "tamano": tamano,
+        "repeticiones": len(tiempos),
+        "operaciones": operaciones,
+        "mediana_ms": round(mediana * 1000, 4),
+        "minimo_ms": round(tiempos[0] * 1000, 4),
+        "por_operacion_us": round(mediana * 1e6 / operaciones, 3),
+    }
+    if filas is not None:
+        resultado["filas"] = filas
+    return resultado
+
+
+def _filas(valor):
+    """Número de filas de un resultado (lista) o None si no es una lista."""
+    return len(valor) if isinstance(valor, list) else None
+
+
+# --- CASOS ---
+
+def _casos_lectura(n, repeticiones, rnd):
+    """Funciones de lectura de `agenda_database` sobre la base ya poblada."""
+    conn = db._conexion()
+    resultados = []
+
+    def caso(nombre, funcion, operaciones=1, preparar=None):
+        tiempos, valor = _medir(funcion, repeticiones, preparar)
+        resultados.append(_resultado(nombre, n, tiempos, operaciones, _filas(valor)))
+
+    caso("crear_tabla (esquema al día)", db.crear_tabla)
+    caso("get_db_connection (abrir y cerrar)", lambda: db.get_db_connection().close())
+    caso("obtener_contactos (todos)", db.obtener_contactos)
+    caso(f"obtener_contactos ('{CONSULTA_NOMBRE}')", lambda: db.obtener_contactos(CONSULTA_NOMBRE))
+    caso(f"obtener_contactos ('{CONSULTA_TELEFONO}')", lambda: db.obtener_contactos(CONSULTA_TELEFONO))
+    caso(f"obtener_contactos ('{CONSULTA_CORTA}', LIKE)", lambda: db.obtener_contactos(CONSULTA_CORTA))
+
+    mitad = _clave_intermedia(conn, n)
+    caso("obtener_contactos_pagina (primera)", db.obtener_contactos_pagina)
+    caso("obtener_contactos_pagina (mitad)", lambda: db.obtener_contactos_pagina(mitad))
+    caso(f"obtener_contactos_pagina ('{CONSULTA_NOMBRE}')",
+         lambda: db.obtener_contactos_pagina(filtro_busqueda=CONSULTA_NOMBRE))
+
+    # Sin la caché de conteos de la conexión: se mide el COUNT(*) real.
+    def olvidar_conteos():
+        conn.marca_conteos = None
+
+    caso("contar_contactos (todos)", db.contar_contactos, preparar=olvidar_conteos)
+    caso(f"contar_contactos ('{CONSULTA_NOMBRE}')", lambda: db.contar_contactos(CONSULTA_NOMBRE),
+         preparar=olvidar_conteos)
+    caso("contar_contactos (caché)", db.contar_contactos)
+
+    ids = rnd.sample(range(1, n + 1), min(n, BUSQUEDAS_PUNTUALES))
+    claves = _consultar_columnas(conn, ids)
+    telefonos = [telefono for telefono, _ in claves]
+    emails = [email for _, email in claves if email]
+    caso("obtener_contacto_por_id", lambda: [db.obtener_contacto_por_id(i) for i in ids], len(ids))
+    caso("obtener_contacto_por_telefono",
+         lambda: [db.obtener_contacto_por_telefono(t) for t in telefonos], len(telefonos))
+    caso("obtener_contacto_por_email",
+         lambda: [db.obtener_contacto_por_email(e) for e in emails], len(emails))
+    return resultados
+
+
+def _clave_intermedia(conn, n):
+    """Clave de paginación (nombre, id) del contacto situado en la mitad del orden."""
+    cursor = conn.cursor()
+    cursor.row_factory = None
+    return cursor.execute(
+        "SELECT nombre, id FROM contactos ORDER BY nombre COLLATE NOCASE, id LIMIT 1 OFFSET ?",
+        (n // 2,),
+    ).fetchone()
+
+
+def _consultar_columnas(conn, ids):
+    """Teléfono y email (tal como se escribieron) de los contactos `ids`."""
+    cursor = conn.cursor()
+    cursor.row_factory = None
+    marcadores = ",".join("?" * len(ids))
+    return cursor.execute(
+        f"SELECT telefono, email FROM contactos WHERE id IN ({marcadores})", ids
+    ).fetchall()
+
+
+def _casos_escritura(n, repeticiones, semilla):
+    """Escrituras individuales y por lotes; cada repetición deja la base como estaba."""
+    filas = list(generar_contactos_realistas(ESCRITURAS_INDIVIDUALES + TAMANO_LOTE, semilla + 1))
+    individuales, lote = filas[:ESCRITURAS_INDIVIDUALES], filas[ESCRITURAS_INDIVIDUALES:]
+    tiempos = defaultdict(list)
+
+    def medir(caso, funcion):
+        inicio = time.perf_counter()
+        valor = funcion()
+        tiempos[caso].append(time.perf_counter() - inicio)
+        return valor
+
+    # La primera ronda no se mide: reserva páginas y con pocas repeticiones su
+    # coste dominaría el mínimo. Cada ronda empieza con el WAL vacío, para que los
+    # checkpoints automáticos caigan siempre en el mismo punto de la ronda.
+    for _ in range(repeticiones + 1):
+        db._conexion().execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        ids = medir("insertar_contacto", lambda: [db.insertar_contacto(*f) for f in individuales])
+        medir("actualizar_contacto",
+              lambda: [db.actualizar_contacto(i, f[0], f[1], "") for i, f in zip(ids, individuales)])
+        medir("eliminar_contacto", lambda: [db.eliminar_contacto(i) for i in ids])
+
+        ids = medir("insertar_contactos (lote)", lambda: db.insertar_contactos(lote))
+        medir("actualizar_contactos (lote)",
+              lambda: db.actualizar_contactos([(i, f[0], f[1], "") for i, f in zip(ids, lote)]))
+        medir("eliminar_contactos (lote)", lambda: db.eliminar_contactos(ids))
+
+    operaciones = {"insertar_contacto": len(individuales), "actualizar_contacto": len(individuales),
+                   "eliminar_contacto": len(individuales)}
+    return [_resultado(caso, n, t[1:], operaciones.get(caso, len(lote))) for caso, t in tiempos.items()]
+
+
+def _casos_agenda(n, repeticiones):
+    """Carga e índices de `models.agenda.Agenda` con los contactos de la base."""
+    contactos = db.obtener_contactos()
+    tiempos, agenda = _medir(lambda: _cargar_agenda(contactos), repeticiones)
+    resultados = [_resultado("Agenda.cargar_contactos", n, tiempos, len(contactos))]
+
+    existente = contactos[len(contactos) // 2].nombre
+    for etiqueta, consulta in (("existente", existente), ("mayúsculas", existente.upper()),
+                               ("inexistente", "Nadie Existe")):
+        tiempos, valor = _medir(lambda: agenda.buscar_exacta(consulta), repeticiones)
+        resultados.append(_resultado(f"Agenda.buscar_exacta ({etiqueta})", n, tiempos, filas=len(valor)))
+    for consulta in ("peña", "tiago", "ez ro", CONSULTA_CORTA):
+        tiempos, valor = _medir(lambda: agenda.buscar_parcial(consulta), repeticiones)
+        resultados.append(_resultado(f"Agenda.buscar_parcial ('{consulta}')", n, tiempos, filas=len(valor)))
+    return resultados
+
+
+def _cargar_agenda(contactos):
+    agenda = Agenda()
+    agenda.cargar_contactos(contactos)
+    return agenda
+
+
+def _casos_validaciones(n, repeticiones, semilla):
+    """Validadores fila a fila y `validar_lote` sobre filas con formatos mixtos."""
+    filas = list(generar_contactos_realistas(min(n, FILAS_VALIDACION), semilla))
+    nombres = [f[0] for f in filas]
+    telefonos = [f[1] for f in filas]
+    emails = [f[2] for f in filas if f[2]]
+    resultados = []
+    for caso, funcion, valores in (("validar_nombre", validar_nombre, nombres),
+                                   ("validar_telefono", validar_telefono, telefonos),
+                                   ("validar_email", validar_email, emails)):
+        tiempos, _ = _medir(lambda: [funcion(v) for v in valores], repeticiones)
+        resultados.append(_resultado(caso, n, tiempos, len(valores)))
+    tiempos, _ = _medir(lambda: validar_lote(filas), repeticiones)
+    resultados.append(_resultado("validar_lote", n, tiempos, len(filas)))
+    return resultados
+
+
+# --- PLANES DE CONSULTA ---
+
+def _comprobaciones_plan(n, rnd):
+    """Funciones que deben resolverse con índices, con los argumentos con que se prueban."""
+    conn = db._conexion()
+    mitad = _clave_intermedia(conn, n)
+    id_existente = rnd.randrange(1, n + 1)
+    telefono, email = _consultar_columnas(conn, [id_existente])[0]
+    contacto = db.obtener_contacto_por_id(id_existente)
+
+    def olvidar_conteos():
+        conn.marca_conteos = None
+        return db.contar_contactos(CONSULTA_NOMBRE)
+
+    return [
+        (f"obtener_contactos ('{CONSULTA_NOMBRE}')", lambda: db.obtener_contactos(CONSULTA_NOMBRE)),
+        ("obtener_contactos_pagina (primera)", db.obtener_contactos_pagina),
+        ("obtener_contactos_pagina (mitad)", lambda: db.obtener_contactos_pagina(mitad)),
+        (f"obtener_contactos_pagina ('{CONSULTA_NOMBRE}')",
+         lambda: db.obtener_contactos_pagina(filtro_busqueda=CONSULTA_NOMBRE)),
+        (f"contar_contactos ('{CONSULTA_NOMBRE}')", olvidar_conteos),
+        ("obtener_contacto_por_id", lambda: db.obtener_contacto_por_id(id_existente)),
+        ("obtener_contacto_por_telefono", lambda: db.obtener_contacto_por_telefono(telefono)),
+        ("obtener_contacto_por_email", lambda: db.obtener_contacto_por_email(email or "nadie@ejemplo.com")),
+        # Escrituras que no cambian nada: se reescribe el mismo contacto y se borra un ID inexistente.
+        ("actualizar_contacto", lambda: db.actualizar_contacto(contacto.id, contacto.nombre,
+                                                               contacto.telefono, contacto.email)),
+        ("eliminar_contacto", lambda: db.eliminar_contacto(n * 10)),
+        ("eliminar_contactos", lambda: db.eliminar_contactos([n * 10, n * 10 + 1])),
+    ]
+
+
+def _sentencias(conn, funcion):
+    """Ejecuta `funcion` y devuelve las consultas (con sus parámetros) que lanzó en `conn`."""
+    capturadas = []
+
+    def traza(sql):
+        # Las sentencias de los triggers llegan como comentarios ("-- ..."): se omiten.
+        if sql.lstrip()[:6].upper() in ("SELECT", "UPDATE", "DELETE"):
+            capturadas.append(sql)
+
+    conn.set_trace_callback(traza)
+    try:
+        funcion()
+    finally:
+        conn.set_trace_callback(None)
+    return capturadas
+
+
+# Tablas internas (catálogo de SQLite y tablas auxiliares del índice FTS5) que
+# se leen enteras por diseño al resolver metadatos.
+_TABLAS_INTERNAS = re.compile(r"^SCAN (main\.)?(sqlite_\w+|contactos_fts_\w+)$")
+
+
+def _recorrido_completo(detalle):
+    """Indica si un paso del plan recorre una tabla entera sin índice."""
+    return (detalle.startswith("SCAN ") and "USING" not in detalle
+            and "VIRTUAL TABLE" not in detalle and detalle != "SCAN CONSTANT ROW"
+            and not _TABLAS_INTERNAS.match(detalle))
+
+
+def _planes(n, rnd):
+    """Revisa el `EXPLAIN QUERY PLAN` de las consultas de cada función indexada."""
+    conn = db._conexion()
+    cursor = conn.cursor()
+    cursor.row_factory = None
+    resultados = []
+    for caso, funcion in _comprobaciones_plan(n, rnd):
+        for sql in _sentencias(conn, funcion):
+            plan = [fila[3] for fila in cursor.execute("EXPLAIN QUERY PLAN " + sql)]
+            recorridos = [detalle for detalle in plan if _recorrido_completo(detalle)]
+            resultados.append({
+                "caso": caso,
+                "tamano": n,
+                "sql": " ".join(sql.split()),
+                "plan": plan,
+                "correcto": not recorridos,
+            })
+    return resultados
+
+
+# --- EJECUCIÓN, INFORME Y COMPARACIÓN ---
+
+def ejecutar(tamanos=TAMANOS, repeticiones=REPETICIONES, semilla=0, planes=True, progreso=None):
+    """Ejecuta la suite completa y devuelve el documento de resultados (serializable a JSON).
+
+    Args:
+        tamanos: Números de contactos de cada base temporal.
+        repeticiones: Repeticiones por caso (se informa la mediana).
+        semilla: Semilla de los datos sintéticos y de las muestras.
+        planes: Si es False, no se revisan los planes de consulta.
+        progreso: Función opcional que recibe un texto al empezar cada tamaño.
+    """
+    documento = {
+        "entorno": {
+            "fecha": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "sqlite": sqlite3.sqlite_version,
+            "plataforma": platform.platform(),
+            "semilla": semilla,
+            "repeticiones": repeticiones,
+        },
+        "resultados": [],
+        "planes": [],
+    }
+    for n in tamanos:
+        if progreso:
+            progreso(f"{n:,} contactos...")
+        rnd = random.Random(semilla)
+        with base_temporal(n, semilla, generador=generar_contactos_realistas):
+            documento["entorno"]["fts5"] = db._usa_fts(db._conexion())
+            documento["resultados"] += _casos_lectura(n, repeticiones, rnd)
+            documento["resultados"] += _casos_escritura(n, repeticiones, semilla)
+            documento["resultados"] += _casos_agenda(n, repeticiones)
+            if planes:
+                documento["planes"] += _planes(n, rnd)
+            cerrar_conexiones()
+        documento["resultados"] += _casos_validaciones(n, repeticiones, semilla)
+    return documento
+
+
+def comparar(documento, base, tolerancia=TOLERANCIA):
+    """Compara los tiempos mínimos de `documento` con los de `base`.
+
+    Returns:
+        list[dict]: Un elemento por caso presente en ambos, con la razón
+                    actual/base y si es una regresión.
+    """
+    anteriores = {(r["caso"], r["tamano"]): r for r in base["resultados"]}
+    comparacion = []
+    for actual in documento["resultados"]:
+        anterior = anteriores.get((actual["caso"], actual["tamano"]))
+        if anterior is None or not anterior["minimo_ms"]:
+            continue
+        razon = actual["minimo_ms"] / anterior["minimo_ms"]
+        # La diferencia también debe superar la dispersión (mediana - mínimo)
+        # observada en cualquiera de las dos ejecuciones.
+        dispersion = max(anterior["mediana_ms"] - anterior["minimo_ms"],
+                         actual["mediana_ms"] - actual["minimo_ms"])
+        comparacion.append({
+            "caso": actual["caso"],
+            "tamano": actual["tamano"],
+            "base_ms": anterior["minimo_ms"],
+            "actual_ms": actual["minimo_ms"],
+            "razon": round(razon, 3),
+            "regresion": (razon > 1 + tolerancia
+                          and actual["minimo_ms"] - anterior["minimo_ms"] > max(RUIDO_MS, dispersion)),
+        })
+    return comparacion
+
+
+def confirmar(documento, repeticion):
+    """Combina en `documento` los mínimos de una segunda medición (`repeticion`) de los mismos casos."""
+    nuevos = {(r["caso"], r["tamano"]): r for r in repeticion["resultados"]}
+    for resultado in documento["resultados"]:
+        nuevo = nuevos.get((resultado["caso"], resultado["tamano"]))
+        if nuevo is not None:
+            resultado["minimo_ms"] = min(resultado["minimo_ms"], nuevo["minimo_ms"])
+            resultado["repeticiones"] += nuevo["repeticiones"]
+
+
+def informe(documento, comparacion=None):
+    """Texto legible con los resultados, los planes incorrectos y la comparación."""
+    lineas = [f"{'caso':<48} | {'tamaño':>9} | {'mediana ms':>11} | {'µs/op':>10} | {'filas':>7}"]
+    for r in documento["resultados"]:
+        filas = r.get("filas")
+        lineas.append(f"{r['caso'][:48]:<48} | {r['tamano']:>9,} | {r['mediana_ms']:>11.3f} | "
+                      f"{r['por_operacion_us']:>10.2f} | {'' if filas is None else filas:>7}")
+
+    malos = [p for p in documento["planes"] if not p["correcto"]]
+    if documento["planes"]:
+        lineas.append("")
+        lineas.append(f"Planes de consulta: {len(documento['planes']) - len(malos)} correctos, "
+                      f"{len(malos)} con recorrido completo")
+        for p in malos:
+            lineas.append(f"  FALLO {p['caso']} ({p['tamano']:,}): {p['sql']}")
+            lineas.extend(f"        {detalle}" for detalle in p["plan"])
+
+    if comparacion is not None:
+        regresiones = [c for c in comparacion if c["regresion"]]
+        lineas.append("")
+        lineas.append(f"Comparación con la línea base: {len(comparacion)} casos, "
+                      f"{len(regresiones)} regresiones")
+        for c in regresiones:
+            lineas.append(f"  REGRESIÓN {c['caso']} ({c['tamano']:,}): "
+                          f"mínimo {c['base_ms']:.3f} -> {c['actual_ms']:.3f} ms (x{c['razon']:.2f})")
+    return "\n".join(lineas)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tamanos", type=int, nargs="+", default=TAMANOS)
+    parser.add_argument("--repeticiones", type=int,
+                        help=f"repeticiones por caso (por defecto, las de la línea base o {REPETICIONES})")
+    parser.add_argument("--semilla", type=int, default=0)
+    parser.add_argument("--salida", metavar="ARCHIVO",
+                        help="guarda los resultados en JSON ('-' para la salida estándar)")
+    parser.add_argument("--comparar", metavar="BASE", help="JSON de una ejecución anterior")
+    parser.add_argument("--tolerancia", type=float, default=TOLERANCIA,
+                        help="empeoramiento relativo tolerado (0.25 = 25 %%)")
+    parser.add_argument("--sin-planes", action="store_true",
+                        help="no revisa los planes de consulta")
+    args = parser.parse_args(argv)
+
+    # Con el JSON en la salida estándar, el informe legible va a la de errores.
+    texto = sys.stderr if args.salida == "-" else sys.stdout
+    base = None
+    if args.comparar:
+        with open(args.comparar, encoding="utf-8") as archivo:
+            base = json.load(archivo)
+        # El mínimo depende del número de repeticiones: solo se comparan mediciones equivalentes.
+        repeticiones_base = base["entorno"].get("repeticiones", REPETICIONES)
+        if args.repeticiones is None:
+            args.repeticiones = repeticiones_base
+        elif args.repeticiones != repeticiones_base:
+            print(f"Aviso: la línea base usó {repeticiones_base} repeticiones y esta ejecución "
+                  f"{args.repeticiones}; la comparación puede no ser fiable.", file=sys.stderr)
+    if args.repeticiones is None:
+        args.repeticiones = REPETICIONES
+    documento = ejecutar(args.tamanos, args.repeticiones, args.semilla, not args.sin_planes,
+                         progreso=lambda mensaje: print(mensaje, file=sys.stderr))
+
+    comparacion = None
+    if base is not None:
+        comparacion = comparar(documento, base, args.tolerancia)
+        tamanos = sorted({c["tamano"] for c in comparacion if c["regresion"]})
+        if tamanos:
+            print("Confirmando regresiones...", file=sys.stderr)
+            confirmar(documento, ejecutar(tamanos, args.repeticiones, args.semilla, planes=False))
+            comparacion = comparar(documento, base, args.tolerancia)
+        documento["comparacion"] = comparacion
+
+    print(informe(documento, comparacion), file=texto)
+    if args.salida == "-":
+        json.dump(documento, sys.stdout, ensure_ascii=False, indent=2)
+    elif args.salida:
+        with open(args.salida, "w", encoding="utf-8") as archivo:
+            json.dump(documento, archivo, ensure_ascii=False, indent=2)
+
+    fallos = any(not p["correcto"] for p in documento["planes"])
+    fallos = fallos or any(c["regresion"] for c in comparacion or [])
+    return 1 if fallos else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1 @@
+"""Línea de comandos de la agenda sin interfaz gráfica (ver `cli.comandos`)."""
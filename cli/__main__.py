@@ -0,0 +1,7 @@
+"""Punto de entrada de `python -m cli` (ver `cli.comandos`)."""
+import sys
+
+from cli.comandos import main
+
+
+sys.exit(main())
@@ -0,0 +1,313 @@
+"""Subcomandos de la línea de comandos de la agenda (`python -m cli`).
+
+Solo usa la capa de datos (`database`) y las validaciones (`utils`): nunca importa
+`ui`, tkinter ni PIL, por lo que arranca en decenas de milisegundos y funciona
+en servidores sin entorno gráfico.
+
+Ejemplos:
+    python -m cli buscar "Peña" --limite 20
+    python -m cli --json obtener --telefono "300 123 4567"
+    python -m cli agregar "Ana Pérez" 3001234567 ana@ejemplo.com
+    python -m cli actualizar 42 --email nueva@ejemplo.com
+    python -m cli eliminar 42 43
+    python -m cli importar crm.csv --errores rechazados.csv
+    python -m cli exportar contactos.jsonl --filtro Peña
+    python -m cli lote --transaccion < comandos.txt
+
+Códigos de salida: 0 éxito, 1 contacto no encontrado, 2 entrada inválida,
+3 error de la base de datos o de archivo.
+"""
+import argparse
+import itertools
+import json
+import shlex
+import sqlite3
+import sys
+
+from database import agenda_database as db
+from database.importacion import limpiar_telefono, validar_fila
+
+
+EXITO = 0
+NO_ENCONTRADO = 1
+ENTRADA_INVALIDA = 2
+ERROR = 3
+
+COLUMNAS = ("id", "nombre", "telefono", "email")
+
+
+class ErrorEntrada(Exception):
+    """Argumentos válidos para argparse pero rechazados por las validaciones."""
+
+
+# --- SALIDA ---
+
+def _contacto_a_dict(contacto):
+    return {columna: contacto[columna] for columna in COLUMNAS}
+
+
+def _imprimir_contactos(args, contactos):
+    """Escribe contactos como JSON Lines (`--json`) o como líneas separadas por tabuladores."""
+    salida = sys.stdout
+    total = 0
+    for contacto in contactos:
+        if args.json:
+            salida.write(json.dumps(_contacto_a_dict(contacto), ensure_ascii=False) + "\n")
+        else:
+            salida.write("\t".join("" if contacto[c] is None else str(contacto[c]) for c in COLUMNAS) + "\n")
+        total += 1
+    return total
+
+
+def _imprimir(args, datos: dict, texto: str):
+    """Escribe `datos` en JSON con `--json`, o `texto` en otro caso."""
+    print(json.dumps(datos, ensure_ascii=False) if args.json else texto)
+
+
+# --- VALIDACIÓN ---
+
+def _validar(nombre, telefono, email):
+    """Limpia y valida un contacto; devuelve (nombre, telefono, email) o lanza ErrorEntrada."""
+    nombre = (nombre or "").strip()
+    telefono = limpiar_telefono(telefono)
+    email = (email or "").strip()
+    motivos = validar_fila(nombre, telefono, email)
+    if motivos:
+        raise ErrorEntrada("; ".join(motivos))
+    return nombre, telefono, email
+
+
+# --- SUBCOMANDOS ---
+
+def cmd_buscar(args):
+    """Lista los contactos (ordenados por nombre) que contienen el texto."""
+    from database.exportacion import iterar_contactos
+    contactos = iterar_contactos(args.texto)
+    if args.limite:
+        contactos = itertools.islice(contactos, args.limite)
+    _imprimir_contactos(args, contactos)
+    return EXITO
+
+
+def cmd_obtener(args):
+    """Muestra un contacto por ID, teléfono o email."""
+    if args.telefono is not None:
+        contacto = db.obtener_contacto_por_telefono(args.telefono)
+    elif args.email is not None:
+        contacto = db.obtener_contacto_por_email(args.email)
+    elif args.id is not None:
+        contacto = db.obtener_contacto_por_id(args.id)
+    else:
+        raise ErrorEntrada("indica un ID, --telefono o --email")
+    if contacto is None:
+        print("Contacto no encontrado.", file=sys.stderr)
+        return NO_ENCONTRADO
+    _imprimir_contactos(args, [contacto])
+    return EXITO
+
+
+def cmd_agregar(args):
+    """Valida e inserta un contacto; imprime el ID asignado."""
+    nombre, telefono, email = _validar(args.nombre, args.telefono, args.email)
+    id_contacto = db.insertar_contacto(nombre, telefono, email)
+    _imprimir(args, {"id": id_contacto}, str(id_contacto))
+    return EXITO
+
+
+def cmd_actualizar(args):
+    """Cambia los campos indicados de un contacto y conserva los demás."""
+    actual = db.obtener_contacto_por_id(args.id)
+    if actual is None:
+        print("Contacto no encontrado.", file=sys.stderr)
+        return NO_ENCONTRADO
+    nombre, telefono, email = _validar(
+        actual.nombre if args.nombre is None else args.nombre,
+        actual.telefono if args.telefono is None else args.telefono,
+        actual.email if args.email is None else args.email,
+    )
+    db.actualizar_contacto(args.id, nombre, telefono, email)
+    _imprimir(args, {"id": args.id, "actualizado": True}, "Contacto actualizado.")
+    return EXITO
+
+
+def cmd_eliminar(args):
+    """Elimina uno o varios contactos por ID en una sola transacción."""
+    resultados = db.eliminar_contactos(args.ids)
+    for id_contacto, eliminado in zip(args.ids, resultados):
+        _imprimir(args, {"id": id_contacto, "eliminado": eliminado},
+                  f"{id_contacto}\t{'eliminado' if eliminado else 'no encontrado'}")
+    return EXITO if all(resultados) else NO_ENCONTRADO
+
+
+def cmd_importar(args):
+    """Importa un archivo CSV o vCard."""
+    from database.importacion import importar_archivo
+    resultado = importar_archivo(args.archivo, informe_errores=args.errores, tamano_lote=args.lote)
+    _imprimir(args, {"leidas": resultado.leidas, "insertadas": resultado.insertadas,
+                     "rechazadas": resultado.rechazadas}, str(resultado))
+    return EXITO
+
+
+def cmd_exportar(args):
+    """Exporta los contactos a un archivo o a la salida estándar."""
+    from database.exportacion import exportar
+    total = exportar(args.destino, formato=args.formato, filtro_busqueda=args.filtro)
+    # Con la salida estándar como destino no se añade nada a los datos exportados.
+    if args.destino is not None:
+        _imprimir(args, {"exportados": total}, f"{total} contactos exportados.")
+    return EXITO
+
+
+class _LineaFallida(Exception):
+    """Lleva el código de salida de una línea fallida fuera de su savepoint o del lote."""
+    def __init__(self, codigo):
+        super().__init__(codigo)
+        self.codigo = codigo
+
+
+def cmd_lote(args):
+    """Ejecuta los subcomandos leídos de la entrada estándar, uno por línea.
+
+    Todas las líneas usan la misma conexión. Con `--transaccion` se ejecutan en
+    una sola transacción y cada línea en su propio savepoint, de modo que una
+    línea que falla deshace solo sus escrituras; con `--detener`, el primer error
+    interrumpe el lote (y deshace la transacción, si la hay).
+    """
+    parser = crear_parser()
+    codigo = EXITO
+
+    def ejecutar_lineas():
+        nonlocal codigo
+        for numero, linea in enumerate(sys.stdin, start=1):
+            linea = linea.strip()
+            if not linea or linea.startswith("#"):
+                continue
+            if args.transaccion:
+                resultado = _ejecutar_en_savepoint(parser, args, linea, numero)
+            else:
+                resultado = _ejecutar_linea(parser, args, linea, numero)
+            codigo = max(codigo, resultado)
+            if resultado != EXITO and args.detener:
+                raise _LineaFallida(resultado)
+
+    try:
+        if args.transaccion:
+            with db.transaccion():
+                ejecutar_lineas()
+        else:
+            ejecutar_lineas()
+    except _LineaFallida as interrupcion:
+        return interrupcion.codigo
+    return codigo
+
+
+def _ejecutar_en_savepoint(parser, args_lote, linea, numero):
+    """Ejecuta una línea del lote en su propio savepoint, que se deshace si falla."""
+    try:
+        with db.transaccion():
+            resultado = _ejecutar_linea(parser, args_lote, linea, numero)
+            if resultado != EXITO:
+                raise _LineaFallida(resultado)
+    except _LineaFallida as fallo:
+        return fallo.codigo
+    return resultado
+
+
+def _ejecutar_linea(parser, args_lote, linea, numero):
+    """Interpreta y ejecuta una línea del lote; devuelve su código de salida."""
+    try:
+        args = parser.parse_args(shlex.split(linea))
+    except SystemExit:
+        # argparse ya escribió el motivo en la salida de errores.
+        print(f"línea {numero}: comando inválido", file=sys.stderr)
+        return ENTRADA_INVALIDA
+    except ValueError as e:
+        print(f"línea {numero}: {e}", file=sys.stderr)
+        return ENTRADA_INVALIDA
+    if args.comando == "lote" or args.db is not None:
+        print(f"línea {numero}: 'lote' y --db no se admiten dentro de un lote", file=sys.stderr)
+        return ENTRADA_INVALIDA
+    args.json = args.json or args_lote.json
+    return ejecutar(args, prefijo=f"línea {numero}: ")
+
+
+# --- PARSER Y EJECUCIÓN ---
+
+def crear_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m cli",
+                                     description="Agenda Norma Ingens Robur sin interfaz gráfica.")
+    parser.add_argument("--db", metavar="RUTA", help="base de datos a usar (por defecto, agenda.db)")
+    parser.add_argument("--json", action="store_true", help="salida en JSON (una línea por resultado)")
+    comandos = parser.add_subparsers(dest="comando", required=True, metavar="COMANDO")
+
+    p = comandos.add_parser("buscar", help="lista los contactos que contienen un texto")
+    p.add_argument("texto", nargs="?", help="texto a buscar en nombre, teléfono o email")
+    p.add_argument("--limite", type=int, help="número máximo de contactos")
+    p.set_defaults(funcion=cmd_buscar)
+
+    p = comandos.add_parser("obtener", help="muestra un contacto por ID, teléfono o email")
+    p.add_argument("id", type=int, nargs="?")
+    p.add_argument("--telefono", help="busca por teléfono (en cualquier formato)")
+    p.add_argument("--email", help="busca por email (sin distinguir mayúsculas)")
+    p.set_defaults(funcion=cmd_obtener)
+
+    p = comandos.add_parser("agregar", help="crea un contacto")
+    p.add_argument("nombre")
+    p.add_argument("telefono")
+    p.add_argument("email", nargs="?", default="")
+    p.set_defaults(funcion=cmd_agregar)
+
+    p = comandos.add_parser("actualizar", help="cambia campos de un contacto")
+    p.add_argument("id", type=int)
+    p.add_argument("--nombre")
+    p.add_argument("--telefono")
+    p.add_argument("--email")
+    p.set_defaults(funcion=cmd_actualizar)
+
+    p = comandos.add_parser("eliminar", help="elimina contactos por ID")
+    p.add_argument("ids", type=int, nargs="+", metavar="ID")
+    p.set_defaults(funcion=cmd_eliminar)
+
+    p = comandos.add_parser("importar", help="importa un archivo CSV o vCard")
+    p.add_argument("archivo")
+    p.add_argument("--errores", metavar="RUTA", help="CSV con las filas rechazadas y su motivo")
+    p.add_argument("--lote", type=int, default=5000, help="filas por transacción")
+    p.set_defaults(funcion=cmd_importar)
+
+    p = comandos.add_parser("exportar", help="exporta a CSV, JSON Lines o vCard")
+    p.add_argument("destino", nargs="?", help="archivo de salida (por defecto, la salida estándar)")
+    p.add_argument("--formato", choices=("csv", "jsonl", "vcard"))
+    p.add_argument("--filtro", help="exporta solo los contactos que contienen este texto")
+    p.set_defaults(funcion=cmd_exportar)
+
+    p = comandos.add_parser("lote", help="ejecuta comandos leídos de la entrada estándar")
+    p.add_argument("--transaccion", action="store_true", help="todo el lote en una transacción")
+    p.add_argument("--detener", action="store_true", help="se detiene en el primer error")
+    p.set_defaults(funcion=cmd_lote)
+    return parser
+
+
+def ejecutar(args, prefijo: str = "") -> int:
+    """Ejecuta el subcomando de `args` y traduce los errores a códigos de salida."""
+    try:
+        return args.funcion(args)
+    except ErrorEntrada as e:
+        print(f"{prefijo}entrada inválida: {e}", file=sys.stderr)
+        return ENTRADA_INVALIDA
+    except (sqlite3.Error, OSError, ValueError) as e:
+        print(f"{prefijo}error: {e}", file=sys.stderr)
+        return ERROR
+
+
+def main(argv=None) -> int:
+    args = crear_parser().parse_args(argv)
+    if args.db:
+        db.DB_PATH = args.db
+    try:
+        db.crear_tabla()
+        return ejecutar(args)
+    except sqlite3.Error as e:
+        print(f"error: {e}", file=sys.stderr)
+        return ERROR
+    finally:
+        db.cerrar_conexiones()
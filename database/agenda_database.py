@@ -9,11 +9,24 @@ La estructura de la tabla de contactos se define con los siguientes campos:
 - nombre: TEXT NOT NULL
 - telefono: TEXT NOT NULL
 - email: TEXT
+- telefono_norm, email_norm: TEXT, versiones normalizadas de teléfono y email
+  (ver `utils.normalizacion`) que las funciones de escritura mantienen al día.
+
+Las funciones CRUD reutilizan una conexión persistente por hilo (ver
+`database.conexion`); `cerrar_conexiones()` las cierra al terminar la aplicación.
+Cada función pública está decorada con `metricas.medida`, que registra latencias,
+filas y consultas lentas cuando las métricas están activadas (ver `database.metricas`).
 """
 import sqlite3
 import os
 import sys
 
+from database import metricas
+from database.conexion import gestor, cerrar_conexiones
+from database.migraciones import aplicar_migraciones
+from models.contacto import Contacto, ContactoInmutable
+from utils.normalizacion import normalizar_telefono, normalizar_email
+
 
 def resource_path(relative_path):
     """Obtiene la ruta válida tanto en ejecución normal como en PyInstaller."""
@@ -40,74 +53,109 @@ DB_PATH = get_db_path()
 
 
 def get_db_connection():
-    """Establece y devuelve una conexión a la base de datos SQLite.
+    """Establece y devuelve una conexión nueva a la base de datos SQLite.
 
     Configura la conexión para que las filas se devuelvan como objetos `sqlite3.Row`,
-    permitiendo acceder a los campos por nombre de columna.
+    permitiendo acceder a los campos por nombre de columna. El llamador es
+    responsable de cerrarla; las funciones CRUD de este módulo no la usan, sino
+    la conexión persistente del hilo (ver `_conexion`).
 
     Returns:
         sqlite3.Connection: Objeto de conexión a la base de datos 'agenda.db'.
     """
+    metricas.conexion_abierta()
     conn = sqlite3.connect(DB_PATH)
     # Configura el factory para que devuelva filas accesibles por nombre de columna.
     conn.row_factory = sqlite3.Row
     return conn
 
 
+def _conexion():
+    """Devuelve la conexión persistente del hilo actual para `DB_PATH`.
+
+    La conexión se crea y configura una sola vez por hilo (ver
+    `database.conexion`) y se reutiliza en todas las operaciones CRUD, junto con
+    su caché de sentencias preparadas.
+    """
+    return gestor.obtener(DB_PATH)
+
+
+def transaccion():
+    """Abre una transacción en la conexión del hilo actual (un savepoint si ya hay una).
+
+    Las funciones CRUD llamadas dentro del bloque participan en ella: se confirma
+    al salir y se deshace si el bloque lanza una excepción.
+
+    Ejemplo:
+        with transaccion():
+            insertar_contacto("Ana", "3001234567", "ana@ejemplo.com")
+            eliminar_contacto(42)
+    """
+    return _conexion().transaccion()
+
+
+def fila_a_contacto(cursor, fila):
+    """Row factory que construye un `Contacto` directamente desde el cursor.
+
+    Espera las columnas en el orden (id, nombre, telefono, email), que es el que
+    usan todas las consultas de lectura de este módulo.
+    """
+    return Contacto(fila[1], fila[2], fila[3], fila[0])
+
+
+def fila_a_contacto_inmutable(cursor, fila):
+    """Row factory equivalente a `fila_a_contacto` que produce `ContactoInmutable`."""
+    return ContactoInmutable(fila[1], fila[2], fila[3], fila[0])
+
+
+# Row factory usada por las funciones de lectura. Asignar
+# `fila_a_contacto_inmutable` para obtener contactos de solo lectura.
+fabrica_contactos = fila_a_contacto
+
+
+def _consultar_contactos(conn, sql: str, parametros: tuple = ()):
+    """Ejecuta una consulta de contactos con un cursor que devuelve objetos `Contacto`."""
+    cursor = conn.cursor()
+    cursor.row_factory = fabrica_contactos
+    return cursor.execute(sql, parametros)
+
+
 # --- FUNCIONES CORE CRUD (4 Campos: id, nombre, telefono, email) ---
 
 
+@metricas.medida
 def crear_tabla():
-    """Crea la tabla 'contactos' y migra datos si es necesario.
+    """Asegura que el esquema de la base de datos esté al día.
 
-    Esta función asegura que la tabla 'contactos' exista con la estructura de
-    cuatro campos (id, nombre, telefono, email).
+    Delega en el motor de migraciones (`database.migraciones`), que compara la
+    versión guardada en `PRAGMA user_version` con la lista de migraciones y
+    aplica solo las pendientes, una única vez y dentro de una sola transacción.
 
-    Si existe una tabla 'contactos' antigua (potencialmente con un campo 'notas'
-    que ya no se usa), realiza los siguientes pasos de migración:
-    1. Crea una nueva tabla temporal 'contactos_new' con la estructura deseada.
-    2. Copia los datos relevantes (id, nombre, telefono, email) de la antigua a la nueva.
-    3. Elimina la tabla 'contactos' antigua.
-    4. Renombra 'contactos_new' a 'contactos'.
+    La primera migración crea la tabla 'contactos' de cuatro campos (id, nombre,
+    telefono, email) o, si existe una tabla antigua con otra estructura (p. ej.
+    con el campo 'notas'), la reconstruye copiando los datos relevantes.
 
-    Lanza advertencias si ocurren errores operativos durante la migración (ej. la
-    tabla antigua ya no existe o no tiene las columnas esperadas).
+    Con el esquema ya migrado, la llamada solo lee `user_version`, por lo que el
+    coste de arranque no depende del número de contactos.
     """
-    conn = get_db_connection()
-    cursor = conn.cursor()
-    
-    # 1. Intentar crear la nueva tabla con 4 campos
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS contactos_new (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            nombre TEXT NOT NULL,
-            telefono TEXT NOT NULL,
-            email TEXT
-        )
-    """)
-
-    # 2. Verificar si la tabla 'contactos' (la antigua con 'notas') existe
-    cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='contactos'")
-    if cursor.fetchone():
-        try:
-            # 3. Copiar datos relevantes de la tabla antigua a la nueva
-            # Se copian solo las columnas que coinciden con la nueva estructura.
-            cursor.execute("INSERT INTO contactos_new (id, nombre, telefono, email) SELECT id, nombre, telefono, email FROM contactos")
-            
-            # 4. Eliminar la tabla antigua para limpiarla
-            cursor.execute("DROP TABLE contactos")
-            
-        except sqlite3.OperationalError as e:
-            # Captura errores que indican problemas en la estructura de la tabla antigua.
-            print(f"Advertencia durante la migración de tabla: {e}")
-
-    # 5. Renombrar la tabla nueva (y correcta) a 'contactos'
-    cursor.execute("ALTER TABLE contactos_new RENAME TO contactos")
-    
-    conn.commit()
-    conn.close()
+    conn = _conexion()
+    aplicar_migraciones(conn)
+    # El esquema pudo cambiar: se vuelve a comprobar si existe el índice FTS.
+    conn.fts_disponible = None
+
+
+SQL_INSERTAR = (
+    "INSERT INTO contactos (nombre, telefono, email, telefono_norm, email_norm) "
+    "VALUES (?, ?, ?, ?, ?)"
+)
+
 
+def _valores_contacto(nombre: str, telefono: str, email: str) -> tuple:
+    """Valores de una fila con sus columnas normalizadas, en el orden de `SQL_INSERTAR`."""
+    return nombre, telefono, email, normalizar_telefono(telefono), normalizar_email(email)
 
+
+@metricas.medida
 def insertar_contacto(nombre: str, telefono: str, email: str):
     """Inserta un nuevo contacto en la base de datos.
 
@@ -115,49 +163,177 @@ def insertar_contacto(nombre: str, telefono: str, email: str):
         nombre: El nombre completo del contacto.
         telefono: El número de teléfono del contacto.
         email: La dirección de correo electrónico del contacto (opcional, pero se pasa como argumento).
+
+    Returns:
+        int: El ID asignado al nuevo contacto.
     """
-    conn = get_db_connection()
-    cursor = conn.cursor()
-    sql = "INSERT INTO contactos (nombre, telefono, email) VALUES (?, ?, ?)"
-    # Los valores se pasan como una tupla para prevenir inyección SQL.
-    cursor.execute(sql, (nombre, telefono, email))
-    conn.commit()
-    conn.close()
+    with _conexion().transaccion() as conn:
+        # Los valores se pasan como una tupla para prevenir inyección SQL.
+        cursor = conn.execute(SQL_INSERTAR, _valores_contacto(nombre, telefono, email))
+    return cursor.lastrowid
+
+
+# Las búsquedas más cortas que un trigrama no pueden usar el índice FTS5.
+LONGITUD_MINIMA_FTS = 3
+
 
+def _usa_fts(conn) -> bool:
+    """Indica si la base de datos tiene el índice 'contactos_fts' (se cachea por conexión)."""
+    if conn.fts_disponible is None:
+        fila = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type='table' AND name='contactos_fts'"
+        ).fetchone()
+        conn.fts_disponible = fila is not None
+    return conn.fts_disponible
+
+
+def _buscar_fts(conn, texto: str):
+    """Busca por subcadena usando el índice trigram, ordenando por relevancia."""
+    # La búsqueda se expresa como una frase entre comillas para que el texto se
+    # trate literalmente (sin operadores de FTS5).
+    frase = '"' + texto.replace('"', '""') + '"'
+    sql = """
+        SELECT c.id, c.nombre, c.telefono, c.email
+        FROM contactos_fts
+        JOIN contactos AS c ON c.id = contactos_fts.rowid
+        WHERE contactos_fts MATCH ?
+        ORDER BY contactos_fts.rank, c.nombre
+    """
+    return _consultar_contactos(conn, sql, (frase,)).fetchall()
 
+
+def _buscar_like(conn, texto: str):
+    """Busca por subcadena con LIKE (recorrido completo de la tabla)."""
+    busqueda = f"%{texto}%"
+    # Consulta SQL para buscar en nombre, telefono o email.
+    sql = """
+        SELECT id, nombre, telefono, email FROM contactos
+        WHERE nombre LIKE ? OR telefono LIKE ? OR email LIKE ?
+        ORDER BY nombre COLLATE NOCASE, id
+    """
+    return _consultar_contactos(conn, sql, (busqueda, busqueda, busqueda)).fetchall()
+
+
+@metricas.medida
 def obtener_contactos(filtro_busqueda: str = None):
     """Recupera todos los contactos de la base de datos, opcionalmente aplicando un filtro.
 
-    La búsqueda se realiza por coincidencia parcial (LIKE) en los campos 'nombre',
-    'telefono' y 'email'. Los resultados se ordenan por nombre.
+    La búsqueda se realiza por coincidencia parcial en los campos 'nombre',
+    'telefono' y 'email'. Si existe el índice FTS5 'contactos_fts' y el filtro
+    tiene al menos `LONGITUD_MINIMA_FTS` caracteres, se consulta el índice y los
+    resultados se ordenan por relevancia; en otro caso se usa LIKE y se ordenan
+    por nombre. Sin filtro, se devuelven todos ordenados por nombre.
 
     Args:
         filtro_busqueda: Cadena de texto para filtrar los contactos. Si es None
                          o igual a "Buscar contacto...", se devuelven todos los contactos.
 
     Returns:
-        list[sqlite3.Row]: Una lista de objetos Row que representan los contactos.
+        list[Contacto]: Una lista de objetos Contacto.
     """
-    conn = get_db_connection()
-    cursor = conn.cursor()
-    
+    conn = _conexion()
+
     if filtro_busqueda and filtro_busqueda != "Buscar contacto...":
-        busqueda = f"%{filtro_busqueda}%"
-        # Consulta SQL para buscar en nombre, telefono o email.
-        sql = """
-            SELECT id, nombre, telefono, email FROM contactos 
-            WHERE nombre LIKE ? OR telefono LIKE ? OR email LIKE ?
-            ORDER BY nombre
-        """
-        cursor.execute(sql, (busqueda, busqueda, busqueda))
-    else:
-        # Consulta SQL para obtener todos los contactos.
-        sql = "SELECT id, nombre, telefono, email FROM contactos ORDER BY nombre"
-        cursor.execute(sql)
-        
-    return cursor.fetchall()
+        if len(filtro_busqueda) >= LONGITUD_MINIMA_FTS and _usa_fts(conn):
+            return _buscar_fts(conn, filtro_busqueda)
+        return _buscar_like(conn, filtro_busqueda)
+
+    # Consulta SQL para obtener todos los contactos.
+    # El orden coincide con el índice idx_contactos_nombre, por lo que no requiere ordenar.
+    sql = "SELECT id, nombre, telefono, email FROM contactos ORDER BY nombre COLLATE NOCASE, id"
+    return _consultar_contactos(conn, sql).fetchall()
+
+
+def _filtro_sql(conn, filtro_busqueda):
+    """Traduce un texto de búsqueda a una condición WHERE y sus parámetros.
+
+    Usa el índice FTS5 cuando es posible (ver `obtener_contactos`) y LIKE en otro
+    caso. Sin filtro devuelve una condición siempre verdadera.
+    """
+    if not filtro_busqueda or filtro_busqueda == "Buscar contacto...":
+        return "1", ()
+    if len(filtro_busqueda) >= LONGITUD_MINIMA_FTS and _usa_fts(conn):
+        frase = '"' + filtro_busqueda.replace('"', '""') + '"'
+        return "id IN (SELECT rowid FROM contactos_fts WHERE contactos_fts MATCH ?)", (frase,)
+    busqueda = f"%{filtro_busqueda}%"
+    return "(nombre LIKE ? OR telefono LIKE ? OR email LIKE ?)", (busqueda, busqueda, busqueda)
+
+
+@metricas.medida
+def obtener_contactos_pagina(despues_de: tuple = None, tamano_pagina: int = 50,
+                             filtro_busqueda: str = None):
+    """Recupera una página de contactos ordenados por nombre, usando paginación por clave.
+
+    En lugar de OFFSET (que recorre todas las filas anteriores), cada página
+    continúa a partir de la clave (nombre, id) del último contacto de la página
+    anterior, apoyándose en el índice `idx_contactos_nombre`. El coste de cada
+    página es proporcional a su tamaño, no a su posición.
+
+    Args:
+        despues_de: Tupla (nombre, id) del último contacto de la página anterior,
+                    o None para obtener la primera página.
+        tamano_pagina: Número máximo de contactos por página.
+        filtro_busqueda: Texto de búsqueda opcional, con la misma semántica que
+                         en `obtener_contactos`.
+
+    Returns:
+        list[Contacto]: Los contactos de la página (lista vacía al terminar).
+    """
+    conn = _conexion()
+    condicion, parametros = _filtro_sql(conn, filtro_busqueda)
+    if despues_de is not None:
+        # La primera comparación permite al planificador saltar directamente a la
+        # clave en el índice; la segunda desempata por id dentro del mismo nombre.
+        condicion += " AND nombre COLLATE NOCASE >= ? AND (nombre COLLATE NOCASE, id) > (?, ?)"
+        parametros += (despues_de[0], despues_de[0], despues_de[1])
+    sql = f"""
+        SELECT id, nombre, telefono, email FROM contactos
+        WHERE {condicion}
+        ORDER BY nombre COLLATE NOCASE, id
+        LIMIT ?
+    """
+    return _consultar_contactos(conn, sql, parametros + (tamano_pagina,)).fetchall()
 
 
+def clave_pagina(contacto) -> tuple:
+    """Devuelve la clave (nombre, id) de un contacto para pedir la página siguiente."""
+    return contacto.nombre, contacto.id
+
+
+@metricas.medida
+def contar_contactos(filtro_busqueda: str = None) -> int:
+    """Devuelve el número total de contactos (opcionalmente filtrados).
+
+    El resultado se cachea por filtro y por conexión, y se reutiliza mientras los
+    datos no cambien (ver `ConexionAgenda.marca_datos`), de modo que paginar no
+    obliga a recontar la tabla en cada página.
+
+    Args:
+        filtro_busqueda: Texto de búsqueda opcional.
+
+    Returns:
+        int: Número de contactos que cumplen el filtro.
+    """
+    conn = _conexion()
+    marca = conn.marca_datos()
+    if marca != conn.marca_conteos:
+        conn.cache_conteos.clear()
+        conn.marca_conteos = marca
+    clave = filtro_busqueda or None
+    if clave not in conn.cache_conteos:
+        condicion, parametros = _filtro_sql(conn, filtro_busqueda)
+        sql = f"SELECT COUNT(*) FROM contactos WHERE {condicion}"
+        conn.cache_conteos[clave] = conn.execute(sql, parametros).fetchone()[0]
+    return conn.cache_conteos[clave]
+
+
+SQL_ACTUALIZAR = """
+    UPDATE contactos SET nombre = ?, telefono = ?, email = ?, telefono_norm = ?, email_norm = ?
+    WHERE id = ?
+"""
+
+
+@metricas.medida
 def actualizar_contacto(id_contacto: int, nombre: str, telefono: str, email: str):
     """Actualiza los datos de un contacto existente usando su ID.
 
@@ -170,20 +346,13 @@ def actualizar_contacto(id_contacto: int, nombre: str, telefono: str, email: str
     Returns:
         bool: True si al menos una fila fue afectada (el contacto fue actualizado), False en caso contrario.
     """
-    conn = get_db_connection()
-    cursor = conn.cursor()
-    sql = """
-        UPDATE contactos SET nombre = ?, telefono = ?, email = ?
-        WHERE id = ?
-    """
-    # El ID se usa en la cláusula WHERE.
-    cursor.execute(sql, (nombre, telefono, email, id_contacto))
-    conn.commit()
-    rows_affected = cursor.rowcount
-    conn.close()
-    return rows_affected > 0
+    with _conexion().transaccion() as conn:
+        # El ID se usa en la cláusula WHERE.
+        cursor = conn.execute(SQL_ACTUALIZAR, (*_valores_contacto(nombre, telefono, email), id_contacto))
+    return cursor.rowcount > 0
 
 
+@metricas.medida
 def eliminar_contacto(id_contacto: int):
     """Elimina un contacto de la base de datos por su ID.
 
@@ -193,16 +362,122 @@ def eliminar_contacto(id_contacto: int):
     Returns:
         bool: True si el contacto fue eliminado (una fila afectada), False en caso contrario.
     """
-    conn = get_db_connection()
-    cursor = conn.cursor()
     sql = "DELETE FROM contactos WHERE id = ?"
-    cursor.execute(sql, (id_contacto,))
-    conn.commit()
-    rows_affected = cursor.rowcount
-    conn.close()
-    return rows_affected > 0
+    with _conexion().transaccion() as conn:
+        cursor = conn.execute(sql, (id_contacto,))
+    return cursor.rowcount > 0
 
 
+# --- OPERACIONES POR LOTES ---
+
+# Límite de parámetros por sentencia de las versiones de SQLite anteriores a 3.32.
+LIMITE_VARIABLES_POR_DEFECTO = 999
+
+
+def _limite_variables(conn) -> int:
+    """Número máximo de parámetros `?` admitidos en una sentencia por `conn`."""
+    try:
+        return conn.getlimit(sqlite3.SQLITE_LIMIT_VARIABLE_NUMBER)
+    except AttributeError:
+        # `Connection.getlimit` solo existe desde Python 3.11.
+        return LIMITE_VARIABLES_POR_DEFECTO
+
+
+def _trozos(valores: list, tamano: int):
+    """Divide `valores` en listas consecutivas de como máximo `tamano` elementos."""
+    for inicio in range(0, len(valores), tamano):
+        yield valores[inicio:inicio + tamano]
+
+
+def _ids_existentes(conn, ids: list) -> set:
+    """Devuelve cuáles de `ids` existen, con consultas `IN (...)` bajo el límite de variables."""
+    existentes = set()
+    for trozo in _trozos(ids, _limite_variables(conn)):
+        marcas = ", ".join("?" * len(trozo))
+        existentes.update(fila[0] for fila in conn.execute(
+            f"SELECT id FROM contactos WHERE id IN ({marcas})", trozo))
+    return existentes
+
+
+@metricas.medida
+def insertar_contactos(contactos) -> list:
+    """Inserta varios contactos en una sola transacción.
+
+    Args:
+        contactos: Iterable de tuplas (nombre, telefono, email).
+
+    Returns:
+        list: Los IDs asignados, en el mismo orden que `contactos`.
+    """
+    filas = [tuple(contacto) for contacto in contactos]
+    if not filas:
+        return []
+    with _conexion().transaccion() as conn:
+        # Con el bloqueo de escritura tomado, SQLite asigna a cada fila el mayor
+        # ID usado (tabla o sqlite_sequence) más uno, así que los IDs del lote
+        # son consecutivos a partir de ese valor.
+        base = conn.execute(
+            "SELECT max(coalesce((SELECT max(id) FROM contactos), 0), "
+            "coalesce((SELECT seq FROM sqlite_sequence WHERE name = 'contactos'), 0))"
+        ).fetchone()[0]
+        conn.executemany(SQL_INSERTAR, [_valores_contacto(*fila) for fila in filas])
+    return list(range(base + 1, base + 1 + len(filas)))
+
+
+@metricas.medida
+def actualizar_contactos(contactos) -> list:
+    """Actualiza varios contactos en una sola transacción.
+
+    Args:
+        contactos: Iterable de tuplas (id_contacto, nombre, telefono, email).
+
+    Returns:
+        list: Un bool por contacto, True si existía y fue actualizado.
+    """
+    filas = [tuple(contacto) for contacto in contactos]
+    if not filas:
+        return []
+    with _conexion().transaccion() as conn:
+        existentes = _ids_existentes(conn, list({fila[0] for fila in filas}))
+        conn.executemany(
+            SQL_ACTUALIZAR,
+            [(*_valores_contacto(nombre, telefono, email), id_contacto)
+             for id_contacto, nombre, telefono, email in filas],
+        )
+    return [fila[0] in existentes for fila in filas]
+
+
+@metricas.medida
+def eliminar_contactos(ids) -> list:
+    """Elimina varios contactos en una sola transacción.
+
+    Los borrados se agrupan en sentencias `DELETE ... WHERE id IN (...)` que
+    respetan el límite de parámetros de SQLite.
+
+    Args:
+        ids: Iterable de IDs de contactos.
+
+    Returns:
+        list: Un bool por ID, True si el contacto existía y fue eliminado (un ID
+              repetido solo cuenta como eliminado la primera vez).
+    """
+    ids = list(ids)
+    if not ids:
+        return []
+    unicos = list(dict.fromkeys(ids))
+    with _conexion().transaccion() as conn:
+        existentes = _ids_existentes(conn, unicos)
+        for trozo in _trozos(unicos, _limite_variables(conn)):
+            marcas = ", ".join("?" * len(trozo))
+            conn.execute(f"DELETE FROM contactos WHERE id IN ({marcas})", trozo)
+    resultados = []
+    for id_contacto in ids:
+        resultados.append(id_contacto in existentes)
+        existentes.discard(id_contacto)
+    return resultados
+
+
+@metricas.medida
 def obtener_contacto_por_id(id_contacto: int):
     """Recupera un contacto específico usando su ID.
 
@@ -210,12 +485,49 @@ def obtener_contacto_por_id(id_contacto: int):
         id_contacto: El ID del contacto a buscar.
 
     Returns:
-        sqlite3.Row or None: Un objeto Row con los datos del contacto si se encuentra, o None si no existe.
+        Contacto or None: El contacto si se encuentra, o None si no existe.
     """
-    conn = get_db_connection()
-    cursor = conn.cursor()
     sql = "SELECT id, nombre, telefono, email FROM contactos WHERE id = ?"
-    cursor.execute(sql, (id_contacto,))
-    contacto = cursor.fetchone()
-    conn.close()
-    return contacto
\ No newline at end of file
+    return _consultar_contactos(_conexion(), sql, (id_contacto,)).fetchone()
+
+
+@metricas.medida
+def obtener_contacto_por_telefono(telefono: str):
+    """Recupera un contacto por su teléfono, sin importar cómo se escribió.
+
+    El teléfono se normaliza (ver `utils.normalizacion.normalizar_telefono`) y
+    se busca con una consulta puntual sobre el índice de `telefono_norm`, de
+    modo que '300 123 4567' encuentra un contacto guardado como '+573001234567'.
+
+    Args:
+        telefono: El teléfono a buscar.
+
+    Returns:
+        Contacto or None: El contacto con ese teléfono (el de menor ID si hay
+                          varios), o None si no existe.
+    """
+    normalizado = normalizar_telefono(telefono)
+    if normalizado is None:
+        return None
+    sql = ("SELECT id, nombre, telefono, email FROM contactos "
+           "WHERE telefono_norm = ? ORDER BY id LIMIT 1")
+    return _consultar_contactos(_conexion(), sql, (normalizado,)).fetchone()
+
+
+@metricas.medida
+def obtener_contacto_por_email(email: str):
+    """Recupera un contacto por su email, sin distinguir mayúsculas.
+
+    Args:
+        email: El email a buscar.
+
+    Returns:
+        Contacto or None: El contacto con ese email (el de menor ID si hay
+                          varios), o None si no existe.
+    """
+    normalizado = normalizar_email(email)
+    if normalizado is None:
+        return None
+    sql = ("SELECT id, nombre, telefono, email FROM contactos "
+           "WHERE email_norm = ? ORDER BY id LIMIT 1")
+    return _consultar_contactos(_conexion(), sql, (normalizado,)).fetchone()
@@ -0,0 +1,189 @@
+"""Fachada asíncrona (asyncio) de `agenda_database`.
+
+Las funciones de `agenda_database` son bloqueantes; aquí se exponen como
+corrutinas que delegan el trabajo en hilos dedicados, sin bloquear el bucle de
+eventos:
+
+- varios hilos lectores (`EjecutorDB`), cada uno con su conexión; con WAL las
+  lecturas se ejecutan en paralelo y no esperan a las escrituras,
+- un único hilo escritor (`EscritorAgrupado`) que agrupa las escrituras
+  pendientes en una sola transacción.
+
+Cancelar la tarea que espera una operación cancela también la petición si aún
+no ha empezado a ejecutarse; si ya empezó, termina y su resultado se descarta.
+
+Uso típico:
+    async with AgendaAsincrona() as agenda:
+        await agenda.crear_tabla()
+        id_nuevo = await agenda.insertar_contacto("Ana", "3001234567", "")
+        contactos = await agenda.obtener_contactos("Ana")
+
+o, con la instancia compartida del módulo:
+    from database import asincrono as adb
+    contactos = await adb.obtener_contactos("Peña")
+    adb.cerrar()
+"""
+import asyncio
+import threading
+
+from database import agenda_database as db
+from database.ejecutor import EjecutorDB, EscritorAgrupado
+
+
+LECTORES = 4
+MAX_LOTE = 128
+
+
+class AgendaAsincrona:
+    """Acceso asíncrono a la agenda con lectores concurrentes y escrituras agrupadas.
+
+    Args:
+        lectores: Número de hilos lectores.
+        max_lote: Número máximo de escrituras confirmadas en una transacción.
+    """
+    def __init__(self, lectores: int = LECTORES, max_lote: int = MAX_LOTE):
+        if lectores < 1:
+            raise ValueError("Se necesita al menos un hilo lector.")
+        self._lectores = [EjecutorDB(f"agenda-db-lector-{i}") for i in range(lectores)]
+        self._escritor = EscritorAgrupado(max_lote=max_lote)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await asyncio.get_running_loop().run_in_executor(None, self.cerrar)
+
+    def cerrar(self):
+        """Termina las peticiones pendientes, detiene los hilos y cierra sus conexiones."""
+        self._escritor.cerrar()
+        for lector in self._lectores:
+            lector.cerrar()
+
+    def estadisticas(self) -> dict:
+        """Devuelve los contadores del escritor (lotes y escrituras confirmadas)."""
+        return {"lotes": self._escritor.lotes, "escrituras": self._escritor.escrituras}
+
+    # --- Envío de peticiones ---
+
+    def _leer(self, funcion, *args):
+        """Envía una lectura al lector con menos peticiones en cola."""
+        lector = min(self._lectores, key=EjecutorDB.pendientes)
+        return asyncio.wrap_future(lector.enviar(funcion, *args))
+
+    def _escribir(self, funcion, *args):
+        """Envía una escritura al escritor, que la agrupará con las pendientes."""
+        return asyncio.wrap_future(self._escritor.enviar(funcion, *args))
+
+    # --- Esquema ---
+
+    async def crear_tabla(self):
+        """Equivalente asíncrono de `agenda_database.crear_tabla`."""
+        await asyncio.wrap_future(self._escritor.enviar_aislada(db.crear_tabla))
+        # Los lectores vuelven a comprobar si existe el índice FTS.
+        for lector in self._lectores:
+            await asyncio.wrap_future(lector.enviar(_olvidar_fts))
+
+    # --- Lecturas ---
+
+    async def obtener_contactos(self, filtro_busqueda: str = None) -> list:
+        """Equivalente asíncrono de `agenda_database.obtener_contactos`."""
+        return await self._leer(db.obtener_contactos, filtro_busqueda)
+
+    async def obtener_contactos_pagina(self, despues_de: tuple = None, tamano_pagina: int = 50,
+                                       filtro_busqueda: str = None) -> list:
+        """Equivalente asíncrono de `agenda_database.obtener_contactos_pagina`."""
+        return await self._leer(db.obtener_contactos_pagina, despues_de, tamano_pagina,
+                                filtro_busqueda)
+
+    async def contar_contactos(self, filtro_busqueda: str = None) -> int:
+        """Equivalente asíncrono de `agenda_database.contar_contactos`."""
+        return await self._leer(db.contar_contactos, filtro_busqueda)
+
+    async def obtener_contacto_por_id(self, id_contacto: int):
+        """Equivalente asíncrono de `agenda_database.obtener_contacto_por_id`."""
+        return await self._leer(db.obtener_contacto_por_id, id_contacto)
+
+    # --- Escrituras ---
+
+    async def insertar_contacto(self, nombre: str, telefono: str, email: str) -> int:
+        """Equivalente asíncrono de `agenda_database.insertar_contacto`."""
+        return await self._escribir(db.insertar_contacto, nombre, telefono, email)
+
+    async def actualizar_contacto(self, id_contacto: int, nombre: str, telefono: str,
+                                  email: str) -> bool:
+        """Equivalente asíncrono de `agenda_database.actualizar_contacto`."""
+        return await self._escribir(db.actualizar_contacto, id_contacto, nombre, telefono, email)
+
+    async def eliminar_contacto(self, id_contacto: int) -> bool:
+        """Equivalente asíncrono de `agenda_database.eliminar_contacto`."""
+        return await self._escribir(db.eliminar_contacto, id_contacto)
+
+
+def _olvidar_fts():
+    """Descarta la detección de FTS5 cacheada en la conexión del hilo actual."""
+    db._conexion().fts_disponible = None
+
+
+# --- Instancia compartida y funciones de módulo ---
+
+_predeterminada = None
+_lock = threading.Lock()
+
+
+def _agenda() -> AgendaAsincrona:
+    """Devuelve la instancia compartida, creándola en el primer uso."""
+    global _predeterminada
+    with _lock:
+        if _predeterminada is None:
+            _predeterminada = AgendaAsincrona()
+        return _predeterminada
+
+
+def cerrar():
+    """Detiene la instancia compartida, si se llegó a crear."""
+    global _predeterminada
+    with _lock:
+        agenda, _predeterminada = _predeterminada, None
+    if agenda is not None:
+        agenda.cerrar()
+
+
+async def crear_tabla():
+    """Versión de módulo de `AgendaAsincrona.crear_tabla` (instancia compartida)."""
+    return await _agenda().crear_tabla()
+
+
+async def obtener_contactos(filtro_busqueda: str = None) -> list:
+    """Versión de módulo de `AgendaAsincrona.obtener_contactos` (instancia compartida)."""
+    return await _agenda().obtener_contactos(filtro_busqueda)
+
+
+async def obtener_contactos_pagina(despues_de: tuple = None, tamano_pagina: int = 50,
+                                   filtro_busqueda: str = None) -> list:
+    """Versión de módulo de `AgendaAsincrona.obtener_contactos_pagina` (instancia compartida)."""
+    return await _agenda().obtener_contactos_pagina(despues_de, tamano_pagina, filtro_busqueda)
+
+
+async def contar_contactos(filtro_busqueda: str = None) -> int:
+    """Versión de módulo de `AgendaAsincrona.contar_contactos` (instancia compartida)."""
+    return await _agenda().contar_contactos(filtro_busqueda)
+
+
+async def obtener_contacto_por_id(id_contacto: int):
+    """Versión de módulo de `AgendaAsincrona.obtener_contacto_por_id` (instancia compartida)."""
+    return await _agenda().obtener_contacto_por_id(id_contacto)
+
+
+async def insertar_contacto(nombre: str, telefono: str, email: str) -> int:
+    """Versión de módulo de `AgendaAsincrona.insertar_contacto` (instancia compartida)."""
+    return await _agenda().insertar_contacto(nombre, telefono, email)
+
+
+async def actualizar_contacto(id_contacto: int, nombre: str, telefono: str, email: str) -> bool:
+    """Versión de módulo de `AgendaAsincrona.actualizar_contacto` (instancia compartida)."""
+    return await _agenda().actualizar_contacto(id_contacto, nombre, telefono, email)
+
+
+async def eliminar_contacto(id_contacto: int) -> bool:
+    """Versión de módulo de `AgendaAsincrona.eliminar_contacto` (instancia compartida)."""
+    return await _agenda().eliminar_contacto(id_contacto)
@@ -0,0 +1,226 @@
+"""Caché de contactos con escritura directa (write-through) sobre `agenda_database`.
+
+La caché guarda el conjunto completo de contactos (ordenado igual que
+`obtener_contactos()`, respaldado por una `models.agenda.Agenda` para las
+consultas por ID) y un pequeño LRU de resultados de búsqueda. Las escrituras
+hechas a través de la caché se envían a la base de datos y actualizan los datos
+cacheados en sitio, sin recargar la tabla.
+
+Los cambios hechos por otras conexiones (otro proceso u otro hilo) se detectan
+con `PRAGMA data_version`: si cambia, la caché se invalida por completo antes
+de responder.
+
+`revision` cambia cada vez que cambian los datos cacheados (por una escritura o
+una invalidación): dos resultados obtenidos con la misma revisión y el mismo
+filtro son iguales, sin necesidad de compararlos fila a fila.
+"""
+import bisect
+from collections import OrderedDict
+
+from database import agenda_database as db
+from models.agenda import Agenda
+from models.contacto import Contacto
+
+
+# COLLATE NOCASE de SQLite solo pliega las letras ASCII; se replica para que el
+# orden en memoria coincida con `ORDER BY nombre COLLATE NOCASE, id`.
+_NOCASE = str.maketrans("ABCDEFGHIJKLMNOPQRSTUVWXYZ", "abcdefghijklmnopqrstuvwxyz")
+
+
+def _clave_orden(contacto):
+    """Clave de ordenación equivalente a `ORDER BY nombre COLLATE NOCASE, id`."""
+    return contacto.nombre.translate(_NOCASE), contacto.id
+
+
+class CacheContactos:
+    """Caché en memoria del conjunto de contactos, con contadores de aciertos y fallos.
+
+    Args:
+        max_busquedas: Número máximo de resultados de búsqueda que se conservan.
+    """
+    def __init__(self, max_busquedas: int = 32):
+        self.max_busquedas = max_busquedas
+        self._agenda = Agenda()
+        self._lista = None
+        self._busquedas = OrderedDict()
+        self._marca = None
+        self.aciertos = 0
+        self.fallos = 0
+        self.invalidaciones = 0
+        self.revision = 0
+
+    # --- Validez ---
+
+    def _comprobar_version(self):
+        """Invalida la caché si otra conexión modificó la base de datos.
+
+        `PRAGMA data_version` solo es comparable dentro de una misma conexión,
+        así que la marca incluye la identidad de la conexión usada.
+        """
+        conn = db._conexion()
+        marca = (id(conn), conn.execute("PRAGMA data_version").fetchone()[0])
+        if marca != self._marca:
+            if self._marca is not None:
+                self.invalidar()
+            self._marca = marca
+
+    def invalidar(self):
+        """Descarta todos los datos cacheados."""
+        if self._lista is not None or self._busquedas:
+            self.invalidaciones += 1
+        self._lista = None
+        self._agenda = Agenda()
+        self._busquedas.clear()
+        self.revision += 1
+
+    def estadisticas(self) -> dict:
+        """Devuelve los contadores de la caché y su tamaño actual."""
+        return {
+            "aciertos": self.aciertos,
+            "fallos": self.fallos,
+            "invalidaciones": self.invalidaciones,
+            "contactos": len(self._lista) if self._lista is not None else 0,
+            "busquedas": len(self._busquedas),
+        }
+
+    # --- Lecturas ---
+
+    def obtener_contactos(self, filtro_busqueda: str = None) -> list:
+        """Equivalente cacheado de `agenda_database.obtener_contactos`."""
+        self._comprobar_version()
+        if not filtro_busqueda or filtro_busqueda == "Buscar contacto...":
+            if self._lista is None:
+                self.fallos += 1
+                self._lista = db.obtener_contactos()
+                self._agenda.cargar_contactos(self._lista)
+            else:
+                self.aciertos += 1
+            return list(self._lista)
+
+        resultado = self._busquedas.get(filtro_busqueda)
+        if resultado is None:
+            self.fallos += 1
+            resultado = db.obtener_contactos(filtro_busqueda)
+            self._busquedas[filtro_busqueda] = resultado
+            if len(self._busquedas) > self.max_busquedas:
+                self._busquedas.popitem(last=False)
+        else:
+            self.aciertos += 1
+            self._busquedas.move_to_end(filtro_busqueda)
+        return list(resultado)
+
+    def obtener_contacto_por_id(self, id_contacto: int):
+        """Equivalente cacheado de `agenda_database.obtener_contacto_por_id`."""
+        self._comprobar_version()
+        if self._lista is not None:
+            self.aciertos += 1
+            return self._agenda.buscar_por_id(id_contacto)
+        self.fallos += 1
+        return db.obtener_contacto_por_id(id_contacto)
+
+    # --- Escrituras (write-through) ---
+
+    def _quitar_de_lista(self, contacto):
+        """Quita `contacto` de la lista ordenada localizándolo por bisección."""
+        clave = _clave_orden(contacto)
+        i = bisect.bisect_left(self._lista, clave, key=_clave_orden)
+        if i < len(self._lista) and self._lista[i] is contacto:
+            del self._lista[i]
+        else:
+            self._lista.remove(contacto)
+
+    def insertar_contacto(self, nombre: str, telefono: str, email: str) -> int:
+        """Inserta en la base de datos y añade el contacto a la caché."""
+        self._comprobar_version()
+        id_contacto = db.insertar_contacto(nombre, telefono, email)
+        self._busquedas.clear()
+        self.revision += 1
+        if self._lista is not None:
+            contacto = Contacto(nombre, telefono, email, id_contacto)
+            bisect.insort(self._lista, contacto, key=_clave_orden)
+            self._agenda.agregar_contacto(contacto)
+        return id_contacto
+
+    def actualizar_contacto(self, id_contacto: int, nombre: str, telefono: str, email: str) -> bool:
+        """Actualiza en la base de datos y reemplaza el contacto cacheado."""
+        self._comprobar_version()
+        actualizado = db.actualizar_contacto(id_contacto, nombre, telefono, email)
+        self._busquedas.clear()
+        self.revision += 1
+        if actualizado and self._lista is not None:
+            anterior = self._agenda.buscar_por_id(id_contacto)
+            nuevo = Contacto(nombre, telefono, email, id_contacto)
+            if anterior is None:
+                self._agenda.agregar_contacto(nuevo)
+            else:
+                self._quitar_de_lista(anterior)
+                self._agenda.actualizar_contacto(anterior, nuevo)
+            bisect.insort(self._lista, nuevo, key=_clave_orden)
+        return actualizado
+
+    def eliminar_contacto(self, id_contacto: int) -> bool:
+        """Elimina en la base de datos y quita el contacto de la caché."""
+        self._comprobar_version()
+        eliminado = db.eliminar_contacto(id_contacto)
+        self._busquedas.clear()
+        self.revision += 1
+        if eliminado and self._lista is not None:
+            anterior = self._agenda.buscar_por_id(id_contacto)
+            if anterior is not None:
+                self._quitar_de_lista(anterior)
+                self._agenda.eliminar_contacto(anterior)
+        return eliminado
+
+    # --- Escrituras por lotes ---
+
+    def insertar_contactos(self, contactos) -> list:
+        """Inserta varios contactos en una transacción y los añade a la caché."""
+        self._comprobar_version()
+        filas = [tuple(contacto) for contacto in contactos]
+        ids = db.insertar_contactos(filas)
+        self._busquedas.clear()
+        self.revision += 1
+        if self._lista is not None:
+            for id_contacto, (nombre, telefono, email) in zip(ids, filas):
+                contacto = Contacto(nombre, telefono, email, id_contacto)
+                bisect.insort(self._lista, contacto, key=_clave_orden)
+                self._agenda.agregar_contacto(contacto)
+        return ids
+
+    def actualizar_contactos(self, contactos) -> list:
+        """Actualiza varios contactos en una transacción y los reemplaza en la caché."""
+        self._comprobar_version()
+        filas = [tuple(contacto) for contacto in contactos]
+        resultados = db.actualizar_contactos(filas)
+        self._busquedas.clear()
+        self.revision += 1
+        if self._lista is not None:
+            for actualizado, (id_contacto, nombre, telefono, email) in zip(resultados, filas):
+                if not actualizado:
+                    continue
+                anterior = self._agenda.buscar_por_id(id_contacto)
+                nuevo = Contacto(nombre, telefono, email, id_contacto)
+                if anterior is None:
+                    self._agenda.agregar_contacto(nuevo)
+                else:
+                    self._quitar_de_lista(anterior)
+                    self._agenda.actualizar_contacto(anterior, nuevo)
+                bisect.insort(self._lista, nuevo, key=_clave_orden)
+        return resultados
+
+    def eliminar_contactos(self, ids) -> list:
+        """Elimina varios contactos en una transacción y los quita de la caché."""
+        self._comprobar_version()
+        ids = list(ids)
+        resultados = db.eliminar_contactos(ids)
+        self._busquedas.clear()
+        self.revision += 1
+        if self._lista is not None:
+            eliminados = {id_contacto for id_contacto, eliminado in zip(ids, resultados) if eliminado}
+            for id_contacto in eliminados:
+                anterior = self._agenda.buscar_por_id(id_contacto)
+                if anterior is not None:
+                    self._agenda.eliminar_contacto(anterior)
+            # Con muchos borrados es más barato filtrar la lista una vez que quitar uno a uno.
+            self._lista = [c for c in self._lista if c.id not in eliminados]
+        return resultados
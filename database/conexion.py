@@ -0,0 +1,205 @@
+"""Gestión de conexiones persistentes a la base de datos SQLite.
+
+En lugar de abrir y cerrar una conexión en cada operación CRUD, este módulo
+mantiene una conexión de larga duración por hilo y por ruta de base de datos.
+Cada conexión:
+
+- se configura una sola vez al crearse (row_factory y los PRAGMAs de
+  `database.configuracion`),
+- conserva su caché de sentencias preparadas (`cached_statements`), de modo que
+  las consultas repetidas no se vuelven a compilar,
+- trabaja en modo autocommit de la librería (`isolation_level=None`) y delimita
+  sus transacciones de forma explícita con `ConexionAgenda.transaccion()`.
+
+Todas las conexiones abiertas se cierran con `cerrar_conexiones()`, que también
+se registra con `atexit` para un cierre limpio al terminar el proceso.
+
+Con las métricas activadas (`database.metricas`), las conexiones nuevas son
+`ConexionMedida`, que registran cada sentencia ejecutada; sin ellas no se
+añade ningún coste a `execute`.
+"""
+import atexit
+import itertools
+import sqlite3
+import threading
+import time
+import weakref
+from contextlib import contextmanager
+
+from database import metricas
+from database.configuracion import configuracion_para
+
+
+# Número de sentencias preparadas que cada conexión mantiene compiladas.
+SENTENCIAS_EN_CACHE = 256
+
+
+class ConexionAgenda(sqlite3.Connection):
+    """Conexión SQLite con soporte de transacciones anidadas.
+
+    La transacción más externa usa BEGIN/COMMIT; las internas usan SAVEPOINT, de
+    modo que un error en una operación anidada solo deshace esa operación.
+    """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.profundidad_transaccion = 0
+        # Se resuelve la primera vez que se busca (ver agenda_database._usa_fts).
+        self.fts_disponible = None
+        # Conteos cacheados por filtro, válidos mientras no cambie `marca_datos()`.
+        self.cache_conteos = {}
+        self.marca_conteos = None
+
+    def marca_datos(self):
+        """Devuelve una marca que cambia cada vez que se modifican los datos.
+
+        Combina los cambios hechos por esta conexión (`total_changes`) con
+        `PRAGMA data_version`, que cambia cuando otra conexión confirma cambios.
+        """
+        return self.total_changes, self.execute("PRAGMA data_version").fetchone()[0]
+
+    @contextmanager
+    def transaccion(self, inmediata: bool = True):
+        """Abre una transacción (o un savepoint si ya hay una en curso).
+
+        Args:
+            inmediata: Si es True, la transacción externa reserva el bloqueo de
+                       escritura al empezar (BEGIN IMMEDIATE).
+
+        Yields:
+            ConexionAgenda: La propia conexión.
+        """
+        savepoint = None
+        if self.profundidad_transaccion == 0:
+            self.execute("BEGIN IMMEDIATE" if inmediata else "BEGIN")
+        else:
+            savepoint = f"sp_{self.profundidad_transaccion}"
+            self.execute(f"SAVEPOINT {savepoint}")
+        self.profundidad_transaccion += 1
+        try:
+            yield self
+        except BaseException:
+            self.profundidad_transaccion -= 1
+            if savepoint:
+                self.execute(f"ROLLBACK TO {savepoint}")
+                self.execute(f"RELEASE {savepoint}")
+            else:
+                self.rollback()
+            raise
+        else:
+            self.profundidad_transaccion -= 1
+            if savepoint:
+                self.execute(f"RELEASE {savepoint}")
+            else:
+                self.commit()
+
+
+class CursorMedido(sqlite3.Cursor):
+    """Cursor que registra en `database.metricas` cada sentencia que ejecuta."""
+    def execute(self, sql, parametros=()):
+        inicio = time.perf_counter()
+        try:
+            return super().execute(sql, parametros)
+        finally:
+            metricas.registrar_sentencia(sql, parametros, time.perf_counter() - inicio)
+
+    def executemany(self, sql, filas):
+        # Se toma la primera fila para describir los parámetros sin consumir el iterable.
+        filas = iter(filas)
+        primera = next(filas, ())
+        inicio = time.perf_counter()
+        try:
+            return super().executemany(sql, itertools.chain([primera], filas) if primera else [])
+        finally:
+            metricas.registrar_sentencia(sql, primera, time.perf_counter() - inicio,
+                                         filas_afectadas=max(self.rowcount, 0))
+
+
+class ConexionMedida(ConexionAgenda):
+    """`ConexionAgenda` cuyas sentencias se registran en `database.metricas`."""
+    def cursor(self, factory=CursorMedido):
+        return super().cursor(factory)
+
+    def execute(self, sql, parametros=()):
+        return self.cursor().execute(sql, parametros)
+
+    def executemany(self, sql, filas):
+        return self.cursor().executemany(sql, filas)
+
+
+def _configurar_conexion(conn, ruta):
+    """Aplica la configuración de la conexión. Se ejecuta una vez por conexión.
+
+    Los PRAGMAs de almacenamiento (journal_mode, synchronous, cache_size,
+    mmap_size, temp_store y busy_timeout) provienen de `database.configuracion`.
+    """
+    conn.row_factory = sqlite3.Row
+    configuracion_para(ruta).aplicar(conn)
+
+
+def abrir_conexion(ruta: str) -> ConexionAgenda:
+    """Abre y configura una nueva conexión gestionada a la base de datos `ruta`."""
+    metricas.conexion_abierta()
+    conn = sqlite3.connect(
+        ruta,
+        factory=ConexionMedida if metricas.activas() else ConexionAgenda,
+        isolation_level=None,
+        cached_statements=SENTENCIAS_EN_CACHE,
+        check_same_thread=False,
+    )
+    _configurar_conexion(conn, ruta)
+    return conn
+
+
+class GestorConexiones:
+    """Mantiene una conexión persistente por hilo y por ruta de base de datos.
+
+    Las conexiones se guardan en almacenamiento local del hilo, por lo que nunca
+    se comparten entre hilos. Un registro débil permite cerrarlas todas al
+    terminar sin impedir que se liberen las de los hilos que ya finalizaron.
+    """
+    def __init__(self):
+        self._local = threading.local()
+        self._abiertas = weakref.WeakSet()
+        self._lock = threading.Lock()
+
+    def obtener(self, ruta: str) -> ConexionAgenda:
+        """Devuelve la conexión del hilo actual para `ruta`, creándola si no existe."""
+        conexiones = getattr(self._local, "conexiones", None)
+        if conexiones is None:
+            conexiones = self._local.conexiones = {}
+        conn = conexiones.get(ruta)
+        if conn is None:
+            conn = conexiones[ruta] = abrir_conexion(ruta)
+            with self._lock:
+                self._abiertas.add(conn)
+        return conn
+
+    def cerrar_hilo_actual(self):
+        """Cierra las conexiones que pertenecen al hilo actual."""
+        conexiones = getattr(self._local, "conexiones", None) or {}
+        for conn in conexiones.values():
+            with self._lock:
+                self._abiertas.discard(conn)
+            conn.close()
+        conexiones.clear()
+
+    def cerrar_todas(self):
+        """Cierra todas las conexiones abiertas por cualquier hilo."""
+        with self._lock:
+            abiertas = list(self._abiertas)
+            self._abiertas.clear()
+        for conn in abiertas:
+            conn.close()
+        # Las referencias locales del hilo actual quedan obsoletas.
+        self._local = threading.local()
+
+
+gestor = GestorConexiones()
+
+
+def cerrar_conexiones():
+    """Cierra todas las conexiones persistentes. Seguro de llamar varias veces."""
+    gestor.cerrar_todas()
+
+
+atexit.register(cerrar_conexiones)
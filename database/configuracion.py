@@ -0,0 +1,144 @@
+"""Configuración de almacenamiento de SQLite para 'agenda.db'.
+
+Define los PRAGMAs que se aplican una vez a cada conexión nueva (ver
+`database.conexion`). Los valores se toman, por orden de prioridad, de:
+
+1. Variables de entorno `AGENDA_SQLITE_<OPCION>` (p. ej. `AGENDA_SQLITE_SYNCHRONOUS=FULL`).
+2. La sección `[sqlite]` del archivo `agenda.ini` situado junto a la base de datos,
+   o del archivo indicado en la variable de entorno `AGENDA_CONFIG`.
+3. Los valores por defecto de `VALORES_POR_DEFECTO`.
+
+Ejemplo de `agenda.ini`:
+
+    [sqlite]
+    journal_mode = WAL
+    synchronous = NORMAL
+    busy_timeout = 5000
+"""
+import configparser
+import os
+
+
+VALORES_POR_DEFECTO = {
+    # WAL permite lectores concurrentes con un escritor y evita bloqueos entre
+    # la aplicación y los scripts de sincronización.
+    "journal_mode": "WAL",
+    # En modo WAL, NORMAL solo sincroniza en los checkpoints: la base de datos
+    # sigue siendo consistente ante un corte, pero sin un fsync por commit.
+    "synchronous": "NORMAL",
+    # Tamaño de la caché de páginas; un valor negativo se expresa en KiB.
+    "cache_size": -20000,
+    # Bytes de la base de datos accedidos mediante mmap (0 lo desactiva).
+    "mmap_size": 64 * 1024 * 1024,
+    "temp_store": "MEMORY",
+    # Milisegundos que una conexión espera a un bloqueo antes de fallar con
+    # "database is locked".
+    "busy_timeout": 5000,
+}
+
+_VALORES_PERMITIDOS = {
+    "journal_mode": ("DELETE", "TRUNCATE", "PERSIST", "MEMORY", "WAL", "OFF"),
+    "synchronous": ("OFF", "NORMAL", "FULL", "EXTRA"),
+    "temp_store": ("DEFAULT", "FILE", "MEMORY"),
+}
+
+_OPCIONES_ENTERAS = ("cache_size", "mmap_size", "busy_timeout")
+
+NOMBRE_ARCHIVO = "agenda.ini"
+PREFIJO_ENTORNO = "AGENDA_SQLITE_"
+
+
+class ConfiguracionAlmacenamiento:
+    """Conjunto validado de PRAGMAs de almacenamiento.
+
+    Args:
+        **opciones: Valores que sustituyen a los de `VALORES_POR_DEFECTO`.
+
+    Raises:
+        ValueError: Si una opción no existe o su valor no es válido.
+    """
+    def __init__(self, **opciones):
+        valores = dict(VALORES_POR_DEFECTO)
+        for clave, valor in opciones.items():
+            if clave not in VALORES_POR_DEFECTO:
+                raise ValueError(f"Opción de almacenamiento desconocida: {clave}")
+            valores[clave] = valor
+        for clave in _OPCIONES_ENTERAS:
+            try:
+                valores[clave] = int(valores[clave])
+            except (TypeError, ValueError):
+                raise ValueError(f"'{clave}' debe ser un entero: {valores[clave]!r}") from None
+        for clave, permitidos in _VALORES_PERMITIDOS.items():
+            valores[clave] = str(valores[clave]).upper()
+            if valores[clave] not in permitidos:
+                raise ValueError(f"Valor no válido para '{clave}': {valores[clave]}")
+        self.valores = valores
+        self.journal_mode = valores["journal_mode"]
+        self.synchronous = valores["synchronous"]
+        self.cache_size = valores["cache_size"]
+        self.mmap_size = valores["mmap_size"]
+        self.temp_store = valores["temp_store"]
+        self.busy_timeout = valores["busy_timeout"]
+
+    def __repr__(self) -> str:
+        opciones = ", ".join(f"{k}={v!r}" for k, v in self.valores.items())
+        return f"ConfiguracionAlmacenamiento({opciones})"
+
+    def aplicar(self, conn):
+        """Aplica los PRAGMAs a una conexión recién abierta.
+
+        `busy_timeout` se aplica primero para que el cambio de `journal_mode`
+        también espere si otra conexión tiene la base de datos bloqueada.
+        """
+        conn.execute(f"PRAGMA busy_timeout = {self.busy_timeout}")
+        conn.execute(f"PRAGMA journal_mode = {self.journal_mode}")
+        conn.execute(f"PRAGMA synchronous = {self.synchronous}")
+        conn.execute(f"PRAGMA cache_size = {self.cache_size}")
+        conn.execute(f"PRAGMA mmap_size = {self.mmap_size}")
+        conn.execute(f"PRAGMA temp_store = {self.temp_store}")
+
+
+def cargar_configuracion(ruta_db: str) -> ConfiguracionAlmacenamiento:
+    """Construye la configuración para la base de datos `ruta_db`.
+
+    Lee el archivo de `AGENDA_CONFIG` o, si no está definida, el `agenda.ini`
+    del directorio de la base de datos (si existe), y después las variables de
+    entorno `AGENDA_SQLITE_*`.
+    """
+    opciones = {}
+    ruta_archivo = os.environ.get("AGENDA_CONFIG") or os.path.join(
+        os.path.dirname(os.path.abspath(ruta_db)), NOMBRE_ARCHIVO
+    )
+    if os.path.isfile(ruta_archivo):
+        parser = configparser.ConfigParser()
+        parser.read(ruta_archivo, encoding="utf-8")
+        if parser.has_section("sqlite"):
+            opciones.update(parser.items("sqlite"))
+
+    for clave in VALORES_POR_DEFECTO:
+        valor = os.environ.get(PREFIJO_ENTORNO + clave.upper())
+        if valor is not None:
+            opciones[clave] = valor
+    return ConfiguracionAlmacenamiento(**opciones)
+
+
+_configuraciones = {}
+
+
+def configuracion_para(ruta_db: str) -> ConfiguracionAlmacenamiento:
+    """Devuelve (cacheada) la configuración aplicable a la base de datos `ruta_db`."""
+    configuracion = _configuraciones.get(ruta_db)
+    if configuracion is None:
+        configuracion = _configuraciones[ruta_db] = cargar_configuracion(ruta_db)
+    return configuracion
+
+
+def establecer_configuracion(ruta_db: str, configuracion: ConfiguracionAlmacenamiento = None):
+    """Fija la configuración de `ruta_db` por código (None vuelve a leerla del entorno).
+
+    Solo afecta a las conexiones que se abran a partir de ese momento.
+    """
+    if configuracion is None:
+        _configuraciones.pop(ruta_db, None)
+    else:
+        _configuraciones[ruta_db] = configuracion
@@ -0,0 +1,299 @@
+"""Detección y fusión de contactos duplicados.
+
+Comparar todos los pares de contactos es O(n²). En su lugar, los contactos se
+reparten en bloques por claves baratas y solo se comparan dentro de cada bloque:
+
+- mismo teléfono normalizado (`telefono_norm`),
+- mismo email normalizado (`email_norm`),
+- mismas iniciales del nombre (`get_initials`): dentro del bloque los contactos
+  se ordenan por nombre y cada uno solo se compara con los `ventana` siguientes
+  (vecindario ordenado), de modo que el coste es O(n · ventana).
+
+Cada par candidato recibe una puntuación entre 0 y 1 que combina la similitud del
+nombre (`difflib`) con la coincidencia de teléfono y email. Los pares que superan
+el umbral se agrupan (un duplicado de un duplicado pertenece al mismo grupo) y
+cada grupo es una `SugerenciaFusion`. Los bloques se puntúan en paralelo en
+varios procesos.
+
+Uso típico:
+    for sugerencia in buscar_duplicados():
+        print(sugerencia)
+        fusionar_contactos(sugerencia.principal_id, sugerencia.duplicados_ids)
+"""
+import os
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from difflib import SequenceMatcher
+
+from database import agenda_database as db
+from database import metricas
+from utils.normalizacion import normalizar_nombre, get_initials
+
+
+UMBRAL = 0.75
+VENTANA = 5
+# Registros por tarea enviada a cada proceso.
+TAMANO_TAREA = 50_000
+# En bloques de teléfono/email mayores (p. ej. un conmutador compartido) no se
+# comparan todos los pares sino un vecindario ordenado por nombre.
+MAXIMO_BLOQUE_COMPLETO = 50
+
+# Pesos de la puntuación; su suma supera 1 y el resultado se acota a 1.
+PESO_NOMBRE = 0.5
+PESO_TELEFONO = 0.35
+PESO_EMAIL = 0.35
+# Fracción del peso cuando la coincidencia es parcial (mismos 7 últimos dígitos
+# del teléfono o misma parte local del email).
+PARCIAL = 0.6
+
+
+class SugerenciaFusion:
+    """Grupo de contactos que probablemente son la misma persona.
+
+    Attributes:
+        ids: IDs del grupo, en orden creciente.
+        principal_id: Contacto que se propone conservar (el más antiguo).
+        duplicados_ids: Los demás IDs del grupo.
+        puntuacion: Mayor puntuación entre los pares del grupo.
+    """
+    def __init__(self, ids, puntuacion):
+        self.ids = sorted(ids)
+        self.principal_id = self.ids[0]
+        self.duplicados_ids = self.ids[1:]
+        self.puntuacion = puntuacion
+
+    def contactos(self) -> list:
+        """Carga los `Contacto` del grupo desde la base de datos (el principal primero)."""
+        return [c for c in map(db.obtener_contacto_por_id, self.ids) if c is not None]
+
+    def __repr__(self):
+        return f"SugerenciaFusion(ids={self.ids!r}, puntuacion={self.puntuacion:.2f})"
+
+
+# --- PUNTUACIÓN (se ejecuta en los procesos de trabajo) ---
+
+def _registro(id_contacto, nombre, telefono_norm, email_norm):
+    """Tupla compacta con los datos que usa la puntuación de un contacto."""
+    clave = normalizar_nombre(nombre)
+    return (id_contacto, clave, telefono_norm, email_norm,
+            telefono_norm[-7:] if telefono_norm else None,
+            email_norm.split("@", 1)[0] if email_norm else None)
+
+
+def _puntuar(a, b, umbral):
+    """Puntuación de similitud de dos registros, o None si no alcanza `umbral`."""
+    if a[2] and a[2] == b[2]:
+        telefono = PESO_TELEFONO
+    elif a[4] and a[4] == b[4]:
+        telefono = PESO_TELEFONO * PARCIAL
+    else:
+        telefono = 0.0
+    if a[3] and a[3] == b[3]:
+        email = PESO_EMAIL
+    elif a[5] and a[5] == b[5]:
+        email = PESO_EMAIL * PARCIAL
+    else:
+        email = 0.0
+
+    # Cotas superiores de la similitud del nombre, de la más barata a la exacta:
+    # la mayoría de pares se descartan sin llegar a `ratio()`.
+    base = telefono + email
+    if base + PESO_NOMBRE < umbral:
+        return None
+    if a[1] == b[1]:
+        return min(1.0, base + PESO_NOMBRE)
+    comparador = SequenceMatcher(None, a[1], b[1], autojunk=False)
+    for cota in (comparador.real_quick_ratio, comparador.quick_ratio, comparador.ratio):
+        puntuacion = base + PESO_NOMBRE * cota()
+        if puntuacion < umbral:
+            return None
+    return min(1.0, puntuacion)
+
+
+def _pares_vecindario(registros, ventana, umbral, pares):
+    """Compara cada registro (ordenados por nombre) con los `ventana` siguientes."""
+    for i, a in enumerate(registros):
+        for b in registros[i + 1:i + 1 + ventana]:
+            puntuacion = _puntuar(a, b, umbral)
+            if puntuacion is not None:
+                pares.append((a[0], b[0], puntuacion))
+
+
+def _pares_completos(registros, umbral, pares):
+    """Compara todos los pares de un bloque pequeño."""
+    for i, a in enumerate(registros):
+        for b in registros[i + 1:]:
+            puntuacion = _puntuar(a, b, umbral)
+            if puntuacion is not None:
+                pares.append((a[0], b[0], puntuacion))
+
+
+def _puntuar_bloques(bloques, ventana, umbral):
+    """Tarea de proceso: devuelve los pares (id_a, id_b, puntuación) de `bloques`."""
+    pares = []
+    for exhaustivo, registros in bloques:
+        if exhaustivo and len(registros) <= MAXIMO_BLOQUE_COMPLETO:
+            _pares_completos(registros, umbral, pares)
+        else:
+            registros.sort(key=lambda r: r[1])
+            _pares_vecindario(registros, ventana, umbral, pares)
+    return pares
+
+
+# --- BLOQUEO Y AGRUPACIÓN ---
+
+def _leer_registros():
+    """Lee de la base de datos los registros de puntuación de todos los contactos."""
+    cursor = db._conexion().cursor()
+    # Tuplas simples: no hace falta construir objetos Contacto para un millón de filas.
+    cursor.row_factory = None
+    cursor.execute("SELECT id, nombre, telefono_norm, email_norm FROM contactos")
+    try:
+        return [_registro(*fila) for fila in cursor]
+    finally:
+        cursor.close()
+
+
+def _bloques(registros):
+    """Reparte los registros en bloques por iniciales, teléfono y email.
+
+    Returns:
+        list: Tuplas (exhaustivo, registros). Los bloques por teléfono y email
+              (exhaustivos) solo se incluyen si tienen más de un registro.
+    """
+    por_iniciales = defaultdict(list)
+    por_telefono = defaultdict(list)
+    por_email = defaultdict(list)
+    for registro in registros:
+        por_iniciales[get_initials(registro[1])].append(registro)
+        if registro[2]:
+            por_telefono[registro[2]].append(registro)
+        if registro[3]:
+            por_email[registro[3]].append(registro)
+
+    bloques = [(False, grupo) for grupo in por_iniciales.values() if len(grupo) > 1]
+    for indice in (por_telefono, por_email):
+        bloques.extend((True, grupo) for grupo in indice.values() if len(grupo) > 1)
+    return bloques
+
+
+def _tareas(bloques, tamano_tarea, ventana):
+    """Agrupa los bloques en tareas de unos `tamano_tarea` registros.
+
+    Los bloques mayores que una tarea (p. ej. unas iniciales muy comunes) se
+    dividen en tramos ordenados que se solapan en `ventana` registros, para no
+    perder comparaciones en los bordes.
+    """
+    tarea, tamano = [], 0
+    for exhaustivo, registros in bloques:
+        if len(registros) > tamano_tarea and not exhaustivo:
+            registros.sort(key=lambda r: r[1])
+            for inicio in range(0, len(registros), tamano_tarea):
+                yield [(False, registros[inicio:inicio + tamano_tarea + ventana])]
+            continue
+        tarea.append((exhaustivo, registros))
+        tamano += len(registros)
+        if tamano >= tamano_tarea:
+            yield tarea
+            tarea, tamano = [], 0
+    if tarea:
+        yield tarea
+
+
+def _agrupar(pares):
+    """Une los pares en grupos conexos (union-find) con su mayor puntuación."""
+    padre = {}
+
+    def raiz(x):
+        padre.setdefault(x, x)
+        while padre[x] != x:
+            padre[x] = padre[padre[x]]
+            x = padre[x]
+        return x
+
+    for a, b, _ in pares:
+        ra, rb = raiz(a), raiz(b)
+        if ra != rb:
+            padre[max(ra, rb)] = min(ra, rb)
+
+    miembros = defaultdict(set)
+    puntuaciones = defaultdict(float)
+    for a, b, puntuacion in pares:
+        r = raiz(a)
+        miembros[r].update((a, b))
+        puntuaciones[r] = max(puntuaciones[r], puntuacion)
+    return [SugerenciaFusion(ids, puntuaciones[r]) for r, ids in miembros.items()]
+
+
+@metricas.medida
+def buscar_duplicados(umbral: float = UMBRAL, ventana: int = VENTANA, procesos: int = None,
+                      tamano_tarea: int = TAMANO_TAREA) -> list:
+    """Busca grupos de contactos duplicados en toda la agenda.
+
+    Args:
+        umbral: Puntuación mínima (0 a 1) para considerar duplicado un par.
+        ventana: Vecinos con los que se compara cada contacto en los bloques
+                 por iniciales.
+        procesos: Número de procesos de trabajo (por defecto, uno por núcleo).
+                  Con 1 todo se calcula en el proceso actual.
+        tamano_tarea: Registros por tarea enviada a cada proceso.
+
+    Returns:
+        list[SugerenciaFusion]: Sugerencias ordenadas de mayor a menor puntuación.
+    """
+    bloques = _bloques(_leer_registros())
+    procesos = procesos or os.cpu_count() or 1
+
+    pares = []
+    if procesos == 1:
+        for tarea in _tareas(bloques, tamano_tarea, ventana):
+            pares.extend(_puntuar_bloques(tarea, ventana, umbral))
+    else:
+        with ProcessPoolExecutor(max_workers=procesos) as pool:
+            futuros = [pool.submit(_puntuar_bloques, tarea, ventana, umbral)
+                       for tarea in _tareas(bloques, tamano_tarea, ventana)]
+            for futuro in futuros:
+                pares.extend(futuro.result())
+
+    sugerencias = _agrupar(pares)
+    sugerencias.sort(key=lambda s: (-s.puntuacion, s.principal_id))
+    return sugerencias
+
+
+# --- FUSIÓN ---
+
+@metricas.medida
+def fusionar_contactos(id_principal: int, ids_duplicados, nombre: str = None,
+                       telefono: str = None, email: str = None):
+    """Fusiona varios contactos en uno, en una sola transacción.
+
+    El contacto principal se conserva; los campos que se indiquen lo
+    sobrescriben y, si no tiene email, toma el primero disponible entre los
+    duplicados. Después los duplicados se eliminan.
+
+    Args:
+        id_principal: ID del contacto que se conserva.
+        ids_duplicados: IDs de los contactos que se eliminan.
+        nombre, telefono, email: Valores opcionales para el contacto resultante.
+
+    Returns:
+        Contacto: El contacto fusionado.
+
+    Raises:
+        ValueError: Si el contacto principal no existe.
+    """
+    ids_duplicados = [i for i in ids_duplicados if i != id_principal]
+    with db._conexion().transaccion():
+        principal = db.obtener_contacto_por_id(id_principal)
+        if principal is None:
+            raise ValueError(f"No existe el contacto principal {id_principal}.")
+        duplicados = [c for c in map(db.obtener_contacto_por_id, ids_duplicados) if c is not None]
+
+        if email is None:
+            email = principal.email or next((c.email for c in duplicados if c.email), principal.email)
+        nombre = nombre if nombre is not None else principal.nombre
+        telefono = telefono if telefono is not None else principal.telefono
+
+        db.actualizar_contacto(id_principal, nombre, telefono, email)
+        db.eliminar_contactos([c.id for c in duplicados])
+    return db.obtener_contacto_por_id(id_principal)
@@ -0,0 +1,201 @@
+"""Ejecutor de operaciones de base de datos en un hilo dedicado.
+
+Un `EjecutorDB` arranca un único hilo de trabajo que consume una cola de
+peticiones. Como las funciones de `agenda_database` usan la conexión del hilo
+que las ejecuta, ese hilo es el dueño de su conexión: todas las operaciones
+enviadas al ejecutor comparten la misma conexión y se ejecutan en orden de
+llegada. Cada petición devuelve un `concurrent.futures.Future`.
+
+`EscritorAgrupado` es la variante para escrituras: agrupa las peticiones que
+encuentra en cola y las confirma en una sola transacción, cada una dentro de su
+propio savepoint, de modo que el fallo de una no deshace las demás.
+
+Uso típico:
+    ejecutor = EjecutorDB()
+    futuro = ejecutor.enviar(db.obtener_contactos, "Peña")
+    contactos = futuro.result()
+    ejecutor.cerrar()
+"""
+import queue
+import threading
+from concurrent.futures import Future
+
+from database import agenda_database as db
+from database.conexion import gestor
+
+
+class EjecutorDB:
+    """Hilo de trabajo que ejecuta en serie las funciones de base de datos recibidas.
+
+    Args:
+        nombre: Nombre del hilo (útil al depurar).
+    """
+    _FIN = object()
+
+    def __init__(self, nombre: str = "agenda-db"):
+        self._cola = queue.SimpleQueue()
+        self._cerrado = False
+        self._lock = threading.Lock()
+        self._hilo = threading.Thread(target=self._bucle, name=nombre, daemon=True)
+        self._hilo.start()
+
+    def enviar(self, funcion, *args, **kwargs) -> Future:
+        """Encola `funcion(*args, **kwargs)` y devuelve el futuro de su resultado.
+
+        Raises:
+            RuntimeError: Si el ejecutor ya se cerró.
+        """
+        futuro = Future()
+        with self._lock:
+            if self._cerrado:
+                raise RuntimeError("El ejecutor de base de datos está cerrado.")
+            self._cola.put((futuro, funcion, args, kwargs))
+        return futuro
+
+    def cerrar(self, esperar: bool = True):
+        """Deja de aceptar peticiones; el hilo termina tras procesar las pendientes.
+
+        Args:
+            esperar: Si es True, bloquea hasta que el hilo haya terminado.
+        """
+        with self._lock:
+            if self._cerrado:
+                return
+            self._cerrado = True
+            self._cola.put(self._FIN)
+        if esperar:
+            self._hilo.join()
+
+    def en_hilo_trabajo(self) -> bool:
+        """Indica si el código actual se ejecuta en el hilo del ejecutor."""
+        return threading.current_thread() is self._hilo
+
+    def pendientes(self) -> int:
+        """Número aproximado de peticiones en cola (sin contar la que está en curso)."""
+        return self._cola.qsize()
+
+    def _bucle(self):
+        """Procesa peticiones hasta recibir la señal de fin y cierra su conexión."""
+        try:
+            while True:
+                peticion = self._cola.get()
+                if peticion is self._FIN:
+                    return
+                futuro, funcion, args, kwargs = peticion
+                # Las peticiones canceladas antes de empezar se descartan.
+                if not futuro.set_running_or_notify_cancel():
+                    continue
+                try:
+                    resultado = funcion(*args, **kwargs)
+                except BaseException as error:
+                    futuro.set_exception(error)
+                else:
+                    futuro.set_result(resultado)
+        finally:
+            gestor.cerrar_hilo_actual()
+
+
+class EscritorAgrupado(EjecutorDB):
+    """Ejecutor de escrituras que confirma en una transacción todo lo que hay en cola.
+
+    Cada petición se ejecuta en un savepoint dentro de la transacción del lote:
+    si falla, solo se deshace ella y su futuro recibe la excepción. Los futuros
+    se resuelven después del COMMIT, así que un resultado nunca describe datos
+    sin confirmar. Las funciones que gestionan su propia transacción externa
+    (como `crear_tabla`) deben enviarse con `enviar_aislada`.
+
+    Args:
+        nombre: Nombre del hilo.
+        max_lote: Número máximo de peticiones por transacción.
+    """
+    def __init__(self, nombre: str = "agenda-db-escritor", max_lote: int = 128):
+        self.max_lote = max_lote
+        self.lotes = 0
+        self.escrituras = 0
+        super().__init__(nombre)
+
+    def enviar(self, funcion, *args, **kwargs) -> Future:
+        """Encola una escritura que se agrupará con las demás pendientes."""
+        return self._encolar(True, funcion, args, kwargs)
+
+    def enviar_aislada(self, funcion, *args, **kwargs) -> Future:
+        """Encola una operación que se ejecuta sola y fuera de cualquier transacción."""
+        return self._encolar(False, funcion, args, kwargs)
+
+    def _encolar(self, agrupable, funcion, args, kwargs) -> Future:
+        """Encola la petición marcando si puede compartir transacción con otras."""
+        futuro = Future()
+        with self._lock:
+            if self._cerrado:
+                raise RuntimeError("El ejecutor de base de datos está cerrado.")
+            self._cola.put((futuro, funcion, args, kwargs, agrupable))
+        return futuro
+
+    def _bucle(self):
+        """Extrae lotes de la cola hasta recibir la señal de fin y cierra su conexión."""
+        try:
+            fin = False
+            while not fin:
+                lote = []
+                peticion = self._cola.get()
+                while True:
+                    if peticion is self._FIN:
+                        fin = True
+                        break
+                    if not peticion[4]:
+                        # Una operación aislada cierra el lote en curso.
+                        self._ejecutar_lote(lote)
+                        lote = []
+                        self._ejecutar_aislada(peticion)
+                    else:
+                        lote.append(peticion)
+                    if len(lote) >= self.max_lote:
+                        break
+                    try:
+                        peticion = self._cola.get_nowait()
+                    except queue.Empty:
+                        break
+                self._ejecutar_lote(lote)
+        finally:
+            gestor.cerrar_hilo_actual()
+
+    @staticmethod
+    def _ejecutar_aislada(peticion):
+        """Ejecuta una petición no agrupable tal cual, como lo haría `EjecutorDB`."""
+        futuro, funcion, args, kwargs, _ = peticion
+        if not futuro.set_running_or_notify_cancel():
+            return
+        try:
+            resultado = funcion(*args, **kwargs)
+        except BaseException as error:
+            futuro.set_exception(error)
+        else:
+            futuro.set_result(resultado)
+
+    def _ejecutar_lote(self, lote):
+        """Ejecuta `lote` en una transacción y resuelve sus futuros tras el COMMIT."""
+        activas = [p for p in lote if p[0].set_running_or_notify_cancel()]
+        if not activas:
+            return
+        resultados = []
+        try:
+            with db._conexion().transaccion() as conn:
+                for futuro, funcion, args, kwargs, _ in activas:
+                    try:
+                        with conn.transaccion():
+                            resultados.append((futuro, None, funcion(*args, **kwargs)))
+                    except Exception as error:
+                        resultados.append((futuro, error, None))
+        except BaseException as error:
+            # Falló el BEGIN o el COMMIT: nada del lote quedó guardado.
+            for futuro, *_ in activas:
+                futuro.set_exception(error)
+            return
+
+        self.lotes += 1
+        self.escrituras += len(activas)
+        for futuro, error, resultado in resultados:
+            if error is None:
+                futuro.set_result(resultado)
+            else:
+                futuro.set_exception(error)
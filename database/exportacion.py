@@ -0,0 +1,141 @@
+"""Exportación masiva de contactos a CSV, JSON Lines y vCard.
+
+Los contactos se leen del cursor por bloques con `fetchmany` y se escriben de
+forma incremental en el destino (un archivo o la salida estándar), por lo que la
+memoria usada no depende del tamaño de la tabla.
+
+Uso típico:
+    exportar("contactos.csv")                         # formato según la extensión
+    exportar(sys.stdout, formato="jsonl", filtro_busqueda="Peña")
+"""
+import csv
+import json
+import os
+import sys
+
+from database import agenda_database as db
+from database import metricas
+
+
+TAMANO_BLOQUE = 1000
+FORMATOS = ("csv", "jsonl", "vcard")
+COLUMNAS = ("id", "nombre", "telefono", "email")
+
+
+def iterar_contactos(filtro_busqueda: str = None, tamano_bloque: int = TAMANO_BLOQUE):
+    """Recorre los contactos ordenados por nombre sin cargarlos todos en memoria.
+
+    Args:
+        filtro_busqueda: Texto de búsqueda opcional (misma semántica que
+                         `agenda_database.obtener_contactos`).
+        tamano_bloque: Número de filas pedidas al cursor en cada `fetchmany`.
+
+    Yields:
+        Contacto: Cada contacto, en orden de nombre.
+    """
+    conn = db._conexion()
+    condicion, parametros = db._filtro_sql(conn, filtro_busqueda)
+    cursor = db._consultar_contactos(
+        conn,
+        f"SELECT id, nombre, telefono, email FROM contactos WHERE {condicion} "
+        "ORDER BY nombre COLLATE NOCASE, id",
+        parametros,
+    )
+    try:
+        while True:
+            bloque = cursor.fetchmany(tamano_bloque)
+            if not bloque:
+                return
+            yield from bloque
+    finally:
+        cursor.close()
+
+
+# --- ESCRITORES ---
+
+def escribir_csv(contactos, salida) -> int:
+    """Escribe los contactos en CSV (con cabecera) y devuelve cuántos se escribieron."""
+    escritor = csv.writer(salida)
+    escritor.writerow(COLUMNAS)
+    total = 0
+    for contacto in contactos:
+        escritor.writerow((contacto.id, contacto.nombre, contacto.telefono, contacto.email or ""))
+        total += 1
+    return total
+
+
+def escribir_jsonl(contactos, salida) -> int:
+    """Escribe un objeto JSON por línea y devuelve cuántos contactos se escribieron."""
+    total = 0
+    for contacto in contactos:
+        salida.write(json.dumps(
+            {"id": contacto.id, "nombre": contacto.nombre,
+             "telefono": contacto.telefono, "email": contacto.email},
+            ensure_ascii=False,
+        ))
+        salida.write("\n")
+        total += 1
+    return total
+
+
+def _escapar_vcard(valor: str) -> str:
+    """Escapa un texto para una propiedad vCard (barras, comas, puntos y coma, saltos)."""
+    return (valor.replace("\\", "\\\\").replace(",", "\\,").replace(";", "\\;")
+            .replace("\r\n", "\\n").replace("\n", "\\n"))
+
+
+def escribir_vcard(contactos, salida) -> int:
+    """Escribe una tarjeta vCard 3.0 por contacto y devuelve cuántas se escribieron."""
+    total = 0
+    for contacto in contactos:
+        nombre = _escapar_vcard(contacto.nombre)
+        lineas = ["BEGIN:VCARD", "VERSION:3.0", f"FN:{nombre}", f"N:;{nombre};;;",
+                  f"TEL;TYPE=CELL:{_escapar_vcard(contacto.telefono)}"]
+        if contacto.email:
+            lineas.append(f"EMAIL;TYPE=INTERNET:{_escapar_vcard(contacto.email)}")
+        lineas.append("END:VCARD")
+        salida.write("\r\n".join(lineas))
+        salida.write("\r\n")
+        total += 1
+    return total
+
+
+_ESCRITORES = {
+    "csv": escribir_csv,
+    "jsonl": escribir_jsonl,
+    "vcard": escribir_vcard,
+}
+
+_EXTENSIONES = {".csv": "csv", ".jsonl": "jsonl", ".ndjson": "jsonl", ".vcf": "vcard", ".vcard": "vcard"}
+
+
+@metricas.medida
+def exportar(destino=None, formato: str = None, filtro_busqueda: str = None,
+             tamano_bloque: int = TAMANO_BLOQUE) -> int:
+    """Exporta los contactos a un archivo o flujo de texto.
+
+    Args:
+        destino: Ruta del archivo, objeto de archivo de texto abierto, o None
+                 para escribir en la salida estándar.
+        formato: 'csv', 'jsonl' o 'vcard'. Si es None se deduce de la extensión
+                 de `destino` (o se usa 'csv').
+        filtro_busqueda: Texto de búsqueda opcional para exportar solo coincidencias.
+        tamano_bloque: Filas leídas por cada `fetchmany`.
+
+    Returns:
+        int: Número de contactos exportados.
+    """
+    if formato is None:
+        extension = os.path.splitext(destino)[1].lower() if isinstance(destino, str) else ""
+        formato = _EXTENSIONES.get(extension, "csv")
+    if formato not in _ESCRITORES:
+        raise ValueError(f"Formato de exportación no soportado: {formato}")
+
+    escritor = _ESCRITORES[formato]
+    contactos = iterar_contactos(filtro_busqueda, tamano_bloque)
+    if destino is None:
+        return escritor(contactos, sys.stdout)
+    if isinstance(destino, str):
+        with open(destino, "w", newline="", encoding="utf-8") as salida:
+            return escritor(contactos, salida)
+    return escritor(contactos, destino)
@@ -0,0 +1,251 @@
+"""Importación masiva de contactos desde archivos CSV y vCard.
+
+Los archivos se leen en streaming (fila a fila), por lo que pueden ser más
+grandes que la memoria disponible. Las filas se agrupan en lotes que se validan
+de una vez con `utils.validaciones.validar_lote`; las válidas de cada lote se
+insertan con `executemany` en una transacción y las rechazadas se escriben en un
+informe de errores en formato CSV.
+
+Uso típico:
+    resultado = importar_archivo("crm.csv", informe_errores="rechazados.csv")
+    print(resultado)
+"""
+import csv
+import os
+import re
+
+from database import agenda_database as db
+from database import metricas
+from utils.validaciones import validar_lote
+
+
+TAMANO_LOTE = 5000
+
+# Nombres de columna aceptados en la cabecera CSV para cada campo.
+ALIAS_COLUMNAS = {
+    "nombre": ("nombre", "name", "nombre completo", "full name", "fn"),
+    "telefono": ("telefono", "teléfono", "phone", "tel", "celular", "movil", "móvil"),
+    "email": ("email", "correo", "correo electronico", "correo electrónico", "e-mail", "mail"),
+}
+
+# Separadores habituales en teléfonos exportados (espacios, guiones, puntos, paréntesis).
+_SEPARADORES_TELEFONO = re.compile(r"[\s\-.()]")
+
+
+class ResultadoImportacion:
+    """Resumen de una importación: filas leídas, insertadas y rechazadas."""
+    def __init__(self):
+        self.leidas = 0
+        self.insertadas = 0
+        self.rechazadas = 0
+
+    def __str__(self) -> str:
+        return (f"Leídas: {self.leidas} - Insertadas: {self.insertadas} - "
+                f"Rechazadas: {self.rechazadas}")
+
+
+# --- LECTORES (STREAMING) ---
+
+def leer_csv(ruta: str, delimitador: str = None):
+    """Lee un CSV con cabecera y produce tuplas (linea, nombre, telefono, email).
+
+    La cabecera se reconoce por los alias de `ALIAS_COLUMNAS` (sin distinguir
+    mayúsculas). Si no se indica `delimitador`, se detecta a partir de la cabecera.
+
+    Args:
+        ruta: Ruta del archivo CSV (UTF-8, con o sin BOM).
+        delimitador: Separador de campos (',' o ';' habitualmente).
+
+    Yields:
+        tuple: (número de línea, nombre, teléfono, email).
+    """
+    with open(ruta, newline="", encoding="utf-8-sig") as archivo:
+        if delimitador is None:
+            cabecera = archivo.readline()
+            delimitador = ";" if cabecera.count(";") > cabecera.count(",") else ","
+            archivo.seek(0)
+        lector = csv.reader(archivo, delimiter=delimitador)
+        cabecera = [c.strip().lower() for c in next(lector, [])]
+        posiciones = {}
+        for campo, alias in ALIAS_COLUMNAS.items():
+            for i, columna in enumerate(cabecera):
+                if columna in alias:
+                    posiciones[campo] = i
+                    break
+        if "nombre" not in posiciones or "telefono" not in posiciones:
+            raise ValueError("El CSV debe tener columnas de nombre y teléfono.")
+
+        def campo(fila, nombre):
+            i = posiciones.get(nombre)
+            return fila[i].strip() if i is not None and i < len(fila) else ""
+
+        for fila in lector:
+            if not any(fila):
+                continue
+            yield lector.line_num, campo(fila, "nombre"), campo(fila, "telefono"), campo(fila, "email")
+
+
+def _desescapar_vcard(valor: str) -> str:
+    """Deshace el escapado de texto de vCard (saltos de línea, comas, puntos y coma, barras)."""
+    return (valor.replace("\\n", " ").replace("\\N", " ").replace("\\,", ",")
+            .replace("\\;", ";").replace("\\\\", "\\"))
+
+
+def leer_vcard(ruta: str):
+    """Lee un archivo vCard (.vcf) y produce tuplas (linea, nombre, telefono, email).
+
+    Soporta varias tarjetas por archivo y líneas plegadas (continuaciones que
+    empiezan por espacio o tabulador). De cada tarjeta se toman FN (o N si falta),
+    el primer TEL y el primer EMAIL.
+
+    Args:
+        ruta: Ruta del archivo vCard (UTF-8).
+
+    Yields:
+        tuple: (línea donde empieza la tarjeta, nombre, teléfono, email).
+    """
+    def lineas_desplegadas(archivo):
+        pendiente, inicio = None, 0
+        for numero, linea in enumerate(archivo, start=1):
+            linea = linea.rstrip("\r\n")
+            if linea[:1] in (" ", "\t") and pendiente is not None:
+                pendiente += linea[1:]
+                continue
+            if pendiente is not None:
+                yield inicio, pendiente
+            pendiente, inicio = linea, numero
+        if pendiente is not None:
+            yield inicio, pendiente
+
+    with open(ruta, encoding="utf-8-sig") as archivo:
+        tarjeta = None
+        for numero, linea in lineas_desplegadas(archivo):
+            if ":" not in linea:
+                continue
+            propiedad, valor = linea.split(":", 1)
+            # Se descartan grupos ("item1.TEL") y parámetros ("TEL;TYPE=CELL").
+            nombre_prop = propiedad.split(";", 1)[0].split(".")[-1].upper()
+            if nombre_prop == "BEGIN" and valor.strip().upper() == "VCARD":
+                tarjeta = {"linea": numero}
+            elif tarjeta is None:
+                continue
+            elif nombre_prop == "END":
+                nombre = tarjeta.get("FN") or tarjeta.get("N", "")
+                yield tarjeta["linea"], nombre, tarjeta.get("TEL", ""), tarjeta.get("EMAIL", "")
+                tarjeta = None
+            elif nombre_prop == "N" and "N" not in tarjeta:
+                # N = Apellidos;Nombres;Adicionales;Prefijos;Sufijos
+                partes = [_desescapar_vcard(p).strip() for p in re.split(r"(?<!\\);", valor)]
+                tarjeta["N"] = " ".join(p for p in (partes[1:2] + partes[:1]) if p)
+            elif nombre_prop in ("FN", "TEL", "EMAIL") and nombre_prop not in tarjeta:
+                tarjeta[nombre_prop] = _desescapar_vcard(valor).strip()
+
+
+# --- VALIDACIÓN E INSERCIÓN ---
+
+def limpiar_telefono(telefono: str) -> str:
+    """Elimina separadores habituales (espacios, guiones, puntos, paréntesis) del teléfono."""
+    return _SEPARADORES_TELEFONO.sub("", telefono or "")
+
+
+_CAMPOS_MOTIVO = {"nombre": "nombre", "telefono": "teléfono", "email": "email"}
+
+
+def _motivos(errores) -> list:
+    """Convierte los códigos de `validar_lote` en motivos legibles ('nombre inválido (longitud)')."""
+    if not errores:
+        return []
+    return [f"{_CAMPOS_MOTIVO[campo]} inválido ({codigo})" for campo, codigo in errores.items()]
+
+
+def validar_fila(nombre: str, telefono: str, email: str) -> list:
+    """Valida una fila a importar con las reglas de `utils.validaciones`.
+
+    Returns:
+        list[str]: Motivos de rechazo; lista vacía si la fila es válida.
+    """
+    return _motivos(validar_lote([(nombre, telefono, email)])[0])
+
+
+def _insertar_lote(lote):
+    """Inserta un lote de filas (nombre, telefono, email) en una sola transacción."""
+    with db._conexion().transaccion() as conn:
+        conn.executemany(db.SQL_INSERTAR, [db._valores_contacto(*fila) for fila in lote])
+
+
+@metricas.medida
+def importar(filas, tamano_lote: int = TAMANO_LOTE, progreso=None, informe_errores: str = None):
+    """Valida e inserta contactos a partir de un iterable de filas.
+
+    Args:
+        filas: Iterable de tuplas (linea, nombre, telefono, email), como las que
+               producen `leer_csv` y `leer_vcard`.
+        tamano_lote: Número de filas leídas por lote (validación conjunta y
+                     un `executemany`/transacción con las válidas).
+        progreso: Función opcional que recibe el `ResultadoImportacion` parcial
+                  tras cada lote insertado.
+        informe_errores: Ruta opcional de un CSV donde se escriben las filas
+                         rechazadas junto con el motivo.
+
+    Returns:
+        ResultadoImportacion: Resumen de la importación.
+    """
+    resultado = ResultadoImportacion()
+    archivo_errores = None
+    escritor_errores = None
+    if informe_errores:
+        archivo_errores = open(informe_errores, "w", newline="", encoding="utf-8")
+        escritor_errores = csv.writer(archivo_errores)
+        escritor_errores.writerow(["linea", "nombre", "telefono", "email", "motivo"])
+
+    def procesar(lineas, lote):
+        """Valida un lote leído, inserta sus filas válidas y anota las rechazadas."""
+        validas = []
+        for linea, fila, errores in zip(lineas, lote, validar_lote(lote)):
+            if errores is None:
+                validas.append(fila)
+                continue
+            resultado.rechazadas += 1
+            if escritor_errores:
+                escritor_errores.writerow([linea, *fila, "; ".join(_motivos(errores))])
+        if validas:
+            _insertar_lote(validas)
+            resultado.insertadas += len(validas)
+        if progreso:
+            progreso(resultado)
+
+    lineas, lote = [], []
+    try:
+        for linea, nombre, telefono, email in filas:
+            resultado.leidas += 1
+            lineas.append(linea)
+            lote.append(((nombre or "").strip(), limpiar_telefono(telefono), (email or "").strip()))
+            if len(lote) >= tamano_lote:
+                procesar(lineas, lote)
+                lineas, lote = [], []
+        if lote:
+            procesar(lineas, lote)
+    finally:
+        if archivo_errores:
+            archivo_errores.close()
+    return resultado
+
+
+def importar_csv(ruta: str, delimitador: str = None, **kwargs) -> ResultadoImportacion:
+    """Importa un archivo CSV. Ver `leer_csv` e `importar` para los parámetros."""
+    return importar(leer_csv(ruta, delimitador), **kwargs)
+
+
+def importar_vcard(ruta: str, **kwargs) -> ResultadoImportacion:
+    """Importa un archivo vCard. Ver `leer_vcard` e `importar` para los parámetros."""
+    return importar(leer_vcard(ruta), **kwargs)
+
+
+def importar_archivo(ruta: str, **kwargs) -> ResultadoImportacion:
+    """Importa un archivo eligiendo el formato por su extensión (.csv, .vcf o .vcard)."""
+    extension = os.path.splitext(ruta)[1].lower()
+    if extension in (".vcf", ".vcard"):
+        return importar_vcard(ruta, **kwargs)
+    if extension == ".csv":
+        return importar_csv(ruta, **kwargs)
+    raise ValueError(f"Formato de importación no soportado: {extension}")
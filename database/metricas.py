@@ -0,0 +1,318 @@
+"""Instrumentación de la capa de base de datos: latencias, filas, conexiones y consultas lentas.
+
+Las funciones públicas de `database.agenda_database` se decoran con `medida`.
+Con las métricas desactivadas (por defecto) el decorador solo comprueba un
+indicador global y llama a la función; activadas, registra por función:
+
+- un histograma de latencias (cubetas fijas en milisegundos),
+- el número de llamadas, errores y filas devueltas,
+
+además del número de conexiones abiertas y un registro acotado de consultas
+lentas: cada llamada que supera el umbral se guarda con las sentencias SQL que
+ejecutó y la forma de sus parámetros (tipos y longitudes, nunca los valores).
+Las sentencias se capturan en las conexiones abiertas con las métricas ya
+activas (ver `database.conexion.ConexionMedida`).
+
+Las métricas se leen con `instantanea()` o se vuelcan con `volcar(ruta)` en JSON
+(`.json`) o en el formato de texto de Prometheus (cualquier otra extensión).
+
+Se activan con `activar()` o con variables de entorno al importar el módulo:
+
+- `AGENDA_METRICAS=1` las activa,
+- `AGENDA_METRICAS_LENTAS_MS` fija el umbral de consulta lenta,
+- `AGENDA_METRICAS_ARCHIVO` vuelca las métricas en ese archivo al terminar.
+"""
+import atexit
+import functools
+import json
+import logging
+import os
+import threading
+import time
+from bisect import bisect_left
+from collections import deque
+
+
+logger = logging.getLogger(__name__)
+
+# Límites superiores (ms) de las cubetas del histograma; la última es +Inf.
+CUBETAS_MS = (0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+UMBRAL_LENTO_MS = 100.0
+# Consultas lentas conservadas (las más recientes).
+MAXIMO_CONSULTAS_LENTAS = 200
+# Sentencias guardadas por llamada lenta.
+MAXIMO_SENTENCIAS = 50
+
+_activas = False
+_umbral_lento = UMBRAL_LENTO_MS / 1000
+_lock = threading.Lock()
+_local = threading.local()
+_funciones = {}
+_conexiones_abiertas = 0
+_lentas = deque(maxlen=MAXIMO_CONSULTAS_LENTAS)
+_total_lentas = 0
+
+
+class _MetricaFuncion:
+    """Contadores e histograma de latencias de una función."""
+    __slots__ = ("llamadas", "errores", "filas", "total", "maximo", "cubetas")
+
+    def __init__(self):
+        self.llamadas = 0
+        self.errores = 0
+        self.filas = 0
+        self.total = 0.0
+        self.maximo = 0.0
+        self.cubetas = [0] * (len(CUBETAS_MS) + 1)
+
+
+# --- ACTIVACIÓN ---
+
+def activar(umbral_lento_ms: float = UMBRAL_LENTO_MS):
+    """Activa las métricas.
+
+    Las latencias y filas se registran desde ese momento; las sentencias SQL de
+    las consultas lentas, en las conexiones que se abran a partir de ahora.
+
+    Args:
+        umbral_lento_ms: Duración a partir de la cual una llamada (o una
+                         sentencia fuera de una función medida) se registra
+                         como consulta lenta.
+    """
+    global _activas, _umbral_lento
+    _umbral_lento = umbral_lento_ms / 1000
+    _activas = True
+
+
+def desactivar():
+    """Desactiva las métricas (los valores acumulados se conservan)."""
+    global _activas
+    _activas = False
+
+
+def activas() -> bool:
+    """Indica si las métricas están activadas."""
+    return _activas
+
+
+def reiniciar():
+    """Borra todas las métricas acumuladas."""
+    global _conexiones_abiertas, _total_lentas
+    with _lock:
+        _funciones.clear()
+        _lentas.clear()
+        _conexiones_abiertas = 0
+        _total_lentas = 0
+
+
+# --- REGISTRO ---
+
+def medida(funcion):
+    """Decorador que mide latencia, errores y filas devueltas de `funcion`."""
+    nombre = funcion.__qualname__
+
+    @functools.wraps(funcion)
+    def envoltura(*args, **kwargs):
+        if not _activas:
+            return funcion(*args, **kwargs)
+        return _llamar_medida(nombre, funcion, args, kwargs)
+
+    return envoltura
+
+
+def _llamar_medida(nombre, funcion, args, kwargs):
+    """Ejecuta `funcion` registrando sus métricas y las sentencias que lanza."""
+    pila = getattr(_local, "pila", None)
+    if pila is None:
+        pila = _local.pila = []
+    sentencias = []
+    pila.append(sentencias)
+    error = False
+    resultado = None
+    inicio = time.perf_counter()
+    try:
+        resultado = funcion(*args, **kwargs)
+        return resultado
+    except BaseException:
+        error = True
+        raise
+    finally:
+        segundos = time.perf_counter() - inicio
+        pila.pop()
+        _registrar_llamada(nombre, segundos, error, _contar_filas(resultado))
+        if segundos >= _umbral_lento:
+            _registrar_lenta(nombre, segundos, sentencias)
+
+
+def _contar_filas(resultado):
+    """Filas devueltas por una función de la base de datos (0 si no aplica)."""
+    if isinstance(resultado, list):
+        return len(resultado)
+    if resultado is None or isinstance(resultado, (bool, int)):
+        return 0
+    return 1
+
+
+def _registrar_llamada(nombre, segundos, error, filas):
+    with _lock:
+        metrica = _funciones.get(nombre)
+        if metrica is None:
+            metrica = _funciones[nombre] = _MetricaFuncion()
+        metrica.llamadas += 1
+        metrica.errores += error
+        metrica.filas += filas
+        metrica.total += segundos
+        metrica.maximo = max(metrica.maximo, segundos)
+        metrica.cubetas[bisect_left(CUBETAS_MS, segundos * 1000)] += 1
+
+
+def _registrar_lenta(nombre, segundos, sentencias):
+    global _total_lentas
+    entrada = {
+        "funcion": nombre,
+        "ms": round(segundos * 1000, 3),
+        "hilo": threading.current_thread().name,
+        "momento": time.time(),
+        "sentencias": sentencias[:MAXIMO_SENTENCIAS],
+    }
+    with _lock:
+        _lentas.append(entrada)
+        _total_lentas += 1
+    logger.warning("Consulta lenta: %s tardó %.1f ms (%d sentencias)",
+                   nombre, entrada["ms"], len(sentencias))
+
+
+def forma_parametros(parametros):
+    """Describe los parámetros de una sentencia sin sus valores.
+
+    Ejemplo: `("Ana", 3, None)` -> `["str(3)", "int", "None"]`.
+    """
+    if isinstance(parametros, dict):
+        return {clave: _forma(valor) for clave, valor in parametros.items()}
+    return [_forma(valor) for valor in parametros]
+
+
+def _forma(valor):
+    if valor is None:
+        return "None"
+    if isinstance(valor, (str, bytes)):
+        return f"{type(valor).__name__}({len(valor)})"
+    return type(valor).__name__
+
+
+def registrar_sentencia(sql, parametros, segundos, filas_afectadas=None):
+    """Registra una sentencia ejecutada en una conexión instrumentada.
+
+    Dentro de una función medida, la sentencia se añade a las de esa llamada
+    (y a las de las llamadas que la contienen). Fuera de ellas, se registra
+    directamente como consulta lenta si supera el umbral.
+
+    Args:
+        sql: Texto de la sentencia.
+        parametros: Parámetros de la sentencia (de la primera fila en `executemany`).
+        segundos: Duración de `execute` (sin la lectura posterior de filas).
+        filas_afectadas: Filas modificadas si la sentencia se ejecutó con `executemany`.
+    """
+    sentencia = {"sql": " ".join(sql.split()), "parametros": forma_parametros(parametros),
+                 "ms": round(segundos * 1000, 3)}
+    if filas_afectadas is not None:
+        sentencia["filas_afectadas"] = filas_afectadas
+    pila = getattr(_local, "pila", None)
+    if pila:
+        for sentencias in pila:
+            if len(sentencias) < MAXIMO_SENTENCIAS:
+                sentencias.append(sentencia)
+    elif segundos >= _umbral_lento:
+        _registrar_lenta(None, segundos, [sentencia])
+
+
+def conexion_abierta():
+    """Cuenta una conexión nueva a la base de datos."""
+    global _conexiones_abiertas
+    with _lock:
+        _conexiones_abiertas += 1
+
+
+# --- LECTURA Y VOLCADO ---
+
+def instantanea() -> dict:
+    """Copia de todas las métricas acumuladas.
+
+    Returns:
+        dict: Con las claves "activas", "umbral_lento_ms", "conexiones_abiertas",
+              "consultas_lentas_total", "consultas_lentas" (las más recientes) y
+              "funciones": {nombre: {"llamadas", "errores", "filas", "total_ms",
+              "media_ms", "max_ms", "histograma_ms"}}, donde el histograma
+              asocia cada límite superior ("+Inf" el último) a su número de llamadas.
+    """
+    with _lock:
+        funciones = {}
+        for nombre, m in sorted(_funciones.items()):
+            limites = [str(limite) for limite in CUBETAS_MS] + ["+Inf"]
+            funciones[nombre] = {
+                "llamadas": m.llamadas,
+                "errores": m.errores,
+                "filas": m.filas,
+                "total_ms": round(m.total * 1000, 3),
+                "media_ms": round(m.total * 1000 / m.llamadas, 3) if m.llamadas else 0.0,
+                "max_ms": round(m.maximo * 1000, 3),
+                "histograma_ms": dict(zip(limites, m.cubetas)),
+            }
+        return {
+            "activas": _activas,
+            "umbral_lento_ms": _umbral_lento * 1000,
+            "conexiones_abiertas": _conexiones_abiertas,
+            "consultas_lentas_total": _total_lentas,
+            "consultas_lentas": list(_lentas),
+            "funciones": funciones,
+        }
+
+
+def a_json() -> str:
+    """Métricas en JSON (ver `instantanea`)."""
+    return json.dumps(instantanea(), ensure_ascii=False, indent=2)
+
+
+def a_prometheus() -> str:
+    """Métricas en el formato de texto de Prometheus (latencias en segundos)."""
+    datos = instantanea()
+    lineas = [
+        "# HELP agenda_db_llamada_segundos Latencia de las funciones de la base de datos.",
+        "# TYPE agenda_db_llamada_segundos histogram",
+    ]
+    for nombre, f in datos["funciones"].items():
+        acumulado = 0
+        for limite, cantidad in f["histograma_ms"].items():
+            acumulado += cantidad
+            le = limite if limite == "+Inf" else repr(float(limite) / 1000)
+            lineas.append(f'agenda_db_llamada_segundos_bucket{{funcion="{nombre}",le="{le}"}} {acumulado}')
+        lineas.append(f'agenda_db_llamada_segundos_sum{{funcion="{nombre}"}} {f["total_ms"] / 1000}')
+        lineas.append(f'agenda_db_llamada_segundos_count{{funcion="{nombre}"}} {f["llamadas"]}')
+    for metrica, clave, ayuda in (("agenda_db_errores_total", "errores", "Llamadas terminadas con excepción."),
+                                  ("agenda_db_filas_total", "filas", "Filas devueltas.")):
+        lineas += [f"# HELP {metrica} {ayuda}", f"# TYPE {metrica} counter"]
+        lineas += [f'{metrica}{{funcion="{nombre}"}} {f[clave]}' for nombre, f in datos["funciones"].items()]
+    lineas += [
+        "# HELP agenda_db_conexiones_abiertas_total Conexiones abiertas a la base de datos.",
+        "# TYPE agenda_db_conexiones_abiertas_total counter",
+        f"agenda_db_conexiones_abiertas_total {datos['conexiones_abiertas']}",
+        "# HELP agenda_db_consultas_lentas_total Llamadas que superaron el umbral de consulta lenta.",
+        "# TYPE agenda_db_consultas_lentas_total counter",
+        f"agenda_db_consultas_lentas_total {datos['consultas_lentas_total']}",
+    ]
+    return "\n".join(lineas) + "\n"
+
+
+def volcar(ruta: str):
+    """Escribe las métricas en `ruta`: JSON si termina en '.json', Prometheus en otro caso."""
+    contenido = a_json() if ruta.lower().endswith(".json") else a_prometheus()
+    with open(ruta, "w", encoding="utf-8") as archivo:
+        archivo.write(contenido)
+
+
+# --- CONFIGURACIÓN POR ENTORNO ---
+
+if os.environ.get("AGENDA_METRICAS", "").strip().lower() in ("1", "true", "si", "sí", "on"):
+    activar(float(os.environ.get("AGENDA_METRICAS_LENTAS_MS", UMBRAL_LENTO_MS)))
+if os.environ.get("AGENDA_METRICAS_ARCHIVO"):
+    atexit.register(volcar, os.environ["AGENDA_METRICAS_ARCHIVO"])
@@ -0,0 +1,217 @@
+"""Motor de migraciones versionadas del esquema de 'agenda.db'.
+
+La versión del esquema se guarda en `PRAGMA user_version`. Cada migración es una
+función que recibe la conexión y se identifica por un número de versión
+creciente. Al arrancar solo se aplican las migraciones cuya versión es mayor que
+la almacenada, todas dentro de una única transacción, de modo que un arranque
+con el esquema al día se reduce a leer `user_version` (coste constante,
+independiente del número de contactos).
+"""
+import logging
+import sqlite3
+
+from utils.normalizacion import normalizar_telefono, normalizar_email
+
+
+logger = logging.getLogger(__name__)
+
+COLUMNAS_CONTACTOS = ("id", "nombre", "telefono", "email")
+
+
+def _tabla_existe(conn, nombre):
+    """Indica si existe una tabla con el nombre dado."""
+    fila = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type='table' AND name=?", (nombre,)
+    ).fetchone()
+    return fila is not None
+
+
+def _migracion_001_tabla_contactos(conn):
+    """Crea la tabla 'contactos' de 4 campos o reconstruye la estructura antigua.
+
+    Si la tabla ya existe con exactamente los campos (id, nombre, telefono, email)
+    no se toca. Si existe con otra estructura (p. ej. con el antiguo campo 'notas'),
+    se copia a 'contactos_new', se elimina la antigua y se renombra la nueva.
+    """
+    sql_tabla = """
+        CREATE TABLE {nombre} (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            nombre TEXT NOT NULL,
+            telefono TEXT NOT NULL,
+            email TEXT
+        )
+    """
+    if not _tabla_existe(conn, "contactos"):
+        conn.execute(sql_tabla.format(nombre="contactos"))
+        return
+
+    columnas = tuple(fila[1] for fila in conn.execute("PRAGMA table_info(contactos)"))
+    if columnas == COLUMNAS_CONTACTOS:
+        return
+
+    conn.execute("DROP TABLE IF EXISTS contactos_new")
+    conn.execute(sql_tabla.format(nombre="contactos_new"))
+    try:
+        conn.execute(
+            "INSERT INTO contactos_new (id, nombre, telefono, email) "
+            "SELECT id, nombre, telefono, email FROM contactos"
+        )
+    except sqlite3.OperationalError as e:
+        # La tabla antigua no tiene las columnas esperadas: se aborta la migración.
+        logger.warning("Advertencia durante la migración de tabla: %s", e)
+        raise
+    conn.execute("DROP TABLE contactos")
+    conn.execute("ALTER TABLE contactos_new RENAME TO contactos")
+
+
+def fts5_disponible(conn) -> bool:
+    """Indica si esta compilación de SQLite soporta FTS5 con el tokenizador trigram."""
+    try:
+        conn.execute("CREATE VIRTUAL TABLE temp._prueba_fts USING fts5(x, tokenize='trigram')")
+    except sqlite3.OperationalError:
+        return False
+    conn.execute("DROP TABLE temp._prueba_fts")
+    return True
+
+
+def _migracion_002_indice_fts(conn):
+    """Crea el índice de texto completo 'contactos_fts' y sus triggers.
+
+    Es un índice FTS5 de contenido externo (los textos viven solo en 'contactos')
+    con tokenizador trigram, que permite búsquedas por subcadena de 3 o más
+    caracteres. Los triggers lo mantienen sincronizado en cada INSERT, UPDATE y
+    DELETE. Si SQLite no incluye FTS5 la migración no crea nada y las búsquedas
+    siguen usando LIKE.
+    """
+    if not fts5_disponible(conn):
+        return
+    conn.execute("""
+        CREATE VIRTUAL TABLE contactos_fts USING fts5(
+            nombre, telefono, email,
+            content='contactos', content_rowid='id', tokenize='trigram'
+        )
+    """)
+    conn.execute("""
+        CREATE TRIGGER contactos_fts_ai AFTER INSERT ON contactos BEGIN
+            INSERT INTO contactos_fts (rowid, nombre, telefono, email)
+            VALUES (new.id, new.nombre, new.telefono, new.email);
+        END
+    """)
+    conn.execute("""
+        CREATE TRIGGER contactos_fts_ad AFTER DELETE ON contactos BEGIN
+            INSERT INTO contactos_fts (contactos_fts, rowid, nombre, telefono, email)
+            VALUES ('delete', old.id, old.nombre, old.telefono, old.email);
+        END
+    """)
+    conn.execute("""
+        CREATE TRIGGER contactos_fts_au AFTER UPDATE ON contactos BEGIN
+            INSERT INTO contactos_fts (contactos_fts, rowid, nombre, telefono, email)
+            VALUES ('delete', old.id, old.nombre, old.telefono, old.email);
+            INSERT INTO contactos_fts (rowid, nombre, telefono, email)
+            VALUES (new.id, new.nombre, new.telefono, new.email);
+        END
+    """)
+    # Indexa los contactos que ya existían.
+    conn.execute("INSERT INTO contactos_fts (contactos_fts) VALUES ('rebuild')")
+
+
+def _migracion_003_indice_nombre(conn):
+    """Crea el índice (nombre COLLATE NOCASE, id) usado para ordenar y paginar."""
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_contactos_nombre "
+        "ON contactos (nombre COLLATE NOCASE, id)"
+    )
+
+
+# Filas rellenadas por cada `executemany` al migrar datos existentes.
+TAMANO_LOTE_RELLENO = 10_000
+
+
+def _migracion_004_columnas_normalizadas(conn):
+    """Añade 'telefono_norm' y 'email_norm', las rellena y las indexa.
+
+    Son columnas "sombra" con el teléfono en formato estilo E.164 y el email en
+    minúsculas (ver `utils.normalizacion`), que las escrituras de
+    `agenda_database` mantienen al día. Permiten buscar por teléfono o email
+    con una consulta puntual por índice y detectar duplicados.
+    """
+    conn.execute("ALTER TABLE contactos ADD COLUMN telefono_norm TEXT")
+    conn.execute("ALTER TABLE contactos ADD COLUMN email_norm TEXT")
+
+    # El trigger FTS de UPDATE se limita a los campos indexados, para que
+    # actualizar solo las columnas normalizadas (aquí y en el futuro) no
+    # reindexe el texto completo de cada fila.
+    if _tabla_existe(conn, "contactos_fts"):
+        conn.execute("DROP TRIGGER IF EXISTS contactos_fts_au")
+        conn.execute("""
+            CREATE TRIGGER contactos_fts_au AFTER UPDATE OF nombre, telefono, email ON contactos BEGIN
+                INSERT INTO contactos_fts (contactos_fts, rowid, nombre, telefono, email)
+                VALUES ('delete', old.id, old.nombre, old.telefono, old.email);
+                INSERT INTO contactos_fts (rowid, nombre, telefono, email)
+                VALUES (new.id, new.nombre, new.telefono, new.email);
+            END
+        """)
+
+    # Relleno por tramos de id, sin mantener un cursor abierto sobre la tabla que se actualiza.
+    ultimo_id = -1
+    while True:
+        filas = conn.execute(
+            "SELECT id, telefono, email FROM contactos WHERE id > ? ORDER BY id LIMIT ?",
+            (ultimo_id, TAMANO_LOTE_RELLENO),
+        ).fetchall()
+        if not filas:
+            break
+        ultimo_id = filas[-1][0]
+        conn.executemany(
+            "UPDATE contactos SET telefono_norm = ?, email_norm = ? WHERE id = ?",
+            [(normalizar_telefono(telefono), normalizar_email(email), id_contacto)
+             for id_contacto, telefono, email in filas],
+        )
+
+    conn.execute("CREATE INDEX idx_contactos_telefono_norm ON contactos (telefono_norm)")
+    conn.execute("CREATE INDEX idx_contactos_email_norm ON contactos (email_norm)")
+
+
+# Lista ordenada de migraciones: (versión, descripción, función).
+# Nunca se modifica una migración ya publicada; los cambios se añaden al final.
+MIGRACIONES = [
+    (1, "Tabla 'contactos' de 4 campos", _migracion_001_tabla_contactos),
+    (2, "Índice de texto completo FTS5 'contactos_fts'", _migracion_002_indice_fts),
+    (3, "Índice por nombre (NOCASE) para paginación", _migracion_003_indice_nombre),
+    (4, "Columnas normalizadas de teléfono y email", _migracion_004_columnas_normalizadas),
+]
+
+
+def version_actual(conn) -> int:
+    """Devuelve la versión del esquema almacenada en `PRAGMA user_version`."""
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
+
+def aplicar_migraciones(conn) -> int:
+    """Aplica, en una única transacción, las migraciones pendientes.
+
+    Args:
+        conn: Conexión abierta a la base de datos.
+
+    Returns:
+        int: Número de migraciones aplicadas (0 si el esquema ya estaba al día).
+    """
+    version = version_actual(conn)
+    pendientes = [m for m in MIGRACIONES if m[0] > version]
+    if not pendientes:
+        return 0
+
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        # Se relee la versión dentro de la transacción por si otro proceso
+        # migró el esquema entre la primera lectura y el bloqueo.
+        version = version_actual(conn)
+        pendientes = [m for m in MIGRACIONES if m[0] > version]
+        for numero, _descripcion, migracion in pendientes:
+            migracion(conn)
+            conn.execute(f"PRAGMA user_version = {int(numero)}")
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    return len(pendientes)
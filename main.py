@@ -1,14 +1,77 @@
 """
 Bloque de ejecución principal.
 
-Inicializa la ventana principal de ttkbootstrap (root) y crea una instancia de 
-la clase AgendaApp, lo que inicia la interfaz gráfica de usuario y la lógica 
+Inicializa la ventana principal de ttkbootstrap (root) y crea una instancia de
+la clase AgendaApp, lo que inicia la interfaz gráfica de usuario y la lógica
 de la aplicación.
+
+Con `--perfil-arranque [ARCHIVO]` mide el arranque (fases y tiempo de cada
+importación), escribe el informe en ARCHIVO (o en la salida estándar) y cierra
+la aplicación en cuanto se cargan los contactos. Con `--limite-ms N` el proceso
+termina con código 1 si el arranque tarda más de N milisegundos, para detectar
+regresiones.
 """
-from ui.interfaz_grafica import AgendaApp
-import ttkbootstrap as ttk
+import argparse
+import sys
 
-if __name__ == "__main__":
+from utils.perfil_arranque import PerfilArranque
+
+# Destino del informe cuando no hay salida estándar (ejecutable sin consola).
+ARCHIVO_PERFIL_POR_DEFECTO = "perfil_arranque.txt"
+
+
+def _escribir_informe(perfil, destino):
+    """Escribe el informe de arranque en `destino` ("-" es la salida estándar)."""
+    if destino == "-" and sys.stdout is None:
+        destino = ARCHIVO_PERFIL_POR_DEFECTO
+    if destino == "-":
+        print(perfil.informe())
+    else:
+        with open(destino, "w", encoding="utf-8") as archivo:
+            archivo.write(perfil.informe() + "\n")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Agenda Norma Ingens Robur")
+    parser.add_argument("--perfil-arranque", nargs="?", const="-", metavar="ARCHIVO",
+                        help="mide el arranque, escribe el informe y cierra la aplicación")
+    parser.add_argument("--limite-ms", type=float,
+                        help="con --perfil-arranque, falla si el arranque supera este tiempo")
+    args = parser.parse_args(argv)
+
+    perfil = None
+    if args.perfil_arranque:
+        perfil = PerfilArranque()
+        perfil.medir_importaciones()
+
+    import ttkbootstrap as ttk
+    from ui.interfaz_grafica import AgendaApp
+
+    if perfil:
+        perfil.detener_importaciones()
+        perfil.marcar("importaciones")
     root = ttk.Window(themename="litera")
-    app = AgendaApp(root)
-    root.mainloop()
\ No newline at end of file
+    if perfil:
+        perfil.marcar("ventana")
+    app = AgendaApp(root, startup_profile=perfil)
+    if perfil:
+        perfil.marcar("interfaz")
+
+        def terminar():
+            """Escribe el informe y cierra la aplicación fuera del callback en curso."""
+            _escribir_informe(perfil, args.perfil_arranque)
+            root.after(0, app._on_close)
+
+        perfil.al_terminar = terminar
+
+    root.mainloop()
+
+    if perfil and args.limite_ms is not None and perfil.total_ms() > args.limite_ms:
+        print(f"El arranque tardó {perfil.total_ms():.0f} ms (límite: {args.limite_ms:.0f} ms).",
+              file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
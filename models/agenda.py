@@ -5,14 +5,98 @@ class Agenda:
     de objetos contacto (asumiendo que estos objetos tienen un atributo 'nombre').
     Es la encargada de realizar operaciones de búsqueda y gestión de la lista
     principal de contactos.
+
+    Para que las búsquedas no recorran toda la colección, la agenda mantiene
+    índices que se actualizan de forma incremental al agregar, actualizar o
+    eliminar contactos:
+
+    - un diccionario de nombres normalizados (`casefold`) para la búsqueda exacta (O(1)),
+    - un índice invertido de trigramas del nombre para la búsqueda parcial, que
+      reduce los candidatos a los contactos que contienen todos los trigramas
+      del texto buscado,
+    - un diccionario por ID de base de datos, que es también la clave de los
+      demás índices.
+
+    `contactos` es una tupla de solo lectura: los cambios se hacen con
+    `agregar_contacto`, `actualizar_contacto`, `eliminar_contacto` o
+    `cargar_contactos`, que mantienen los índices al día.
     """
+    # Longitud de los n-gramas del índice de búsqueda parcial.
+    N = 3
+
     def __init__(self):
         """Inicializa la clase Agenda.
 
-        Crea una lista vacía donde se almacenarán los objetos contacto.
+        Crea una colección vacía y sus índices.
+        """
+        # Contactos por clave (ver `_clave`), en orden de inserción.
+        self._contactos = {}
+        # Nombre normalizado con el que se indexó cada contacto (None si no tiene nombre).
+        self._nombres = {}
+        # Número de orden de cada contacto, para devolver resultados en orden de inserción.
+        self._orden = {}
+        self._siguiente_orden = 0
+        # nombre normalizado -> {clave: contacto}
+        self._exacto = {}
+        # trigrama -> conjunto de claves
+        self._ngramas = {}
+        # Tupla de `contactos`, construida en la primera lectura tras cada cambio.
+        self._vista = None
+
+    # --- Propiedades y utilidades ---
+
+    @property
+    def contactos(self) -> tuple:
+        """Tupla (de solo lectura) de los contactos, en orden de inserción.
+
+        Se construye una vez y se reutiliza hasta el siguiente cambio. Para
+        modificar la colección se usan `agregar_contacto`, `actualizar_contacto`,
+        `eliminar_contacto` o `cargar_contactos`, que mantienen los índices.
+        """
+        if self._vista is None:
+            claves = sorted(self._contactos, key=self._orden.__getitem__)
+            self._vista = tuple(self._contactos[clave] for clave in claves)
+        return self._vista
+
+    @contactos.setter
+    def contactos(self, lista: list):
+        self.cargar_contactos(lista)
+
+    def __len__(self) -> int:
+        return len(self._contactos)
+
+    @staticmethod
+    def _clave(contacto):
+        """Clave de un contacto en los índices: su ID de base de datos.
+
+        Así, una copia igual de un contacto (p. ej. un `ContactoInmutable`
+        sustituto) se reconoce como el mismo contacto. Los contactos sin ID
+        (aún no guardados) se identifican por la identidad del objeto.
+        """
+        id_db = getattr(contacto, "id", None)
+        return id_db if id_db is not None else (None, id(contacto))
+
+    def _clave_registrada(self, contacto):
+        """Clave con la que `contacto` está en la agenda, o None si no está.
+
+        Un contacto agregado sin ID al que después se le asignó uno sigue
+        registrado con su clave de identidad.
         """
-        # La lista de objetos contacto. Se espera que cada objeto tenga un atributo 'nombre'.
-        self.contactos = []
+        for clave in (self._clave(contacto), (None, id(contacto))):
+            if clave in self._contactos:
+                return clave
+        return None
+
+    @staticmethod
+    def _normalizar(nombre):
+        """Devuelve el nombre normalizado para los índices, o None si no es una cadena."""
+        return nombre.casefold() if isinstance(nombre, str) else None
+
+    @classmethod
+    def _ngramas_de(cls, texto: str) -> set:
+        """Conjunto de n-gramas (trigramas) de un texto normalizado."""
+        n = cls.N
+        return {texto[i:i + n] for i in range(len(texto) - n + 1)}
 
     def esta_vacia(self) -> bool:
         """Verifica si la lista de contactos está vacía.
@@ -20,24 +104,152 @@ class Agenda:
         Returns:
             bool: True si no hay contactos en la agenda, False en caso contrario.
         """
-        return len(self.contactos) == 0
+        return len(self._contactos) == 0
+
+    # --- Carga y mantenimiento de índices ---
 
     def cargar_contactos(self, lista: list):
         """Sobreescribe la lista actual de contactos con una nueva lista.
 
         Este método se utiliza generalmente para cargar los datos recuperados
-        de la base de datos a la agenda en memoria.
+        de la base de datos a la agenda en memoria. Los índices se construyen
+        de una vez, sin pasar por `agregar_contacto` para cada elemento.
 
         Args:
             lista: Una lista de objetos que representan contactos. Se asume que
-                   cada objeto en la lista es un contacto válido.
+                   cada objeto en la lista es un contacto válido. Si dos
+                   contactos tienen el mismo ID, solo se conserva el primero.
         """
-        self.contactos = lista
+        contactos, nombres, orden, exacto, ngramas = {}, {}, {}, {}, {}
+        n = self.N
+        clave_de = self._clave
+        for posicion, contacto in enumerate(lista):
+            clave = clave_de(contacto)
+            if clave in contactos:
+                continue
+            contactos[clave] = contacto
+            orden[clave] = posicion
+            nombre = self._normalizar(getattr(contacto, "nombre", None))
+            nombres[clave] = nombre
+            if nombre is None:
+                continue
+            exacto.setdefault(nombre, {})[clave] = contacto
+            for i in range(len(nombre) - n + 1):
+                gram = nombre[i:i + n]
+                claves = ngramas.get(gram)
+                if claves is None:
+                    ngramas[gram] = {clave}
+                else:
+                    claves.add(clave)
+
+        self._contactos, self._nombres, self._orden = contactos, nombres, orden
+        self._exacto, self._ngramas = exacto, ngramas
+        self._siguiente_orden = len(lista)
+        self._vista = None
+
+    def _indexar(self, clave, contacto):
+        """Añade un contacto ya registrado en `_contactos` a los índices."""
+        nombre = self._normalizar(getattr(contacto, "nombre", None))
+        self._nombres[clave] = nombre
+        if nombre is None:
+            return
+        self._exacto.setdefault(nombre, {})[clave] = contacto
+        for gram in self._ngramas_de(nombre):
+            self._ngramas.setdefault(gram, set()).add(clave)
+
+    def _desindexar(self, clave):
+        """Quita un contacto de los índices usando el nombre con el que se indexó."""
+        nombre = self._nombres.pop(clave, None)
+        if nombre is None:
+            return
+        iguales = self._exacto.get(nombre)
+        if iguales is not None:
+            iguales.pop(clave, None)
+            if not iguales:
+                del self._exacto[nombre]
+        for gram in self._ngramas_de(nombre):
+            claves = self._ngramas.get(gram)
+            if claves is not None:
+                claves.discard(clave)
+                if not claves:
+                    del self._ngramas[gram]
+
+    def agregar_contacto(self, contacto):
+        """Agrega un contacto a la agenda y a sus índices.
+
+        Args:
+            contacto: El objeto contacto a agregar. Si ya hay uno con el mismo ID
+                      (o el mismo objeto sin ID) no se duplica.
+        """
+        clave = self._clave(contacto)
+        if clave in self._contactos:
+            return
+        self._contactos[clave] = contacto
+        self._orden[clave] = self._siguiente_orden
+        self._siguiente_orden += 1
+        self._indexar(clave, contacto)
+        self._vista = None
+
+    def actualizar_contacto(self, contacto, nuevo=None):
+        """Reindexa un contacto tras modificarlo, o lo sustituye por otro.
+
+        Args:
+            contacto: El contacto presente en la agenda, o una copia con su mismo
+                      ID. Si se modificó (p. ej. cambió su nombre), basta con
+                      pasarlo para reindexarlo; pasa a ser el objeto guardado.
+            nuevo: Contacto que reemplaza a `contacto` en la misma posición
+                   (útil con contactos inmutables).
+
+        Returns:
+            bool: True si el contacto estaba en la agenda, False en caso contrario.
+        """
+        clave = self._clave_registrada(contacto)
+        if clave is None:
+            return False
+        nuevo = contacto if nuevo is None else nuevo
+        self._desindexar(clave)
+        del self._contactos[clave]
+        # El nuevo contacto hereda el número de orden del sustituido.
+        orden = self._orden.pop(clave)
+        self._vista = None
+        clave_nueva = self._clave(nuevo)
+        if clave_nueva in self._contactos:
+            # `nuevo` ya estaba en la agenda: basta con quitar el sustituido.
+            return True
+        self._contactos[clave_nueva] = nuevo
+        self._orden[clave_nueva] = orden
+        self._indexar(clave_nueva, nuevo)
+        return True
+
+    def eliminar_contacto(self, contacto) -> bool:
+        """Elimina un contacto de la agenda y de sus índices.
+
+        Args:
+            contacto: El objeto contacto a eliminar, o una copia con su mismo ID.
+
+        Returns:
+            bool: True si el contacto estaba en la agenda, False en caso contrario.
+        """
+        clave = self._clave_registrada(contacto)
+        if clave is None:
+            return False
+        self._desindexar(clave)
+        del self._contactos[clave]
+        del self._orden[clave]
+        self._vista = None
+        return True
+
+    # --- Búsquedas ---
+
+    def buscar_por_id(self, id_contacto: int):
+        """Devuelve el contacto con el ID de base de datos indicado, o None (O(1))."""
+        return None if id_contacto is None else self._contactos.get(id_contacto)
 
     def buscar_exacta(self, nombre: str) -> list:
         """Busca contactos cuyo nombre coincide exactamente con el texto proporcionado.
 
-        La búsqueda no es sensible a mayúsculas o minúsculas.
+        La búsqueda no es sensible a mayúsculas o minúsculas y se resuelve con
+        una consulta al diccionario de nombres normalizados.
 
         Args:
             nombre: La cadena de texto (nombre completo) a buscar.
@@ -46,30 +258,52 @@ class Agenda:
             list: Una lista de objetos contacto que coinciden exactamente con el
                   nombre proporcionado. La lista estará vacía si no hay coincidencias.
         """
-        # Convierte el nombre de búsqueda a minúsculas para una comparación insensible a mayúsculas.
-        nombre = nombre.lower()
-        
-        return [
-            # Se asegura de que el objeto contacto (c) tenga el atributo 'nombre',
-            # que este sea una cadena de texto, y luego realiza la comparación exacta.
-            c for c in self.contactos
-            if hasattr(c, "nombre") and isinstance(c.nombre, str) and c.nombre.lower() == nombre
-        ]
+        iguales = self._exacto.get(nombre.casefold())
+        if not iguales:
+            return []
+        if len(iguales) == 1:
+            return list(iguales.values())
+        claves = sorted(iguales, key=self._orden.__getitem__)
+        return [iguales[clave] for clave in claves]
 
     def buscar_parcial(self, texto: str) -> list:
         """Busca contactos cuyo nombre contiene el texto proporcionado.
 
-        La búsqueda parcial no es sensible a mayúsculas o minúsculas.
+        La búsqueda parcial no es sensible a mayúsculas o minúsculas. Si el texto
+        tiene al menos tres caracteres, los candidatos se obtienen intersecando
+        las listas del índice de trigramas (empezando por la más corta) y solo
+        ellos se comprueban; para textos más cortos se recorren los nombres.
 
         Args:
             texto: La subcadena de texto a buscar dentro de los nombres de los contactos.
 
         Returns:
             list: Una lista de objetos contacto que contienen el texto de búsqueda en
-                  su nombre. La lista estará vacía si no hay coincidencias.
+                  su nombre, en orden de inserción. La lista estará vacía si no hay
+                  coincidencias.
         """
-        # Convierte el texto de búsqueda a minúsculas para una comparación insensible.
-        texto = texto.lower()
-        
-        # Filtra los contactos donde el texto se encuentra en el nombre del contacto.
-        return [c for c in self.contactos if texto in c.nombre.lower()]
\ No newline at end of file
+        texto = texto.casefold()
+
+        if len(texto) < self.N:
+            encontrados = [clave for clave, nombre in self._nombres.items()
+                           if nombre is not None and texto in nombre]
+            encontrados.sort(key=self._orden.__getitem__)
+            return [self._contactos[clave] for clave in encontrados]
+
+        listas = []
+        for gram in self._ngramas_de(texto):
+            claves = self._ngramas.get(gram)
+            if not claves:
+                return []
+            listas.append(claves)
+        listas.sort(key=len)
+        candidatos = set(listas[0])
+        for claves in listas[1:]:
+            candidatos &= claves
+            if not candidatos:
+                return []
+
+        nombres = self._nombres
+        encontrados = [clave for clave in candidatos if texto in nombres[clave]]
+        encontrados.sort(key=self._orden.__getitem__)
+        return [self._contactos[clave] for clave in encontrados]
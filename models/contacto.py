@@ -3,7 +3,17 @@ class Contacto:
 
     Los atributos principales de un contacto son su identificador único (ID),
     nombre, número de teléfono y dirección de correo electrónico.
+
+    La clase usa `__slots__`, por lo que las instancias no tienen `__dict__` y
+    ocupan bastante menos memoria cuando se cargan muchos contactos. Para
+    compatibilidad con el código que trabajaba con filas de la base de datos,
+    un contacto se puede desempaquetar como la tupla (id, nombre, telefono,
+    email) y se puede indexar por posición o por nombre de campo.
     """
+    __slots__ = ("id", "nombre", "telefono", "email")
+
+    CAMPOS = ("id", "nombre", "telefono", "email")
+
     def __init__(self, nombre: str, telefono: str, email: str, id: int = None):
         """Inicializa un nuevo objeto Contacto.
 
@@ -26,11 +36,67 @@ class Contacto:
             str: Una cadena que incluye el ID, Nombre, Teléfono y Email del contacto.
         """
         return f"[ID:{self.id}] Nombre: {self.nombre} - Telefono: {self.telefono} - Email: {self.email}"
-    
+
     def __str__(self) -> str:
         """Define la representación en cadena del objeto para impresión.
 
         Returns:
             str: La información detallada del contacto, obtenida de `mostrar_info_contacto`.
         """
-        return self.mostrar_info_contacto()
\ No newline at end of file
+        return self.mostrar_info_contacto()
+
+    def __repr__(self) -> str:
+        return (f"{type(self).__name__}(nombre={self.nombre!r}, telefono={self.telefono!r}, "
+                f"email={self.email!r}, id={self.id!r})")
+
+    def __iter__(self):
+        """Permite desempaquetar el contacto como (id, nombre, telefono, email)."""
+        return iter((self.id, self.nombre, self.telefono, self.email))
+
+    def __getitem__(self, clave):
+        """Acceso por posición (0-3) o por nombre de campo, como en `sqlite3.Row`."""
+        if isinstance(clave, int):
+            return (self.id, self.nombre, self.telefono, self.email)[clave]
+        if clave in self.CAMPOS:
+            return getattr(self, clave)
+        raise KeyError(clave)
+
+    def __eq__(self, otro):
+        if not isinstance(otro, Contacto):
+            return NotImplemented
+        return tuple(self) == tuple(otro)
+
+    # Los contactos mutables no son hashables (su valor puede cambiar).
+    __hash__ = None
+
+
+class ContactoInmutable(Contacto):
+    """Variante de solo lectura (congelada) de `Contacto`.
+
+    Sus atributos no se pueden modificar después de crearla, lo que permite
+    compartir la misma instancia con seguridad (cachés, índices, otros hilos) y
+    usarla como clave de diccionarios o en conjuntos.
+    """
+    __slots__ = ()
+
+    def __init__(self, nombre: str, telefono: str, email: str, id: int = None):
+        """Inicializa el contacto; ver `Contacto.__init__`."""
+        object.__setattr__(self, "id", id)
+        object.__setattr__(self, "nombre", str(nombre))
+        object.__setattr__(self, "telefono", telefono)
+        object.__setattr__(self, "email", email)
+
+    def __setattr__(self, nombre, valor):
+        raise AttributeError(f"ContactoInmutable no admite modificar '{nombre}'")
+
+    def __delattr__(self, nombre):
+        raise AttributeError(f"ContactoInmutable no admite borrar '{nombre}'")
+
+    def __hash__(self):
+        return hash(tuple(self))
+
+    def reemplazar(self, **cambios) -> "ContactoInmutable":
+        """Devuelve una copia con los campos indicados cambiados."""
+        valores = {"id": self.id, "nombre": self.nombre, "telefono": self.telefono, "email": self.email}
+        valores.update(cambios)
+        return ContactoInmutable(**valores)
@@ -0,0 +1 @@
+"""Servicio HTTP/JSON local de la agenda (ver `servicio.servidor`)."""
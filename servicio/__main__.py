@@ -0,0 +1,7 @@
+"""Punto de entrada de `python -m servicio` (ver `servicio.servidor`)."""
+import sys
+
+from servicio.servidor import main
+
+
+sys.exit(main())
@@ -0,0 +1,451 @@
+"""Servicio HTTP/JSON local sobre la agenda (`python -m servicio`).
+
+Expone `database.agenda_database` a otras herramientas con la librería estándar
+(`http.server`), sin tkinter ni dependencias externas:
+
+    GET    /contactos?q=Peña&limite=50&despues=CURSOR   página de contactos
+    GET    /contactos/<id>                              un contacto
+    POST   /contactos                                   crea (cuerpo JSON)
+    PUT    /contactos/<id>                              reemplaza nombre, teléfono y email
+    PATCH  /contactos/<id>                              cambia solo los campos enviados
+    DELETE /contactos/<id>                              elimina
+
+Las páginas usan la paginación por clave de `obtener_contactos_pagina`: la
+respuesta incluye `siguiente`, un cursor opaco que se pasa como `despues` para
+pedir la página siguiente (null en la última).
+
+Concurrencia:
+- cada conexión HTTP se atiende en su hilo (`ThreadingHTTPServer`, con keep-alive),
+- las lecturas se reparten entre unos pocos hilos lectores (`EjecutorDB`), cada
+  uno con su conexión persistente; con WAL se ejecutan en paralelo y no esperan
+  a las escrituras,
+- todas las escrituras pasan por un único `EscritorAgrupado`, que confirma en
+  una transacción las que coinciden en cola.
+
+Las respuestas GET llevan un ETag derivado de `PRAGMA data_version` y de la URL
+pedida (ver `VersionDatos`). Con `If-None-Match` y sin cambios en la base de
+datos, el servidor responde 304 sin ejecutar ninguna consulta. La versión es
+global: cualquier escritura invalida los ETags de todas las páginas y búsquedas.
+"""
+import argparse
+import base64
+import binascii
+import json
+import re
+import secrets
+import zlib
+import signal
+import sys
+import threading
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from database import agenda_database as db
+from database.conexion import abrir_conexion
+from database.ejecutor import EjecutorDB, EscritorAgrupado
+from database.importacion import limpiar_telefono, validar_fila
+
+
+LECTORES = 4
+MAX_LOTE = 128
+PUERTO = 8765
+TAMANO_PAGINA = 50
+TAMANO_PAGINA_MAXIMO = 500
+# Tamaño máximo aceptado para el cuerpo JSON de POST, PUT y PATCH.
+TAMANO_CUERPO_MAXIMO = 64 * 1024
+
+CAMPOS = ("nombre", "telefono", "email")
+
+
+class ErrorPeticion(Exception):
+    """Petición rechazada; se responde con `estado` y `{"error": mensaje}`."""
+    def __init__(self, estado: HTTPStatus, mensaje: str):
+        super().__init__(mensaje)
+        self.estado = estado
+        self.mensaje = mensaje
+
+
+# --- VERSIÓN DE LOS DATOS (ETAG) ---
+
+class VersionDatos:
+    """Versión de la base de datos para construir ETags.
+
+    Usa una conexión propia que nunca escribe: su `PRAGMA data_version` cambia
+    cada vez que otra conexión (el escritor del servicio, la aplicación de
+    escritorio, `python -m cli`...) confirma cambios. El ETag lleva además un
+    identificador de la instancia, porque `data_version` vuelve a empezar en
+    cada conexión nueva y no debe confundirse con el de un arranque anterior, y
+    un resumen de la URL, para que el ETag de una página no valide otra.
+
+    La versión es de toda la base de datos, no de cada recurso: cualquier
+    escritura cambia el ETag de todas las URLs, aunque no afecte a su contenido.
+
+    Args:
+        ruta: Ruta de la base de datos.
+    """
+    def __init__(self, ruta: str):
+        self._conn = abrir_conexion(ruta)
+        self._lock = threading.Lock()
+        self._instancia = secrets.token_hex(4)
+
+    def etag(self, recurso: str) -> str:
+        """Devuelve el ETag de `recurso` (ruta y consulta) con los datos confirmados ahora."""
+        with self._lock:
+            version = self._conn.execute("PRAGMA data_version").fetchone()[0]
+        resumen = zlib.crc32(recurso.encode("utf-8"))
+        return f'"{self._instancia}-{version}-{resumen:08x}"'
+
+    def cerrar(self):
+        with self._lock:
+            self._conn.close()
+
+
+def _coincide_etag(cabecera: str, etag: str) -> bool:
+    """Indica si una cabecera If-None-Match incluye `etag` (comparación débil)."""
+    if not cabecera:
+        return False
+    candidatos = [valor.strip() for valor in cabecera.split(",")]
+    return "*" in candidatos or any(
+        (c[2:] if c.startswith("W/") else c) == etag for c in candidatos)
+
+
+# --- CURSORES DE PÁGINA ---
+
+def codificar_cursor(clave: tuple) -> str:
+    """Convierte la clave (nombre, id) de `clave_pagina` en un cursor apto para URL."""
+    datos = json.dumps(list(clave), ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(datos).decode("ascii").rstrip("=")
+
+
+def decodificar_cursor(cursor: str) -> tuple:
+    """Inverso de `codificar_cursor`; lanza ErrorPeticion si el cursor no es válido."""
+    try:
+        datos = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        nombre, id_contacto = json.loads(datos.decode("utf-8"))
+    except (binascii.Error, UnicodeDecodeError, ValueError, TypeError):
+        raise ErrorPeticion(HTTPStatus.BAD_REQUEST, "cursor 'despues' inválido") from None
+    if not isinstance(nombre, str) or not isinstance(id_contacto, int):
+        raise ErrorPeticion(HTTPStatus.BAD_REQUEST, "cursor 'despues' inválido")
+    return nombre, id_contacto
+
+
+# --- OPERACIONES (SE EJECUTAN EN LOS HILOS DE BASE DE DATOS) ---
+
+def contacto_a_dict(contacto) -> dict:
+    return {"id": contacto.id, "nombre": contacto.nombre,
+            "telefono": contacto.telefono, "email": contacto.email}
+
+
+def _validar(nombre, telefono, email) -> tuple:
+    """Limpia y valida un contacto; devuelve (nombre, telefono, email) o lanza ErrorPeticion."""
+    for campo, valor in zip(CAMPOS, (nombre, telefono, email)):
+        if valor is not None and not isinstance(valor, str):
+            raise ErrorPeticion(HTTPStatus.BAD_REQUEST, f"'{campo}' debe ser un texto")
+    nombre = (nombre or "").strip()
+    telefono = limpiar_telefono(telefono)
+    email = (email or "").strip()
+    motivos = validar_fila(nombre, telefono, email)
+    if motivos:
+        raise ErrorPeticion(HTTPStatus.UNPROCESSABLE_ENTITY, "; ".join(motivos))
+    return nombre, telefono, email
+
+
+def _pagina(despues_de, tamano_pagina, filtro_busqueda):
+    """Lee una página con un contacto de más (para saber si hay otra) y el total."""
+    contactos = db.obtener_contactos_pagina(despues_de, tamano_pagina + 1, filtro_busqueda)
+    return contactos, db.contar_contactos(filtro_busqueda)
+
+
+def _crear(campos):
+    """Valida e inserta un contacto; devuelve el contacto creado."""
+    nombre, telefono, email = _validar(*(campos.get(c) for c in CAMPOS))
+    id_contacto = db.insertar_contacto(nombre, telefono, email)
+    return {"id": id_contacto, "nombre": nombre, "telefono": telefono, "email": email}
+
+
+def _actualizar(id_contacto, campos):
+    """Aplica `campos` sobre el contacto y lo guarda; devuelve el resultado o None.
+
+    Se ejecuta en el escritor, dentro de su transacción, por lo que la lectura
+    del contacto actual y la actualización son atómicas.
+    """
+    actual = db.obtener_contacto_por_id(id_contacto)
+    if actual is None:
+        return None
+    nombre, telefono, email = _validar(*(
+        campos[c] if c in campos else getattr(actual, c) for c in CAMPOS))
+    db.actualizar_contacto(id_contacto, nombre, telefono, email)
+    return {"id": id_contacto, "nombre": nombre, "telefono": telefono, "email": email}
+
+
+# --- SERVIDOR ---
+
+class ServidorAgenda(ThreadingHTTPServer):
+    """Servidor HTTP de la agenda con lectores concurrentes y un escritor serializado.
+
+    Usa la base de datos de `agenda_database.DB_PATH`, cuyo esquema se pone al
+    día al arrancar.
+
+    Args:
+        direccion: Tupla (host, puerto); el puerto 0 elige uno libre.
+        lectores: Número de hilos lectores (cada uno con su conexión).
+        max_lote: Número máximo de escrituras confirmadas en una transacción.
+        registro: Si es True, escribe una línea por petición en la salida de errores.
+    """
+    daemon_threads = True
+    # Cola de conexiones pendientes de `listen`; con la de 5 por defecto, varios
+    # clientes que conectan a la vez ven SYN descartados y reintentos de 1 s.
+    request_queue_size = 128
+
+    def __init__(self, direccion, lectores: int = LECTORES, max_lote: int = MAX_LOTE,
+                 registro: bool = False):
+        if lectores < 1:
+            raise ValueError("Se necesita al menos un hilo lector.")
+        self.registro = registro
+        self._escritor = EscritorAgrupado("agenda-http-escritor", max_lote=max_lote)
+        self._escritor.enviar_aislada(db.crear_tabla).result()
+        self._lectores = [EjecutorDB(f"agenda-http-lector-{i}") for i in range(lectores)]
+        self.version = VersionDatos(db.DB_PATH)
+        super().__init__(direccion, ManejadorAgenda)
+
+    def leer(self, funcion, *args):
+        """Ejecuta una lectura en el lector con menos peticiones en cola y espera el resultado."""
+        lector = min(self._lectores, key=EjecutorDB.pendientes)
+        return lector.enviar(funcion, *args).result()
+
+    def escribir(self, funcion, *args):
+        """Ejecuta una escritura en el escritor (agrupada con las pendientes) y espera el resultado."""
+        return self._escritor.enviar(funcion, *args).result()
+
+    def estadisticas(self) -> dict:
+        """Devuelve los contadores del escritor (lotes y escrituras confirmadas)."""
+        return {"lotes": self._escritor.lotes, "escrituras": self._escritor.escrituras}
+
+    def server_close(self):
+        """Cierra el socket, termina las peticiones pendientes y cierra las conexiones."""
+        super().server_close()
+        self._escritor.cerrar()
+        for lector in self._lectores:
+            lector.cerrar()
+        self.version.cerrar()
+
+    @property
+    def url(self) -> str:
+        host, puerto = self.server_address[:2]
+        return f"http://{host}:{puerto}"
+
+
+class ManejadorAgenda(BaseHTTPRequestHandler):
+    """Traduce las peticiones HTTP a operaciones de `ServidorAgenda`."""
+    protocol_version = "HTTP/1.1"
+    server_version = "AgendaNIR/1.0"
+    # Cabeceras y cuerpo se escriben por separado; con el algoritmo de Nagle, el
+    # cuerpo esperaría al ACK retardado del cliente (~40 ms por respuesta).
+    disable_nagle_algorithm = True
+
+    RUTA = re.compile(r"^/contactos(?:/(\d+))?/?$")
+
+    def do_GET(self):
+        self._atender("GET")
+
+    def do_POST(self):
+        self._atender("POST")
+
+    def do_PUT(self):
+        self._atender("PUT")
+
+    def do_PATCH(self):
+        self._atender("PATCH")
+
+    def do_DELETE(self):
+        self._atender("DELETE")
+
+    def log_message(self, formato, *args):
+        if self.server.registro:
+            super().log_message(formato, *args)
+
+    # --- Despacho ---
+
+    def _atender(self, metodo):
+        partes = urlsplit(self.path)
+        ruta = self.RUTA.match(partes.path)
+        try:
+            if ruta is None:
+                raise ErrorPeticion(HTTPStatus.NOT_FOUND, "ruta no encontrada")
+            if ruta.group(1) is None:
+                operaciones = {"GET": self._listar, "POST": self._crear}
+                argumento = parse_qs(partes.query)
+            else:
+                operaciones = {"GET": self._obtener, "PUT": self._reemplazar,
+                               "PATCH": self._modificar, "DELETE": self._eliminar}
+                argumento = int(ruta.group(1))
+            operacion = operaciones.get(metodo)
+            if operacion is None:
+                self._responder(HTTPStatus.METHOD_NOT_ALLOWED,
+                                {"error": f"método {metodo} no permitido"},
+                                cabeceras={"Allow": ", ".join(operaciones)})
+                return
+            operacion(argumento)
+        except ErrorPeticion as error:
+            self._responder(error.estado, {"error": error.mensaje})
+        except Exception as error:
+            self.log_error("error atendiendo %s %s: %r", metodo, self.path, error)
+            self._responder(HTTPStatus.INTERNAL_SERVER_ERROR, {"error": "error interno"})
+
+    # --- Operaciones ---
+
+    def _listar(self, consulta):
+        filtro = consulta.get("q", [None])[-1]
+        limite = self._entero(consulta, "limite", TAMANO_PAGINA, 1, TAMANO_PAGINA_MAXIMO)
+        despues = consulta.get("despues", [None])[-1]
+        despues_de = decodificar_cursor(despues) if despues else None
+        # El ETag se toma antes de leer: si una escritura se confirma entre ambos
+        # pasos, el siguiente If-None-Match ya no coincide y nunca se sirve un 304 obsoleto.
+        etag = self.server.version.etag(self.path)
+        if self._no_modificado(etag):
+            return
+        contactos, total = self.server.leer(_pagina, despues_de, limite, filtro)
+        siguiente = None
+        if len(contactos) > limite:
+            contactos = contactos[:limite]
+            siguiente = codificar_cursor(db.clave_pagina(contactos[-1]))
+        self._responder(HTTPStatus.OK, {
+            "contactos": [contacto_a_dict(c) for c in contactos],
+            "total": total,
+            "siguiente": siguiente,
+        }, etag=etag)
+
+    def _obtener(self, id_contacto):
+        etag = self.server.version.etag(self.path)
+        if self._no_modificado(etag):
+            return
+        contacto = self.server.leer(db.obtener_contacto_por_id, id_contacto)
+        if contacto is None:
+            raise ErrorPeticion(HTTPStatus.NOT_FOUND, "contacto no encontrado")
+        self._responder(HTTPStatus.OK, contacto_a_dict(contacto), etag=etag)
+
+    def _crear(self, _consulta):
+        contacto = self.server.escribir(_crear, self._leer_json())
+        self._responder(HTTPStatus.CREATED, contacto,
+                        cabeceras={"Location": f"/contactos/{contacto['id']}"})
+
+    def _reemplazar(self, id_contacto):
+        campos = self._leer_json()
+        faltan = [c for c in ("nombre", "telefono") if c not in campos]
+        if faltan:
+            raise ErrorPeticion(HTTPStatus.BAD_REQUEST, f"faltan campos: {', '.join(faltan)}")
+        campos.setdefault("email", "")
+        self._guardar(id_contacto, campos)
+
+    def _modificar(self, id_contacto):
+        self._guardar(id_contacto, self._leer_json())
+
+    def _guardar(self, id_contacto, campos):
+        contacto = self.server.escribir(_actualizar, id_contacto, campos)
+        if contacto is None:
+            raise ErrorPeticion(HTTPStatus.NOT_FOUND, "contacto no encontrado")
+        self._responder(HTTPStatus.OK, contacto)
+
+    def _eliminar(self, id_contacto):
+        if not self.server.escribir(db.eliminar_contacto, id_contacto):
+            raise ErrorPeticion(HTTPStatus.NOT_FOUND, "contacto no encontrado")
+        self._responder(HTTPStatus.NO_CONTENT)
+
+    # --- Utilidades ---
+
+    @staticmethod
+    def _entero(consulta, nombre, por_defecto, minimo, maximo) -> int:
+        valor = consulta.get(nombre, [None])[-1]
+        if valor is None:
+            return por_defecto
+        try:
+            numero = int(valor)
+        except ValueError:
+            numero = None
+        if numero is None or not minimo <= numero <= maximo:
+            raise ErrorPeticion(HTTPStatus.BAD_REQUEST,
+                                f"'{nombre}' debe ser un entero entre {minimo} y {maximo}")
+        return numero
+
+    def _leer_json(self) -> dict:
+        """Lee el cuerpo de la petición como un objeto JSON con campos de contacto."""
+        longitud = self.headers.get("Content-Length")
+        if longitud is None or not longitud.isdigit():
+            # Sin longitud no se puede saber dónde acaba el cuerpo: se cierra la conexión.
+            self.close_connection = True
+            raise ErrorPeticion(HTTPStatus.LENGTH_REQUIRED, "falta Content-Length")
+        longitud = int(longitud)
+        if longitud > TAMANO_CUERPO_MAXIMO:
+            self.close_connection = True
+            raise ErrorPeticion(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, "cuerpo demasiado grande")
+        try:
+            campos = json.loads(self.rfile.read(longitud).decode("utf-8"))
+        except (UnicodeDecodeError, ValueError):
+            raise ErrorPeticion(HTTPStatus.BAD_REQUEST, "el cuerpo no es JSON válido") from None
+        if not isinstance(campos, dict):
+            raise ErrorPeticion(HTTPStatus.BAD_REQUEST, "el cuerpo debe ser un objeto JSON")
+        desconocidos = sorted(set(campos) - set(CAMPOS) - {"id"})
+        if desconocidos:
+            raise ErrorPeticion(HTTPStatus.BAD_REQUEST,
+                                f"campos desconocidos: {', '.join(desconocidos)}")
+        return campos
+
+    def _no_modificado(self, etag) -> bool:
+        """Responde 304 si el cliente ya tiene la versión `etag`."""
+        if not _coincide_etag(self.headers.get("If-None-Match"), etag):
+            return False
+        self.send_response(HTTPStatus.NOT_MODIFIED)
+        self.send_header("ETag", etag)
+        self.end_headers()
+        return True
+
+    def _responder(self, estado, datos=None, etag=None, cabeceras=None):
+        cuerpo = b"" if datos is None else json.dumps(datos, ensure_ascii=False).encode("utf-8")
+        self.send_response(estado)
+        if datos is not None:
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(cuerpo)))
+        if etag:
+            self.send_header("ETag", etag)
+            # El cliente puede guardar la respuesta, pero debe revalidarla con If-None-Match.
+            self.send_header("Cache-Control", "no-cache")
+        for nombre, valor in (cabeceras or {}).items():
+            self.send_header(nombre, valor)
+        self.end_headers()
+        self.wfile.write(cuerpo)
+
+
+# --- LÍNEA DE COMANDOS ---
+
+def _terminar(_senal, _marco):
+    raise KeyboardInterrupt
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m servicio",
+                                     description="Servicio HTTP/JSON local de la agenda.")
+    parser.add_argument("--host", default="127.0.0.1",
+                        help="dirección en la que escuchar (por defecto, solo local)")
+    parser.add_argument("--puerto", type=int, default=PUERTO, help="0 elige un puerto libre")
+    parser.add_argument("--db", metavar="RUTA", help="base de datos a usar (por defecto, agenda.db)")
+    parser.add_argument("--lectores", type=int, default=LECTORES, help="hilos lectores")
+    parser.add_argument("--registro", action="store_true", help="registra cada petición")
+    args = parser.parse_args(argv)
+    if args.db:
+        db.DB_PATH = args.db
+
+    servidor = ServidorAgenda((args.host, args.puerto), lectores=args.lectores,
+                              registro=args.registro)
+    # La primera línea de la salida es la URL (la lee, p. ej., benchmarks.bench_servicio).
+    print(servidor.url, flush=True)
+    signal.signal(signal.SIGTERM, _terminar)
+    try:
+        servidor.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        servidor.server_close()
+        db.cerrar_conexiones()
+    print("Servicio detenido.", file=sys.stderr)
+    return 0
@@ -0,0 +1,52 @@
+"""Avatares con iniciales para las tarjetas de la lista y el detalle de contacto.
+
+Cada avatar es un `tk.Label` que muestra las iniciales como texto sobre una
+imagen transparente del tamaño del avatar: con `compound='center'`, Tk mide la
+etiqueta en píxeles por la imagen, así que el avatar tiene siempre el mismo
+tamaño, tenga o no iniciales. Solo se usan `tk.PhotoImage` y fuentes de Tk, sin
+PIL: mostrar la lista no carga ninguna librería de imágenes (PIL se reserva para
+el logo del modal del equipo, ver `ImageAdapter`).
+
+La caché guarda una imagen transparente por tamaño, compartida por todos los
+avatares de ese tamaño.
+"""
+import tkinter as tk
+
+
+class CacheAvatares:
+    """Configura etiquetas de Tk como avatares de iniciales de tamaño fijo.
+
+    Args:
+        master: Widget de Tk al que se asocian las imágenes.
+    """
+    def __init__(self, master):
+        self.master = master
+        self._marcadores = {}
+
+    def marcador(self, tamano: tuple) -> tk.PhotoImage:
+        """Devuelve la imagen transparente de `tamano` (ancho, alto) que fija el tamaño del avatar."""
+        imagen = self._marcadores.get(tamano)
+        if imagen is None:
+            imagen = tk.PhotoImage(master=self.master, width=tamano[0], height=tamano[1])
+            self._marcadores[tamano] = imagen
+        return imagen
+
+    def preparar(self, etiqueta: tk.Label, tamano: tuple):
+        """Da a `etiqueta` el tamaño de un avatar, todavía sin iniciales."""
+        etiqueta.config(image=self.marcador(tamano), compound='center', text="",
+                        bd=0, padx=0, pady=0)
+
+    def mostrar(self, etiqueta: tk.Label, iniciales: str, fondo: str, color: str, tamano: tuple):
+        """Muestra en `etiqueta` un avatar con las iniciales centradas.
+
+        Args:
+            etiqueta: Etiqueta de Tk que hace de avatar.
+            iniciales: Texto del avatar (p. ej. "JD").
+            fondo: Color de fondo ("#RRGGBB").
+            color: Color del texto.
+            tamano: Tupla (ancho, alto) en píxeles.
+        """
+        # Un tamaño negativo se interpreta en píxeles: las iniciales ocupan el 40 % del alto.
+        fuente = ("Helvetica", -max(8, int(tamano[1] * 0.4)), "bold")
+        etiqueta.config(image=self.marcador(tamano), compound='center', text=iniciales,
+                        bg=fondo, fg=color, font=fuente, bd=0, padx=0, pady=0)
@@ -0,0 +1,115 @@
+"""Búsqueda incremental con retardo (debounce) para la vista principal.
+
+Cada pulsación reprograma la búsqueda tras un retardo configurable, cancelando
+la anterior, de modo que al teclear rápido solo se ejecuta la última consulta.
+Las consultas a la base de datos son asíncronas (se resuelven en el hilo de base
+de datos); si una consulta queda superada antes de empezar, se cancela.
+Si la nueva consulta extiende a una anterior no vacía (la contiene) y esta
+devolvió pocos contactos, el resultado se obtiene filtrando en memoria el
+conjunto anterior en lugar de consultar la base de datos; con conjuntos grandes
+el filtrado bloquearía el hilo de Tk, así que se consulta la base (FTS). Los
+resultados solo se aplican si siguen siendo los de la consulta más reciente.
+"""
+
+# Máximo de resultados anteriores que se filtran en memoria en el hilo de Tk.
+MAX_FILTRO_EN_MEMORIA = 2000
+
+
+def coincide(contacto, texto: str) -> bool:
+    """Indica si `texto` aparece (sin distinguir mayúsculas) en nombre, teléfono o email."""
+    texto = texto.casefold()
+    for valor in (contacto.nombre, contacto.telefono, contacto.email):
+        if valor and texto in valor.casefold():
+            return True
+    return False
+
+
+class BusquedaIncremental:
+    """Coordina las búsquedas de la vista principal sobre el bucle de eventos de Tk.
+
+    Args:
+        master: Widget cuyo método `after` se usa para programar las búsquedas.
+        buscar: Función `buscar(texto, entregar)` que lanza la búsqueda (texto None
+                para obtener todos los contactos), llama a `entregar(contactos)`
+                en el hilo de Tk cuando termina y devuelve un objeto con método
+                `cancel()` (p. ej. un `Future`) o None. `entregar` admite
+                además una marca opcional que identifica el resultado.
+        aplicar: Función `aplicar(contactos, marca)` que muestra los contactos
+                 resultantes; `marca` es la que pasó `buscar` (None si el
+                 resultado se filtró en memoria).
+        retardo_ms: Milisegundos de inactividad antes de lanzar la búsqueda.
+        max_en_memoria: Máximo de resultados anteriores que se refinan en memoria.
+    """
+    def __init__(self, master, buscar, aplicar, retardo_ms: int = 250,
+                 max_en_memoria: int = MAX_FILTRO_EN_MEMORIA):
+        self.master = master
+        self.buscar = buscar
+        self.aplicar = aplicar
+        self.retardo_ms = retardo_ms
+        self.max_en_memoria = max_en_memoria
+        self._after_id = None
+        # Se incrementa con cada consulta; una búsqueda cuyo número ya no es el
+        # actual ha quedado obsoleta y su resultado se descarta.
+        self._generacion = 0
+        self._ultima_consulta = None
+        self._ultimos_resultados = None
+        # Consulta a la base de datos en curso (cancelable mientras no empiece).
+        self._pendiente = None
+
+    def programar(self, consulta: str):
+        """Programa `consulta` tras el retardo, reemplazando cualquier búsqueda pendiente."""
+        self.cancelar()
+        self._generacion += 1
+        self._after_id = self.master.after(
+            self.retardo_ms, self._ejecutar, consulta, self._generacion
+        )
+
+    def ejecutar_ahora(self, consulta: str):
+        """Ejecuta `consulta` inmediatamente, cancelando la búsqueda pendiente."""
+        self.cancelar()
+        self._generacion += 1
+        self._ejecutar(consulta, self._generacion)
+
+    def cancelar(self):
+        """Cancela la búsqueda programada y la consulta en curso, si las hay."""
+        if self._after_id is not None:
+            self.master.after_cancel(self._after_id)
+            self._after_id = None
+        if self._pendiente is not None:
+            self._pendiente.cancel()
+            self._pendiente = None
+
+    def invalidar(self):
+        """Olvida el último resultado (p. ej. tras modificar contactos)."""
+        self._ultima_consulta = None
+        self._ultimos_resultados = None
+
+    def _ejecutar(self, consulta: str, generacion: int):
+        """Resuelve la consulta (en memoria o en la base de datos) si sigue vigente."""
+        self._after_id = None
+        if generacion != self._generacion:
+            return
+        consulta = consulta.strip()
+
+        if self._ultima_consulta and self._ultimos_resultados is not None \
+                and len(self._ultimos_resultados) <= self.max_en_memoria \
+                and self._ultima_consulta.casefold() in consulta.casefold():
+            # La consulta extiende a la anterior: sus resultados son un subconjunto
+            # (y conservan el orden que les dio la base de datos).
+            resultados = [c for c in self._ultimos_resultados if coincide(c, consulta)]
+            self._entregar(consulta, generacion, resultados)
+            return
+
+        self._pendiente = self.buscar(
+            consulta or None,
+            lambda resultados, marca=None: self._entregar(consulta, generacion, resultados, marca),
+        )
+
+    def _entregar(self, consulta: str, generacion: int, resultados, marca=None):
+        """Aplica los resultados solo si pertenecen a la consulta más reciente."""
+        if generacion != self._generacion:
+            return
+        self._pendiente = None
+        self._ultima_consulta = consulta
+        self._ultimos_resultados = resultados
+        self.aplicar(resultados, marca)
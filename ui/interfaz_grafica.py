@@ -9,17 +9,16 @@ Gestiona las tres vistas principales:
 3. Vista de Formulario (Creación/Edición de contacto).
 4. Vista de Acerca de (Informacion del equipo de desarrollo)
 
-Utiliza el módulo 'agenda_database' (db) para las operaciones CRUD.
+Utiliza el módulo 'agenda_database' (db) para las operaciones CRUD, a través de
+la caché write-through `database.cache.CacheContactos`.
 """
 import sys
 import os
+from collections import OrderedDict
 import tkinter as tk
 from tkinter import END, messagebox # Importamos messagebox explícitamente
 import ttkbootstrap as ttk
 from ttkbootstrap.constants import *
-from ttkbootstrap.widgets.scrolled import ScrolledFrame
-from PIL import Image, ImageTk 
-from utils.validaciones import *
 
 # --- CONFIGURACIÓN DE RUTAS ---
 current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -29,7 +28,15 @@ sys.path.append(project_root)
 # --- MOCKUP DE BASE DE DATOS Y UTILIDADES ---
 from database.agenda_database import resource_path
 from database import agenda_database as db 
-from utils.validaciones import * # --- 1. CONSTANTES Y CONFIGURACIÓN ESTÉTICA ---
+from database.cache import CacheContactos
+from database.ejecutor import EjecutorDB
+from ui.busqueda import BusquedaIncremental
+from ui.lista_virtual import ListaVirtual
+from ui.avatares import CacheAvatares
+from utils.normalizacion import get_initials
+from utils.validaciones import validar_telefono
+
+# --- 1. CONSTANTES Y CONFIGURACIÓN ESTÉTICA ---
 class Config:
     """Clase que almacena constantes para la configuración estética de la UI.
 
@@ -54,32 +61,61 @@ class Config:
     ICON_EDITAR = "✏️" 
     ICON_BUSCAR = "🔍"
     ICON_ELIMINAR = "🗑️"
+    ICON_SELECCIONAR = "☑"
     ICON_INFO = "      ℹ️"
     ICON_CROWN = "👑"
 
+    # Búsqueda: milisegundos de inactividad antes de consultar la base de datos
+    SEARCH_DEBOUNCE_MS = 250
+    # Base de datos: cada cuántos milisegundos se recogen los resultados del hilo de trabajo
+    DB_POLL_MS = 30
+
+    # Imágenes: espera tras el último <Configure> antes de redimensionar el logo,
+    # y tamaños (px) de los avatares de la lista y del detalle
+    RESIZE_DEBOUNCE_MS = 60
+    AVATAR_SIZE = (64, 48)
+    AVATAR_DETAIL_SIZE = (120, 110)
+
 # --- 2. UTILIDADES ---
 class ImageAdapter:
     """Clase para cargar, redimensionar y gestionar imágenes con PIL y Tkinter.
 
     Permite manejar logotipos o imágenes de la aplicación de manera eficiente
-    y con redimensionamiento dinámico.
+    y con redimensionamiento dinámico. Las imágenes redimensionadas se guardan
+    en un LRU acotado por tamaño, y `schedule_resize` agrupa las peticiones que
+    llegan seguidas (p. ej. al arrastrar el borde de la ventana) en una sola.
+
+    PIL y el archivo de imagen solo se cargan en el primer redimensionado, no
+    al crear el adaptador, para no retrasar el arranque de la aplicación.
     """
-    def __init__(self, master, image_path):
+    def __init__(self, master, image_path, cache_size=8):
         """Inicializa el adaptador de imágenes.
 
         Args:
             master: El widget padre.
             image_path: Ruta del archivo de imagen a cargar.
+            cache_size: Número máximo de tamaños renderizados que se conservan.
         """
         self.master = master
         self.image_path = image_path
         self.original_image = None
         self.tk_image = None
-        try:
-            self.original_image = Image.open(image_path)
-            self.image_loaded = True
-        except Exception:
-            self.image_loaded = False
+        self.cache_size = cache_size
+        self._cache = OrderedDict()
+        self._resize_after_id = None
+        self._load_attempted = False
+
+    @property
+    def image_loaded(self):
+        """True si la imagen se pudo abrir (la abre la primera vez que se consulta)."""
+        if not self._load_attempted:
+            self._load_attempted = True
+            try:
+                from PIL import Image
+                self.original_image = Image.open(self.image_path)
+            except Exception:
+                self.original_image = None
+        return self.original_image is not None
 
     def resize_image(self, width, height):
         """Redimensiona la imagen cargada manteniendo la relación de aspecto.
@@ -97,24 +133,33 @@ class ImageAdapter:
         new_width = int(original_width * ratio)
         new_height = int(original_height * ratio)
         if new_width <= 0 or new_height <= 0: return None
-        resized_img = self.original_image.resize((new_width, new_height), Image.Resampling.LANCZOS)
-        self.tk_image = ImageTk.PhotoImage(resized_img)
+        key = (new_width, new_height)
+        cached = self._cache.get(key)
+        if cached is None:
+            from PIL import Image, ImageTk
+            resized_img = self.original_image.resize(key, Image.Resampling.LANCZOS)
+            cached = self._cache[key] = ImageTk.PhotoImage(resized_img)
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        else:
+            self._cache.move_to_end(key)
+        self.tk_image = cached
         return self.tk_image
 
-def get_initials(nombre):
-    """Calcula las iniciales de un nombre (primera letra de las dos primeras palabras).
+    def schedule_resize(self, width, height, callback, delay_ms=60):
+        """Programa `callback(resize_image(width, height))` tras `delay_ms` sin nuevas peticiones.
 
-    Args:
-        nombre: La cadena de texto del nombre completo.
+        Cada llamada cancela la anterior pendiente, de modo que durante un
+        arrastre solo se redimensiona una vez, con el último tamaño.
+        """
+        if self._resize_after_id is not None:
+            self.master.after_cancel(self._resize_after_id)
 
-    Returns:
-        str: Las iniciales en mayúsculas (ej. "JD"), o "NN" si está vacío.
-    """
-    parts = nombre.split()
-    if not parts: return "NN"
-    initials = parts[0][0].upper()
-    if len(parts) > 1: initials += parts[1][0].upper()
-    return initials
+        def run():
+            self._resize_after_id = None
+            callback(self.resize_image(width, height))
+
+        self._resize_after_id = self.master.after(delay_ms, run)
 
 # --- 3. CLASE PRINCIPAL ---
 class AgendaApp:
@@ -123,28 +168,143 @@ class AgendaApp:
     Gestiona la ventana principal, la navegación entre las tres vistas (Lista,
     Detalle, Formulario) y la interacción con la capa de datos (db).
     """
-    def __init__(self, master):
+    def __init__(self, master, startup_profile=None):
         """Inicializa la aplicación.
 
-        Configura la ventana, el estilo, asegura la existencia de la tabla DB 
-        y muestra la vista principal.
+        Configura la ventana, el estilo, arranca el hilo de la base de datos
+        (que asegura la existencia de la tabla) y construye la vista principal
+        vacía. Los contactos se piden cuando la ventana ya se ha pintado, de modo
+        que el usuario ve la interfaz sin esperar a la base de datos.
 
         Args:
             master: La instancia de la ventana raíz de Tkinter (tk.Tk).
+            startup_profile: `utils.perfil_arranque.PerfilArranque` opcional en el
+                que se marcan las fases "primer dibujo" y "datos cargados".
         """
         self.master = master
+        self.startup_profile = startup_profile
         self.master.title("AGENDA NORMA INGENS ROBUR - Escritorio")
         self.master.geometry("1100x750")
+        self._search = None
+        self._loading_label = None
+        # Modo de selección múltiple de la lista (IDs de los contactos marcados)
+        self._select_mode = False
+        self._selected_ids = set()
+        # Vistas construidas una sola vez: nombre -> Frame; solo una está empaquetada.
+        self._views = {}
+        self._current_view = None
+        # Marca del resultado que muestra la lista principal (ver `_render_list`).
+        self._list_token = None
         
-        db.crear_tabla() 
+        # Todo el acceso a la base de datos ocurre en un hilo de trabajo; la
+        # interfaz recoge los resultados sin bloquear el bucle de eventos.
+        self.db_executor = EjecutorDB()
+        self._db_pending = []
+        self._db_poll_id = None
+        self._run_db(db.crear_tabla, on_error=self._show_db_error)
+        # Caché write-through: las navegaciones no vuelven a leer la tabla si nada cambió.
+        # Solo se usa desde el hilo de la base de datos.
+        self.contacts_cache = CacheContactos()
         self._configure_styles()
+        self.master.configure(bg=Config.COLOR_CREMA_FONDO)
         
         # Logo para el modal
         logo_path = resource_path(os.path.join("ui", "logo_empresa.png"))
 
         self.team_logo_adapter = ImageAdapter(master, logo_path)
+        # Imágenes transparentes (una por tamaño de avatar) compartidas por todas las tarjetas;
+        # las iniciales se dibujan como texto de la etiqueta
+        self.avatars = CacheAvatares(master)
+        self.master.protocol("WM_DELETE_WINDOW", self._on_close)
         
+        # Primero la estructura de la vista principal; los datos, tras el primer
+        # dibujo (el temporizador se dispara después de los redibujados pendientes).
+        self._view("main", self._build_main_view)
+        self._show_view("main")
+        self.master.after_idle(lambda: self.master.after(0, self._on_first_paint))
+
+    def _on_first_paint(self):
+        """Carga la lista de contactos una vez que la ventana ya es visible."""
+        self._mark_startup("primer dibujo")
         self.show_main_view()
+
+    def _mark_startup(self, phase):
+        """Marca una fase del arranque si se está midiendo (`main.py --perfil-arranque`)."""
+        if self.startup_profile is not None:
+            self.startup_profile.marcar(phase)
+
+    def _on_close(self):
+        """Detiene el hilo de la base de datos, cierra las conexiones y destruye la ventana."""
+        if self._db_poll_id is not None:
+            self.master.after_cancel(self._db_poll_id)
+            self._db_poll_id = None
+        self.db_executor.cerrar()
+        db.cerrar_conexiones()
+        self.master.destroy()
+
+    # --- ACCESO ASÍNCRONO A LA BASE DE DATOS ---
+    def _run_db(self, fn, *args, on_success=None, on_error=None):
+        """Ejecuta `fn(*args)` en el hilo de la base de datos.
+
+        Los callbacks se invocan en el hilo de Tk cuando la operación termina:
+        `on_success(resultado)` o `on_error(excepción)`. Las operaciones
+        canceladas no invocan ninguno.
+
+        Returns:
+            Future: El futuro de la operación (admite `cancel()`).
+        """
+        future = self.db_executor.enviar(fn, *args)
+        self._db_pending.append((future, on_success, on_error))
+        self._update_loading()
+        if self._db_poll_id is None:
+            self._db_poll_id = self.master.after(Config.DB_POLL_MS, self._poll_db)
+        return future
+
+    def _poll_db(self):
+        """Entrega en el hilo de Tk los resultados de las operaciones terminadas."""
+        self._db_poll_id = None
+        pending, done = [], []
+        for item in self._db_pending:
+            (done if item[0].done() else pending).append(item)
+        self._db_pending = pending
+        if pending:
+            self._db_poll_id = self.master.after(Config.DB_POLL_MS, self._poll_db)
+        self._update_loading()
+
+        for future, on_success, on_error in done:
+            if future.cancelled():
+                continue
+            error = future.exception()
+            if error is None:
+                if on_success:
+                    on_success(future.result())
+            elif on_error:
+                on_error(error)
+            else:
+                self._show_db_error(error)
+
+    def _update_loading(self):
+        """Muestra u oculta el indicador de carga según haya operaciones pendientes."""
+        if self._loading_label is None or not self._loading_label.winfo_exists():
+            return
+        busy = any(not future.cancelled() for future, _, _ in self._db_pending)
+        self._loading_label.configure(text="Cargando..." if busy else "")
+
+    def _show_db_error(self, error):
+        """Informa al usuario de un error de la base de datos."""
+        messagebox.showerror("Error de base de datos", str(error))
+
+    def _search_contacts(self, query, deliver):
+        """Lanza una búsqueda en el hilo de la base de datos (usado por `BusquedaIncremental`).
+
+        Junto a los contactos entrega la marca `(query, revisión de la caché)`,
+        que identifica el resultado sin tener que compararlo fila a fila.
+        """
+        def search():
+            contacts = self.contacts_cache.obtener_contactos(query)
+            return contacts, (query, self.contacts_cache.revision)
+
+        return self._run_db(search, on_success=lambda result: deliver(*result))
         
     def _configure_styles(self):
         """Configuración avanzada de estilos de ttkbootstrap."""
@@ -173,10 +333,29 @@ class AgendaApp:
         # Botones de Acción en Lista
         self.style.configure('Action.TButton', font=('Helvetica', 12))
 
-    def _clear_view(self):
-        """Elimina todos los widgets hijos de la ventana principal para cambiar de vista."""
-        for widget in self.master.winfo_children():
-            widget.destroy()
+    # --- GESTOR DE VISTAS ---
+    def _view(self, name, build):
+        """Devuelve el marco de la vista `name`, construyéndolo la primera vez.
+
+        Args:
+            name: Nombre de la vista ("main", "detail" o "form").
+            build: Función que recibe el marco vacío y crea sus widgets.
+        """
+        frame = self._views.get(name)
+        if frame is None:
+            frame = self._views[name] = tk.Frame(self.master, bg=Config.COLOR_CREMA_FONDO)
+            build(frame)
+        return frame
+
+    def _show_view(self, name):
+        """Muestra la vista `name` (ya construida) y oculta la actual sin destruirla."""
+        view = self._views[name]
+        if self._current_view is view:
+            return
+        if self._current_view is not None:
+            self._current_view.pack_forget()
+        view.pack(fill='both', expand=True)
+        self._current_view = view
 
     # =========================================================================
     # --- MODAL DE EQUIPO ---
@@ -209,16 +388,22 @@ class AgendaApp:
         logo_label = tk.Label(logo_container, bg=Config.TEAM_BG_CREAM)
         logo_label.place(relx=0.5, rely=0.3, anchor='center')
 
+        def show_logo(resized_img):
+            """Muestra el logo redimensionado (o el nombre si no se pudo cargar)."""
+            if not logo_label.winfo_exists():
+                return
+            if resized_img:
+                logo_label.config(image=resized_img)
+            else:
+                logo_label.config(text="NORMA INGENS ROBUR", fg="black")
+
         def update_logo_size(event):
             """Función callback para redimensionar el logo dinámicamente con la ventana."""
             new_width = event.width - 40
             new_height = event.height - 40
             if new_width > 0 and new_height > 0:
-                resized_img = self.team_logo_adapter.resize_image(new_width, new_height)
-                if resized_img:
-                    logo_label.config(image=resized_img)
-                else:
-                    logo_label.config(text="NORMA INGENS ROBUR", fg="black")
+                self.team_logo_adapter.schedule_resize(new_width, new_height, show_logo,
+                                                       delay_ms=Config.RESIZE_DEBOUNCE_MS)
 
         logo_container.bind("<Configure>", update_logo_size)
 
@@ -265,118 +450,198 @@ class AgendaApp:
     # --- VISTA PRINCIPAL ---
     # =========================================================================
     def show_main_view(self):
-        """Muestra la vista principal: encabezado, barra de búsqueda y lista de contactos."""
-        self._clear_view()
-        self.master.configure(bg=Config.COLOR_CREMA_FONDO)
-        
+        """Muestra la vista principal: encabezado, barra de búsqueda y lista de contactos.
+
+        La vista se construye la primera vez; después solo se vuelve a mostrar y
+        se repite la búsqueda actual. La caché de contactos responde sin consultar
+        la base si nada cambió, y detecta con `PRAGMA data_version` las escrituras
+        de otros procesos (cli, servicio u otra instancia de la aplicación).
+        """
+        self._view("main", self._build_main_view)
+        self._show_view("main")
+        self._search.invalidar()
+        self._search.ejecutar_ahora(self._search_var.get())
+
+    def _build_main_view(self, view):
+        """Crea los widgets de la vista principal dentro de `view`."""
         # 1. ENCABEZADO
-        header_frame = ttk.Frame(self.master, style='Header.TFrame', height=80, padding=15)
+        header_frame = ttk.Frame(view, style='Header.TFrame', height=80, padding=15)
         header_frame.pack(fill='x')
         
         tk.Label(header_frame, text=Config.ICON_CROWN, bg=Config.COLOR_NAVY_PROFUNDO, fg=Config.COLOR_DORADO, font=("Arial", 24)).pack(side='left', padx=10)
         ttk.Label(header_frame, text="AGENDA NORMA INGENS ROBUR", style='Header.TLabel').pack(side='left', padx=5)
 
         # 2. BARRA DE BÚSQUEDA
-        search_container = ttk.Frame(self.master, style='Main.TFrame', padding=(175, 30, 20, 10))
+        search_container = ttk.Frame(view, style='Main.TFrame', padding=(175, 30, 20, 10))
         search_container.pack(fill='x')
         
-        search_var = tk.StringVar()
+        self._search_var = search_var = tk.StringVar()
         search_entry = ttk.Entry(search_container, textvariable=search_var, font=('Helvetica', 12), width=50, bootstyle="primary")
         search_entry.pack(side='left', padx=(0, 10), ipady=6)
         
         def on_search(*args):
-            """Ejecuta la búsqueda de contactos y actualiza la lista al teclear."""
-            self._populate_list(scrolled_frame, search_var.get())
+            """Programa la búsqueda de contactos al teclear (con retardo)."""
+            self._search.programar(search_var.get())
+
+        def on_search_now(*args):
+            """Ejecuta la búsqueda inmediatamente (botón o Enter)."""
+            self._search.ejecutar_ahora(search_var.get())
         
         search_entry.bind("<KeyRelease>", on_search)
-        ttk.Button(search_container, text=Config.ICON_BUSCAR, command=on_search, bootstyle="primary").pack(side='left', ipady=2)
+        search_entry.bind("<Return>", on_search_now)
+        ttk.Button(search_container, text=Config.ICON_BUSCAR, command=on_search_now, bootstyle="primary").pack(side='left', ipady=2)
+
+        # Selección múltiple para eliminar varios contactos de una vez
+        self._select_button = ttk.Button(search_container, text=f"{Config.ICON_SELECCIONAR} Seleccionar",
+                                         bootstyle="outline-primary", command=self._toggle_select_mode)
+        self._select_button.pack(side='left', padx=(10, 0), ipady=2)
+        self._bulk_delete_button = ttk.Button(search_container, bootstyle="danger",
+                                              command=self.handle_delete_selected)
+
+        # Indicador de carga mientras hay operaciones de base de datos en curso
+        self._loading_label = ttk.Label(search_container, text="", background=Config.COLOR_CREMA_FONDO,
+                                        foreground=Config.COLOR_NAVY_PROFUNDO, font=('Helvetica', 10, 'italic'))
+        self._loading_label.pack(side='left', padx=15)
 
         # 3. LISTA DE CONTACTOS
-        list_area = ttk.Frame(self.master, style='Main.TFrame', padding=(40, 10, 40, 0))
+        list_area = ttk.Frame(view, style='Main.TFrame', padding=(40, 10, 40, 0))
         list_area.pack(fill='both', expand=True)
 
-        scrolled_frame = ScrolledFrame(list_area, autohide=True, bootstyle="round")
-        scrolled_frame.pack(fill='both', expand=True, pady=(0, 80)) 
-        
-        scrolled_frame.container.configure(style='Main.TFrame')
-        
-        self._populate_list(scrolled_frame)
+        # Lista virtualizada: solo existen las tarjetas visibles, que se reutilizan al desplazarse.
+        self.contact_list = ListaVirtual(list_area, self._create_contact_card, self._update_contact_card,
+                                         texto_vacio="No se encontraron contactos.",
+                                         bg=Config.COLOR_CREMA_FONDO)
+        self.contact_list.pack(fill='both', expand=True, pady=(0, 80))
+
+        self._search = BusquedaIncremental(
+            self.master, self._search_contacts, self._render_list,
+            retardo_ms=Config.SEARCH_DEBOUNCE_MS)
 
         # 4. BOTONES FLOTANTES
-        tk.Button(self.master, text="+", bg=Config.COLOR_DORADO, fg=Config.COLOR_NAVY_PROFUNDO, 
+        tk.Button(view, text="+", bg=Config.COLOR_DORADO, fg=Config.COLOR_NAVY_PROFUNDO, 
                   font=('Arial', 24, 'bold'), width=3, height=1, bd=0, relief='raised', cursor="hand2",
                   activebackground="#b08d55",
                   command=lambda: self.show_contact_form(is_new=True)).place(relx=0.96, rely=0.96, anchor='se')
 
-        tk.Button(self.master, text=Config.ICON_INFO, bg=Config.COLOR_NAVY_PROFUNDO, fg=Config.COLOR_DORADO,
+        tk.Button(view, text=Config.ICON_INFO, bg=Config.COLOR_NAVY_PROFUNDO, fg=Config.COLOR_DORADO,
                   font=('Arial', 24, 'bold'), width=3, height=1, bd=0, relief='raised', cursor="hand2",
                   activebackground="#2B3D5F",
                   command=self._show_team_modal).place(relx=0.04, rely=0.96, anchor='sw')
 
-    def _populate_list(self, scroll_widget, query=None):
-        """Pobla el ScrolledFrame con las tarjetas de contacto, con soporte para búsqueda.
+    def _render_list(self, contacts, token=None):
+        """Muestra `contacts` en la lista virtualizada de la vista principal.
 
         Args:
-            scroll_widget: El widget ScrolledFrame (o su contenedor).
-            query: El texto de búsqueda para filtrar la lista (opcional).
+            contacts: Lista de contactos a mostrar.
+            token: Marca del resultado (ver `_search_contacts`) o None.
         """
-        for widget in scroll_widget.container.winfo_children():
-            widget.destroy()
+        # Si la marca coincide con la del resultado mostrado, nada cambió y se
+        # conserva la posición de desplazamiento.
+        if token is None or token != self._list_token:
+            self.contact_list.set_items(contacts)
+            self._list_token = token
+        self._mark_startup("datos cargados")
 
-        contacts = db.obtener_contactos(query) if query else db.obtener_contactos()
-
-        if not contacts:
-            tk.Label(scroll_widget.container, text="No se encontraron contactos.", 
-                      bg=Config.COLOR_CREMA_FONDO, fg="gray", font=('Helvetica', 14)).pack(pady=50)
-            return
+    def _create_contact_card(self, parent):
+        """Crea una tarjeta de contacto vacía para el grupo de la lista virtualizada.
 
-        for contact in contacts:
-            self._create_contact_card(scroll_widget.container, contact)
-
-    def _create_contact_card(self, parent, data):
-        """Crea y configura una tarjeta individual de contacto.
+        La tarjeta se reutiliza para distintos contactos al desplazarse: los textos
+        se rellenan con `_update_contact_card` y las acciones usan siempre el
+        contacto asignado en ese momento (`card.data`).
 
         Args:
             parent: El widget contenedor donde se insertará la tarjeta.
-            data: Tupla con los datos del contacto (id, nombre, telefono, email).
+
+        Returns:
+            tk.Frame: La tarjeta creada.
         """
-        c_id, c_name, c_tel, c_email = data
-        
         # Tarjeta (Frame)
         card = tk.Frame(parent, bg=Config.COLOR_BLANCO, padx=20, pady=15)
         card.config(highlightbackground=Config.COLOR_DORADO, highlightthickness=1)
-        card.pack(fill='x', pady=8, padx=5)
+        card.data = None
 
-        card.bind("<Button-1>", lambda e: self.show_contact_detail(data))
+        def open_detail(event):
+            """Abre el detalle del contacto (o lo marca/desmarca en modo selección)."""
+            if card.data is None:
+                return
+            if self._select_mode:
+                self._toggle_selected(card.data.id)
+            else:
+                self.show_contact_detail(card.data)
 
-        # Avatar (Iniciales)
-        lbl_avatar = tk.Label(card, text=get_initials(c_name), bg=Config.COLOR_DORADO, fg=Config.COLOR_NAVY_PROFUNDO,
-                              font=('Helvetica', 14, 'bold'), width=5, height=2)
-        lbl_avatar.pack(side='left', padx=(0, 20))
-        lbl_avatar.bind("<Button-1>", lambda e: self.show_contact_detail(data))
+        # Avatar (Iniciales): etiqueta de tamaño fijo configurada por la caché de avatares.
+        # Ya vacía tiene el tamaño final: `ListaVirtual` mide el alto de fila con esta tarjeta.
+        card.lbl_avatar = tk.Label(card, bg=Config.COLOR_BLANCO, bd=0)
+        self.avatars.preparar(card.lbl_avatar, Config.AVATAR_SIZE)
+        card.lbl_avatar.pack(side='left', padx=(0, 20))
 
         # Info
         info_frame = tk.Frame(card, bg=Config.COLOR_BLANCO)
         info_frame.pack(side='left', fill='both', expand=True)
         
-        lbl_name = tk.Label(info_frame, text=c_name, font=('Helvetica', 14, 'bold'), 
-                             bg=Config.COLOR_BLANCO, fg=Config.COLOR_NAVY_PROFUNDO)
-        lbl_name.pack(anchor='w')
+        card.lbl_name = tk.Label(info_frame, font=('Helvetica', 14, 'bold'),
+                                 bg=Config.COLOR_BLANCO, fg=Config.COLOR_NAVY_PROFUNDO)
+        card.lbl_name.pack(anchor='w')
         
-        lbl_sub = tk.Label(info_frame, text=c_email, font=('Helvetica', 10), 
-                            bg=Config.COLOR_BLANCO, fg="gray")
-        lbl_sub.pack(anchor='w')
+        card.lbl_sub = tk.Label(info_frame, font=('Helvetica', 10),
+                                bg=Config.COLOR_BLANCO, fg="gray")
+        card.lbl_sub.pack(anchor='w')
 
-        # Bindings para sub-widgets
-        for w in [info_frame, lbl_name, lbl_sub]:
-            w.bind("<Button-1>", lambda e: self.show_contact_detail(data))
+        # Bindings para la tarjeta y sus sub-widgets
+        for w in [card, card.lbl_avatar, info_frame, card.lbl_name, card.lbl_sub]:
+            w.bind("<Button-1>", open_detail)
 
         # Botones Acción (Eliminar y Editar)
         ttk.Button(card, text=Config.ICON_ELIMINAR, bootstyle="outline-danger", style='Action.TButton', width=4,
-                    command=lambda: self.handle_delete_contact(c_id, c_name)).pack(side='right', padx=5)
+                    command=lambda: self.handle_delete_contact(card.data.id, card.data.nombre)).pack(side='right', padx=5)
         
         ttk.Button(card, text=Config.ICON_EDITAR, bootstyle="outline-primary", style='Action.TButton', width=4,
-                    command=lambda: self.show_contact_form(False, data)).pack(side='right', padx=5)
+                    command=lambda: self.show_contact_form(False, card.data)).pack(side='right', padx=5)
+        return card
+
+    def _update_contact_card(self, card, data):
+        """Rellena una tarjeta reutilizable con los datos de un contacto.
+
+        Args:
+            card: Tarjeta creada por `_create_contact_card`.
+            data: El `Contacto` a mostrar.
+        """
+        card.data = data
+        self.avatars.mostrar(card.lbl_avatar, get_initials(data.nombre), Config.COLOR_DORADO,
+                             Config.COLOR_NAVY_PROFUNDO, Config.AVATAR_SIZE)
+        card.lbl_name.config(text=data.nombre)
+        card.lbl_sub.config(text=data.email or "")
+        selected = self._select_mode and data.id in self._selected_ids
+        card.config(highlightbackground=Config.COLOR_NAVY_PROFUNDO if selected else Config.COLOR_DORADO,
+                    highlightthickness=3 if selected else 1)
+
+    # --- SELECCIÓN MÚLTIPLE ---
+    def _toggle_select_mode(self):
+        """Activa o desactiva el modo de selección múltiple de la lista."""
+        self._select_mode = not self._select_mode
+        self._selected_ids.clear()
+        self._select_button.configure(
+            text="Cancelar" if self._select_mode else f"{Config.ICON_SELECCIONAR} Seleccionar")
+        if self._select_mode:
+            self._bulk_delete_button.pack(side='left', padx=(10, 0), ipady=2, after=self._select_button)
+        else:
+            self._bulk_delete_button.pack_forget()
+        self._update_selection()
+
+    def _toggle_selected(self, c_id):
+        """Marca o desmarca un contacto en modo selección."""
+        if c_id in self._selected_ids:
+            self._selected_ids.discard(c_id)
+        else:
+            self._selected_ids.add(c_id)
+        self._update_selection()
+
+    def _update_selection(self):
+        """Actualiza el contador del botón de borrado y el resaltado de las tarjetas."""
+        count = len(self._selected_ids)
+        self._bulk_delete_button.configure(text=f"{Config.ICON_ELIMINAR} Eliminar ({count})",
+                                           state='normal' if count else 'disabled')
+        self.contact_list.refrescar()
 
     # =========================================================================
     # --- VISTA DETALLE Y FORMULARIO ---
@@ -385,87 +650,115 @@ class AgendaApp:
         """Muestra la vista de detalle de un contacto.
 
         Args:
-            data: Tupla con los datos del contacto (id, nombre, telefono, email).
+            data: El `Contacto` a mostrar.
         """
-        c_id, c_name, c_tel, c_email = data
-        self._clear_view()
-        self.master.configure(bg=Config.COLOR_CREMA_FONDO)
+        self._view("detail", self._build_detail_view)
+        self._detail_data = data
+
+        self.avatars.mostrar(self._detail_avatar, get_initials(data.nombre), Config.COLOR_NAVY_PROFUNDO,
+                             Config.COLOR_DORADO, Config.AVATAR_DETAIL_SIZE)
+        self._detail_name.config(text=data.nombre)
+        self._detail_values["telefono"].config(text=data.telefono)
+        self._detail_values["email"].config(text=data.email or "")
+        self._detail_values["id"].config(text=str(data.id))
+        self._show_view("detail")
+
+    def _build_detail_view(self, view):
+        """Crea los widgets de la vista de detalle; `show_contact_detail` rellena sus datos."""
+        self._detail_data = None
 
         # Encabezado
-        header = ttk.Frame(self.master, style='Header.TFrame', height=70, padding=10)
+        header = ttk.Frame(view, style='Header.TFrame', height=70, padding=10)
         header.pack(fill='x')
         tk.Button(header, text=f"{Config.ICON_ATRAS} Volver", command=self.show_main_view,
                   bg=Config.COLOR_NAVY_PROFUNDO, fg=Config.COLOR_BLANCO, bd=0, font=('Helvetica', 12, 'bold'), cursor="hand2").pack(side='left', padx=15)
         ttk.Label(header, text="DETALLE DE CONTACTO", style='Header.TLabel').pack(side='left', padx=30)
 
         # Panel de Perfil
-        profile_panel = tk.Frame(self.master, bg=Config.COLOR_BLANCO, padx=40, pady=30, relief='raised', bd=1)
+        profile_panel = tk.Frame(view, bg=Config.COLOR_BLANCO, padx=40, pady=30, relief='raised', bd=1)
         profile_panel.pack(pady=30, padx=50, fill='x')
 
         # Avatar grande y Nombre
-        tk.Label(profile_panel, text=get_initials(c_name), bg=Config.COLOR_NAVY_PROFUNDO, fg=Config.COLOR_DORADO,
-                  font=('Helvetica', 35, 'bold'), width=4, height=2).pack(pady=10)
+        self._detail_avatar = tk.Label(profile_panel, bg=Config.COLOR_BLANCO, bd=0)
+        self.avatars.preparar(self._detail_avatar, Config.AVATAR_DETAIL_SIZE)
+        self._detail_avatar.pack(pady=10)
         
-        tk.Label(profile_panel, text=c_name, font=('Helvetica', 22, 'bold'), 
-                  bg=Config.COLOR_BLANCO, fg=Config.COLOR_NAVY_PROFUNDO).pack(pady=5)
+        self._detail_name = tk.Label(profile_panel, font=('Helvetica', 22, 'bold'),
+                                     bg=Config.COLOR_BLANCO, fg=Config.COLOR_NAVY_PROFUNDO)
+        self._detail_name.pack(pady=5)
 
         # Barra de Acciones (Editar/Eliminar)
         action_bar = tk.Frame(profile_panel, bg=Config.COLOR_BLANCO)
         action_bar.pack(pady=15)
         
         ttk.Button(action_bar, text=f"{Config.ICON_EDITAR} Editar", style='Gold.TButton', width=15,
-                    command=lambda: self.show_contact_form(False, data)).pack(side='left', padx=10)
+                    command=lambda: self.show_contact_form(False, self._detail_data)).pack(side='left', padx=10)
         
         ttk.Button(action_bar, text=f"{Config.ICON_ELIMINAR} Eliminar", bootstyle="danger", width=15,
-                    command=lambda: self.handle_delete_contact(c_id, c_name)).pack(side='left', padx=10)
+                    command=lambda: self.handle_delete_contact(self._detail_data.id, self._detail_data.nombre)).pack(side='left', padx=10)
 
         # Sección de Detalles
-        details_frame = ttk.Frame(self.master, style='Main.TFrame', padding=(60, 10))
+        details_frame = ttk.Frame(view, style='Main.TFrame', padding=(60, 10))
         details_frame.pack(fill='both', expand=True)
 
-        def add_row(label, value):
-            """Crea una fila de etiqueta y valor para la vista de detalle."""
+        def add_row(label):
+            """Crea una fila de etiqueta y valor para la vista de detalle y devuelve el valor."""
             row = ttk.Frame(details_frame, style='Main.TFrame')
             row.pack(fill='x', pady=8)
             ttk.Label(row, text=label, font=('Helvetica', 10, 'bold'), foreground=Config.COLOR_NAVY_PROFUNDO, background=Config.COLOR_CREMA_FONDO).pack(anchor='w')
-            ttk.Label(row, text=value, font=('Helvetica', 14), background=Config.COLOR_CREMA_FONDO).pack(anchor='w')
+            value = ttk.Label(row, font=('Helvetica', 14), background=Config.COLOR_CREMA_FONDO)
+            value.pack(anchor='w')
             ttk.Separator(row, orient='horizontal').pack(fill='x', pady=5)
+            return value
 
-        # Muestra los datos
-        add_row("Teléfono Móvil", c_tel)
-        add_row("Correo Electrónico", c_email)
-        add_row("ID Sistema", str(c_id))
+        # Filas de datos
+        self._detail_values = {
+            "telefono": add_row("Teléfono Móvil"),
+            "email": add_row("Correo Electrónico"),
+            "id": add_row("ID Sistema"),
+        }
 
     def show_contact_form(self, is_new=False, contact_data=None):
         """Muestra el formulario para crear o editar un contacto.
 
         Args:
             is_new: True para un nuevo contacto, False para edición.
-            contact_data: Datos del contacto si es edición (opcional).
+            contact_data: El `Contacto` a editar si es edición (opcional).
         """
         c_id, c_name, c_tel, c_email = (None, "", "", "")
         if contact_data:
-            c_id, c_name, c_tel, c_email = contact_data
-            
-        title = "NUEVO CONTACTO" if is_new else "EDITAR CONTACTO"
-        self._clear_view()
-        self.master.configure(bg=Config.COLOR_CREMA_FONDO)
+            c_id, c_name = contact_data.id, contact_data.nombre
+            c_tel, c_email = contact_data.telefono, contact_data.email or ""
+
+        self._view("form", self._build_form_view)
+        self._form_target = (is_new, c_id)
+        self._form_title.config(text="NUEVO CONTACTO" if is_new else "EDITAR CONTACTO")
+        self._form_vars["nombre"].set(c_name)
+        self._form_vars["telefono"].set(c_tel)
+        self._form_vars["email"].set(c_email)
+        self._save_button.configure(state='normal')
+        self._show_view("form")
+
+    def _build_form_view(self, view):
+        """Crea los widgets del formulario; `show_contact_form` rellena sus campos."""
+        self._form_target = (True, None)
 
         # Encabezado
-        header = ttk.Frame(self.master, style='Header.TFrame', height=70, padding=10)
+        header = ttk.Frame(view, style='Header.TFrame', height=70, padding=10)
         header.pack(fill='x')
         tk.Button(header, text=f"{Config.ICON_ATRAS} Volver", command=self.show_main_view,
                   bg=Config.COLOR_NAVY_PROFUNDO, fg=Config.COLOR_BLANCO, bd=0, font=('Helvetica', 12, 'bold')).pack(side='left', padx=15)
-        ttk.Label(header, text=title, style='Header.TLabel').pack(side='left', padx=30)
+        self._form_title = ttk.Label(header, style='Header.TLabel')
+        self._form_title.pack(side='left', padx=30)
 
-        form_frame = ttk.Frame(self.master, style='Main.TFrame', padding=50)
+        form_frame = ttk.Frame(view, style='Main.TFrame', padding=50)
         form_frame.pack(fill='both', expand=True)
 
         # Variables de control para los campos
-        vars = {
-            "nombre": tk.StringVar(value=c_name),
-            "telefono": tk.StringVar(value=c_tel),
-            "email": tk.StringVar(value=c_email)
+        self._form_vars = {
+            "nombre": tk.StringVar(),
+            "telefono": tk.StringVar(),
+            "email": tk.StringVar()
         }
 
         def create_input(lbl, var):
@@ -476,44 +769,69 @@ class AgendaApp:
             ttk.Entry(c, textvariable=var, font=('Helvetica', 12), bootstyle="primary").pack(fill='x', pady=(5,0), ipady=3)
 
         # Creación de campos del formulario
-        create_input("Nombre Completo *", vars["nombre"])
-        create_input("Teléfono *", vars["telefono"])
-        create_input("Correo Electrónico", vars["email"])
-
-        def save():
-            """Función de callback para guardar/actualizar el contacto, incluyendo validación."""
-            n = vars["nombre"].get().strip()
-            t = vars["telefono"].get().strip()
-            e = vars["email"].get().strip()
-            
-            # 1. Validación de campos obligatorios
-            if not n or not t:
-                self._show_modal("Error", "Nombre y Teléfono son obligatorios.")
-                return
-            
-            # 2. Validación de formato de teléfono usando la utilidad
-            if not validar_telefono(t):
-                self._show_modal("Error", "Teléfono inválido.")
-                return
+        create_input("Nombre Completo *", self._form_vars["nombre"])
+        create_input("Teléfono *", self._form_vars["telefono"])
+        create_input("Correo Electrónico", self._form_vars["email"])
+
+        self._save_button = ttk.Button(form_frame, text=f"{Config.ICON_GUARDAR} GUARDAR", style='Gold.TButton', width=20, command=self._save_form)
+        self._save_button.pack(pady=40)
+
+    def _save_form(self):
+        """Callback del botón GUARDAR: valida y crea/actualiza el contacto del formulario."""
+        is_new, c_id = self._form_target
+        n = self._form_vars["nombre"].get().strip()
+        t = self._form_vars["telefono"].get().strip()
+        e = self._form_vars["email"].get().strip()
+        
+        # 1. Validación de campos obligatorios
+        if not n or not t:
+            self._show_modal("Error", "Nombre y Teléfono son obligatorios.")
+            return
+        
+        # 2. Validación de formato de teléfono usando la utilidad
+        if not validar_telefono(t):
+            self._show_modal("Error", "Teléfono inválido.")
+            return
 
-            # 3. Ejecución de la operación CRUD
-            if is_new:
-                db.insertar_contacto(n, t, e)
-                self._show_modal("Éxito", "Contacto guardado.")
-            else:
-                db.actualizar_contacto(c_id, n, t, e)
-                self._show_modal("Éxito", "Contacto actualizado.")
-            
-            # 4. Regreso a la vista principal
+        # 3. Ejecución de la operación CRUD (en el hilo de la base de datos)
+        def on_saved(_result):
+            """Confirma la operación y regresa a la vista principal."""
+            self._show_modal("Éxito", "Contacto guardado." if is_new else "Contacto actualizado.")
             self.show_main_view()
 
-        ttk.Button(form_frame, text=f"{Config.ICON_GUARDAR} GUARDAR", style='Gold.TButton', width=20, command=save).pack(pady=40)
+        def on_failed(error):
+            """Informa del error y reactiva el botón para reintentar."""
+            self._save_button.configure(state='normal')
+            self._show_db_error(error)
+
+        self._save_button.configure(state='disabled')
+        if is_new:
+            self._run_db(self.contacts_cache.insertar_contacto, n, t, e,
+                         on_success=on_saved, on_error=on_failed)
+        else:
+            self._run_db(self.contacts_cache.actualizar_contacto, c_id, n, t, e,
+                         on_success=on_saved, on_error=on_failed)
 
     # --- MODALES ---
     def _show_modal(self, title, msg):
         """Muestra una ventana de información estándar de Tkinter."""
         messagebox.showinfo(title, msg)
 
+    def handle_delete_selected(self):
+        """Elimina en una sola transacción los contactos marcados, previa confirmación."""
+        ids = list(self._selected_ids)
+        if not ids:
+            return
+        if messagebox.askyesno("Eliminar", f"¿Eliminar {len(ids)} contactos seleccionados?"):
+            def on_deleted(results):
+                """Informa del número de contactos eliminados y recarga la lista."""
+                self._toggle_select_mode()
+                self._show_modal("Éxito", f"{sum(results)} contactos eliminados.")
+                self.show_main_view()
+
+            self._run_db(self.contacts_cache.eliminar_contactos, ids,
+                         on_success=on_deleted, on_error=self._show_db_error)
+
     def handle_delete_contact(self, c_id, c_name):
         """Maneja la solicitud de eliminación pidiendo confirmación al usuario.
 
@@ -522,5 +840,9 @@ class AgendaApp:
             c_name: Nombre del contacto para el mensaje de confirmación.
         """
         if messagebox.askyesno("Eliminar", f"¿Eliminar a {c_name}?"):
-            db.eliminar_contacto(c_id)
-            self.show_main_view()
\ No newline at end of file
+            def on_deleted(_result):
+                """Recarga la lista sin el contacto eliminado."""
+                self.show_main_view()
+
+            self._run_db(self.contacts_cache.eliminar_contacto, c_id,
+                         on_success=on_deleted, on_error=self._show_db_error)
\ No newline at end of file
@@ -0,0 +1,171 @@
+"""Lista virtualizada de filas de altura fija para Tkinter.
+
+En lugar de crear un conjunto de widgets por cada elemento, la lista mantiene un
+grupo fijo de filas (las visibles más un pequeño margen, u "overscan") que se
+reutilizan al desplazarse: cada fila se recoloca con `place` y solo se vuelve a
+rellenar cuando pasa a mostrar otro elemento. El coste de construir y desplazar
+la lista depende del alto de la ventana, no del número de elementos.
+"""
+import math
+import tkinter as tk
+import ttkbootstrap as ttk
+
+
+class ListaVirtual(tk.Frame):
+    """Contenedor desplazable que solo materializa las filas visibles.
+
+    Args:
+        master: Widget padre.
+        crear_fila: Función que recibe el widget padre y devuelve una fila nueva
+                    (vacía). Se llama solo al ampliar el grupo de filas.
+        actualizar_fila: Función que recibe una fila y un elemento y rellena la
+                         fila con los datos del elemento.
+        alto_fila: Alto en píxeles reservado para cada fila (incluye `separacion`).
+                   Si es None se mide a partir de la primera fila creada.
+        separacion: Espacio vertical en píxeles entre filas consecutivas.
+        overscan: Filas adicionales que se mantienen preparadas por encima y por
+                  debajo de la zona visible.
+        texto_vacio: Mensaje mostrado cuando no hay elementos.
+        bg: Color de fondo.
+    """
+    def __init__(self, master, crear_fila, actualizar_fila, alto_fila=None, separacion=16,
+                 overscan=2, texto_vacio="", bg=None, **kwargs):
+        super().__init__(master, bg=bg, **kwargs)
+        self.crear_fila = crear_fila
+        self.actualizar_fila = actualizar_fila
+        self.alto_fila = alto_fila
+        self.separacion = separacion
+        self.overscan = overscan
+
+        self._items = []
+        self._offset = 0
+        self._filas = []
+        # Índice del elemento que muestra cada fila del grupo (None si ninguno).
+        self._indices = []
+
+        self.scrollbar = ttk.Scrollbar(self, orient='vertical', command=self.yview, bootstyle="round")
+        self.scrollbar.pack(side='right', fill='y')
+        self.viewport = tk.Frame(self, bg=bg)
+        self.viewport.pack(side='left', fill='both', expand=True)
+
+        self._lbl_vacio = tk.Label(self.viewport, text=texto_vacio, bg=bg, fg="gray",
+                                   font=('Helvetica', 14))
+
+        self.viewport.bind("<Configure>", lambda e: self._redibujar())
+        self._vincular_rueda(self.viewport)
+
+    # --- API pública ---
+    def set_items(self, items):
+        """Reemplaza los elementos de la lista y vuelve al principio."""
+        self._items = list(items)
+        self._offset = 0
+        self._indices = [None] * len(self._filas)
+        self._redibujar()
+
+    def get_items(self):
+        """Devuelve la lista de elementos mostrada."""
+        return self._items
+
+    def refrescar(self):
+        """Vuelve a rellenar las filas visibles (p. ej. si cambió su estado de selección)."""
+        self._indices = [None] * len(self._filas)
+        self._redibujar()
+
+    def yview(self, *args):
+        """Protocolo de desplazamiento de Tk ('moveto' y 'scroll'), usado por la barra."""
+        if not args:
+            return
+        if args[0] == 'moveto':
+            self._desplazar_a(float(args[1]) * self._alto_total())
+        elif args[0] == 'scroll':
+            pasos = int(args[1])
+            paso = self._alto_fila() if args[2] == 'units' else self._alto_visible()
+            self._desplazar_a(self._offset + pasos * paso)
+
+    # --- Internos ---
+    def _alto_fila(self):
+        """Alto de fila, medido con la primera fila si no se indicó."""
+        if self.alto_fila is None:
+            fila = self._filas[0] if self._filas else self._nueva_fila()
+            fila.update_idletasks()
+            self.alto_fila = fila.winfo_reqheight() + self.separacion
+        return self.alto_fila
+
+    def _alto_total(self):
+        return len(self._items) * self._alto_fila()
+
+    def _alto_visible(self):
+        return max(self.viewport.winfo_height(), 1)
+
+    def _desplazar_a(self, offset):
+        maximo = max(0, self._alto_total() - self._alto_visible())
+        self._offset = int(min(max(0, offset), maximo))
+        self._redibujar()
+
+    def _nueva_fila(self):
+        """Crea una fila para el grupo y le asocia la rueda del ratón."""
+        fila = self.crear_fila(self.viewport)
+        self._vincular_rueda(fila)
+        self._filas.append(fila)
+        self._indices.append(None)
+        return fila
+
+    def _redibujar(self):
+        """Coloca y rellena las filas del grupo según el desplazamiento actual."""
+        alto_visible = self._alto_visible()
+        total = self._alto_total()
+        if total <= alto_visible:
+            self._offset = 0
+            self.scrollbar.set(0, 1)
+        else:
+            self._offset = min(self._offset, total - alto_visible)
+            self.scrollbar.set(self._offset / total, (self._offset + alto_visible) / total)
+
+        if not self._items:
+            for fila in self._filas:
+                fila.place_forget()
+            self._indices = [None] * len(self._filas)
+            self._lbl_vacio.place(relx=0.5, y=50, anchor='n')
+            return
+        self._lbl_vacio.place_forget()
+
+        alto_fila = self._alto_fila()
+        tamano = min(len(self._items), math.ceil(alto_visible / alto_fila) + 1 + 2 * self.overscan)
+        while len(self._filas) < tamano:
+            self._nueva_fila()
+
+        primero = max(0, self._offset // alto_fila - self.overscan)
+        ultimo = min(len(self._items), primero + tamano)
+        usadas = set()
+        for indice in range(primero, ultimo):
+            # Cada elemento se asigna siempre a la misma fila mientras siga en
+            # pantalla, así un desplazamiento corto solo rellena las filas nuevas.
+            posicion = indice % tamano
+            fila = self._filas[posicion]
+            if self._indices[posicion] != indice:
+                self.actualizar_fila(fila, self._items[indice])
+                self._indices[posicion] = indice
+            fila.place(x=5, y=indice * alto_fila - self._offset + self.separacion // 2,
+                       relwidth=1, width=-10, height=alto_fila - self.separacion)
+            usadas.add(posicion)
+
+        for posicion, fila in enumerate(self._filas):
+            if posicion not in usadas:
+                fila.place_forget()
+                self._indices[posicion] = None
+
+    def _vincular_rueda(self, widget):
+        """Asocia la rueda del ratón a `widget` y a todos sus descendientes."""
+        widget.bind("<MouseWheel>", self._on_rueda, add='+')
+        widget.bind("<Button-4>", self._on_rueda, add='+')
+        widget.bind("<Button-5>", self._on_rueda, add='+')
+        for hijo in widget.winfo_children():
+            self._vincular_rueda(hijo)
+
+    def _on_rueda(self, event):
+        """Desplaza la lista una fila por paso de rueda (Windows, macOS y X11)."""
+        if event.num == 4 or getattr(event, 'delta', 0) > 0:
+            self.yview('scroll', -1, 'units')
+        else:
+            self.yview('scroll', 1, 'units')
+        return "break"
@@ -0,0 +1,71 @@
+import re
+import unicodedata
+
+# Prefijo de país que se asume para los números sin prefijo internacional.
+PREFIJO_PAIS = "57"
+
+# Longitud máxima de un número nacional (Colombia: 10 dígitos). Los números más
+# largos sin '+' se interpretan como si ya incluyeran el prefijo de país.
+LONGITUD_NACIONAL = 10
+
+_NO_DIGITOS = re.compile(r"\D")
+
+
+def normalizar_telefono(telefono, prefijo_pais=PREFIJO_PAIS):
+    """Convierte un teléfono a un formato canónico estilo E.164 ('+' y dígitos).
+
+    Args:
+        telefono (str): El teléfono tal como se escribió ('300 123-4567',
+                        '+57 300 1234567', '0057...').
+        prefijo_pais (str): Prefijo de país para los números nacionales.
+
+    Returns:
+        str or None: El teléfono normalizado (p. ej. '+573001234567'), o None si
+                     no contiene dígitos.
+    """
+    if not telefono:
+        return None
+    digitos = _NO_DIGITOS.sub("", telefono)
+    if not digitos:
+        return None
+    telefono = telefono.strip()
+    if telefono.startswith("+"):
+        return "+" + digitos
+    if telefono.startswith("00"):
+        return "+" + digitos[2:]
+    if len(digitos) > LONGITUD_NACIONAL:
+        return "+" + digitos
+    return "+" + prefijo_pais + digitos
+
+
+def normalizar_email(email):
+    """Devuelve el email sin espacios alrededor y en minúsculas, o None si está vacío."""
+    if not email:
+        return None
+    email = email.strip().lower()
+    return email or None
+
+
+def normalizar_nombre(nombre):
+    """Clave de comparación de un nombre: minúsculas, sin tildes y con espacios simples."""
+    if not nombre:
+        return ""
+    descompuesto = unicodedata.normalize("NFKD", nombre.casefold())
+    sin_tildes = "".join(c for c in descompuesto if not unicodedata.combining(c))
+    return " ".join(sin_tildes.split())
+
+
+def get_initials(nombre):
+    """Calcula las iniciales de un nombre (primera letra de las dos primeras palabras).
+
+    Args:
+        nombre: La cadena de texto del nombre completo.
+
+    Returns:
+        str: Las iniciales en mayúsculas (ej. "JD"), o "NN" si está vacío.
+    """
+    parts = nombre.split()
+    if not parts: return "NN"
+    initials = parts[0][0].upper()
+    if len(parts) > 1: initials += parts[1][0].upper()
+    return initials
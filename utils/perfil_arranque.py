@@ -0,0 +1,137 @@
+"""Medición del arranque de la aplicación (`python main.py --perfil-arranque`).
+
+`PerfilArranque` registra el instante de cada fase del arranque (importaciones,
+ventana, interfaz, primer dibujo, datos cargados) y, opcionalmente, el tiempo
+de cada módulo importado, al estilo de `python -X importtime`. A diferencia de
+esa opción, funciona también en el ejecutable generado con PyInstaller, donde no
+se controlan las opciones del intérprete.
+
+Uso típico:
+    perfil = PerfilArranque()
+    perfil.medir_importaciones()
+    import ui.interfaz_grafica
+    perfil.detener_importaciones()
+    perfil.marcar("importaciones")
+    ...
+    print(perfil.informe())
+"""
+import sys
+import time
+from importlib.abc import MetaPathFinder
+
+
+# Fase que, al marcarse, da por terminado el arranque.
+FASE_FINAL = "datos cargados"
+
+
+class _CargadorMedido:
+    """Envuelve el cargador de un módulo para medir lo que tarda en ejecutarse."""
+    def __init__(self, cargador, nombre, perfil):
+        self._cargador = cargador
+        self._nombre = nombre
+        self._perfil = perfil
+
+    def create_module(self, spec):
+        return self._cargador.create_module(spec)
+
+    def exec_module(self, modulo):
+        pila = self._perfil._pila
+        pila.append(0.0)
+        inicio = time.perf_counter()
+        try:
+            self._cargador.exec_module(modulo)
+        finally:
+            total = time.perf_counter() - inicio
+            hijos = pila.pop()
+            # El tiempo de este módulo también cuenta en el del que lo importó.
+            if pila:
+                pila[-1] += total
+            self._perfil.importaciones.append((self._nombre, total, total - hijos))
+
+    def __getattr__(self, nombre):
+        # get_data, get_resource_reader, etc. se delegan en el cargador real.
+        return getattr(self._cargador, nombre)
+
+
+class _BuscadorMedido(MetaPathFinder):
+    """Primer buscador de `sys.meta_path`: delega en los demás y envuelve el cargador."""
+    def __init__(self, perfil):
+        self._perfil = perfil
+
+    def find_spec(self, nombre, ruta, destino=None):
+        for buscador in sys.meta_path:
+            if buscador is self or not hasattr(buscador, "find_spec"):
+                continue
+            spec = buscador.find_spec(nombre, ruta, destino)
+            if spec is not None:
+                break
+        else:
+            return None
+        if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+            spec.loader = _CargadorMedido(spec.loader, nombre, self._perfil)
+        return spec
+
+
+class PerfilArranque:
+    """Tiempos de las fases del arranque y de las importaciones.
+
+    Args:
+        al_terminar: Función opcional que se llama (una vez) al marcarse la
+                     fase `FASE_FINAL`.
+
+    Attributes:
+        fases: Lista de (fase, segundos desde la creación del perfil).
+        importaciones: Lista de (módulo, segundos acumulados, segundos propios).
+    """
+    def __init__(self, al_terminar=None):
+        self.inicio = time.perf_counter()
+        self.al_terminar = al_terminar
+        self.fases = []
+        self.importaciones = []
+        self._pila = []
+        self._buscador = None
+
+    def marcar(self, fase: str):
+        """Registra el instante actual para `fase` (solo la primera vez que se marca)."""
+        if any(nombre == fase for nombre, _ in self.fases):
+            return
+        self.fases.append((fase, time.perf_counter() - self.inicio))
+        if fase == FASE_FINAL and self.al_terminar is not None:
+            self.al_terminar()
+
+    def medir_importaciones(self):
+        """Empieza a medir cada módulo que se importe a partir de ahora."""
+        if self._buscador is None:
+            self._buscador = _BuscadorMedido(self)
+            sys.meta_path.insert(0, self._buscador)
+
+    def detener_importaciones(self):
+        """Deja de medir importaciones (los módulos ya medidos se conservan)."""
+        if self._buscador is not None:
+            sys.meta_path.remove(self._buscador)
+            self._buscador = None
+
+    def total_ms(self) -> float:
+        """Milisegundos hasta la última fase marcada (0 si no hay ninguna)."""
+        return self.fases[-1][1] * 1000 if self.fases else 0.0
+
+    def informe(self, max_modulos: int = 20) -> str:
+        """Texto con la duración de cada fase y los módulos más lentos de importar.
+
+        Args:
+            max_modulos: Número de módulos listados, ordenados por tiempo acumulado.
+        """
+        lineas = ["Arranque (ms desde el inicio de main.py):",
+                  f"  {'fase':<20} {'instante':>10} {'duración':>10}"]
+        anterior = 0.0
+        for fase, instante in self.fases:
+            lineas.append(f"  {fase:<20} {instante * 1000:>10.1f} {(instante - anterior) * 1000:>10.1f}")
+            anterior = instante
+
+        if self.importaciones:
+            lineas += ["", f"Importaciones ({len(self.importaciones)} módulos, los {max_modulos} más lentos):",
+                       f"  {'acumulado':>10} | {'propio':>8} | módulo"]
+            lentas = sorted(self.importaciones, key=lambda i: i[1], reverse=True)[:max_modulos]
+            for nombre, total, propio in lentas:
+                lineas.append(f"  {total * 1000:>10.1f} | {propio * 1000:>8.1f} | {nombre}")
+        return "\n".join(lineas)
@@ -1,5 +1,25 @@
 import re
 
+# Patrones compilados una sola vez al importar el módulo.
+PATRON_NOMBRE = re.compile(r"^[A-Za-záéíóúÁÉÍÓÚñÑ\s]{2,}$")
+PATRON_TELEFONO = re.compile(r"^\+?[0-9]{7,15}$")
+PATRON_EMAIL = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
+
+# Mismos alfabetos sin restricción de longitud: distinguen un error de
+# caracteres de uno de longitud.
+_CARACTERES_NOMBRE = re.compile(r"^[A-Za-záéíóúÁÉÍÓÚñÑ\s]*$")
+_CARACTERES_TELEFONO = re.compile(r"^\+?[0-9]*$")
+
+# Códigos de error por campo devueltos por `validar_lote`.
+VACIO = "vacio"
+CARACTERES = "caracteres"
+LONGITUD = "longitud"
+FORMATO = "formato"
+
+# Filas por tarea cuando `validar_lote` reparte el trabajo entre procesos.
+TAMANO_TROZO = 100_000
+
+
 def validar_nombre(nombre):
     """Valida si un nombre es válido según las reglas de la agenda.
 
@@ -7,14 +27,13 @@ def validar_nombre(nombre):
         nombre (str): La cadena de texto a validar.
 
     Returns:
-        bool: 
-            True: Si contiene solo letras (incluye tildes/ñ) y espacios, 
+        bool:
+            True: Si contiene solo letras (incluye tildes/ñ) y espacios,
                   y tiene un mínimo de 2 caracteres.
             False: Si contiene números, símbolos o si está vacío.
     """
     if not nombre: return False
-    patron = r"^[A-Za-záéíóúÁÉÍÓÚñÑ\s]{2,}$"
-    return bool(re.match(patron, nombre))
+    return PATRON_NOMBRE.match(nombre) is not None
 
 def validar_telefono(telefono):
     """Valida si un número de teléfono tiene un formato aceptable.
@@ -28,12 +47,11 @@ def validar_telefono(telefono):
         bool:
             True: Si contiene solo números, con longitud entre 7 y 15 dígitos.
                   Acepta un signo '+' opcional al inicio.
-            False: Si contiene letras, espacios intermedios, o si la longitud 
+            False: Si contiene letras, espacios intermedios, o si la longitud
                    está fuera del rango [7, 15].
     """
     if not telefono: return False
-    patron = r"^\+?[0-9]{7,15}$"
-    return bool(re.match(patron, telefono))
+    return PATRON_TELEFONO.match(telefono) is not None
 
 def validar_email(email):
     """Valida si una cadena de texto tiene el formato estándar de correo electrónico.
@@ -44,9 +62,103 @@ def validar_email(email):
     Returns:
         bool:
             True: Si coincide con el formato estándar (texto@dominio.algo).
-            False: Si le falta el '@', le falta el punto después del dominio, 
+            False: Si le falta el '@', le falta el punto después del dominio,
                    contiene espacios o es una cadena vacía.
     """
     if not email: return False
-    patron = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
-    return bool(re.match(patron, email))
\ No newline at end of file
+    return PATRON_EMAIL.match(email) is not None
+
+
+# --- VALIDACIÓN POR LOTES ---
+
+def _codigo_nombre(nombre):
+    """Código de error de un nombre que no cumple `PATRON_NOMBRE`."""
+    if not nombre:
+        return VACIO
+    return LONGITUD if _CARACTERES_NOMBRE.match(nombre) else CARACTERES
+
+def _codigo_telefono(telefono):
+    """Código de error de un teléfono que no cumple `PATRON_TELEFONO`."""
+    if not telefono:
+        return VACIO
+    return LONGITUD if _CARACTERES_TELEFONO.match(telefono) else CARACTERES
+
+def _errores_fila(nombre, telefono, email):
+    """Diccionario {campo: código} con los campos inválidos de una fila."""
+    errores = {}
+    if nombre is not None:
+        errores["nombre"] = nombre
+    if telefono is not None:
+        errores["telefono"] = telefono
+    if email is not None:
+        errores["email"] = email
+    return errores
+
+def _validar_columnas(nombres, telefonos, emails):
+    """Valida tres columnas paralelas y devuelve los errores por fila (ver `validar_lote`)."""
+    # Cada columna se recorre una vez con el método del patrón ya resuelto; el
+    # código de error solo se calcula para los valores que no coinciden.
+    coincide = PATRON_NOMBRE.match
+    nombres = [None if v and coincide(v) else _codigo_nombre(v) for v in nombres]
+    coincide = PATRON_TELEFONO.match
+    telefonos = [None if v and coincide(v) else _codigo_telefono(v) for v in telefonos]
+    coincide = PATRON_EMAIL.match
+    # El email es opcional: solo se valida si no está vacío.
+    emails = [None if not v or coincide(v) else FORMATO for v in emails]
+
+    return [None if n is None and t is None and e is None else _errores_fila(n, t, e)
+            for n, t, e in zip(nombres, telefonos, emails)]
+
+def _unir_columna(valores):
+    """Empaqueta una columna como una sola cadena separada por NUL (más barata de
+    enviar a otro proceso), o la devuelve tal cual si no se puede."""
+    try:
+        unida = "\0".join(valores)
+    except TypeError:
+        return valores
+    # Si algún valor contiene NUL, la cadena no se podría volver a separar.
+    return unida if unida.count("\0") == len(valores) - 1 else valores
+
+def _validar_trozo(columnas):
+    """Tarea de proceso: separa las columnas empaquetadas y las valida."""
+    return _validar_columnas(*(c.split("\0") if isinstance(c, str) else c for c in columnas))
+
+def validar_lote(filas, procesos=None, tamano_trozo=TAMANO_TROZO):
+    """Valida muchas filas (nombre, telefono, email) de una vez.
+
+    Las filas se transponen a columnas y cada columna se valida en una sola
+    pasada con los patrones precompilados. A diferencia de las funciones
+    individuales, el email vacío se considera válido (es opcional).
+
+    Args:
+        filas: Iterable de tuplas (nombre, telefono, email).
+        procesos: Si es mayor que 1, las filas se reparten en trozos entre ese
+                  número de procesos. Solo compensa con millones de filas y
+                  varios núcleos: enviar los datos a otro proceso cuesta del
+                  orden de la mitad de validarlos.
+        tamano_trozo: Filas por tarea al usar procesos.
+
+    Returns:
+        list: Un elemento por fila: None si es válida, o un diccionario
+              {campo: código} con los campos inválidos, donde el código es
+              VACIO, CARACTERES, LONGITUD o FORMATO.
+    """
+    filas = filas if isinstance(filas, list) else list(filas)
+    if not procesos or procesos <= 1 or len(filas) <= tamano_trozo:
+        return _validar_columnas([f[0] for f in filas], [f[1] for f in filas],
+                                 [f[2] for f in filas])
+
+    # Importación diferida: el pool de procesos arrastra `multiprocessing`, que
+    # solo se necesita para lotes muy grandes y retrasaría el arranque de la UI.
+    from concurrent.futures import ProcessPoolExecutor
+
+    def trozos():
+        for inicio in range(0, len(filas), tamano_trozo):
+            trozo = filas[inicio:inicio + tamano_trozo]
+            yield tuple(_unir_columna([f[i] for f in trozo]) for i in range(3))
+
+    resultado = []
+    with ProcessPoolExecutor(max_workers=procesos) as pool:
+        for parcial in pool.map(_validar_trozo, trozos()):
+            resultado.extend(parcial)
+    return resultado